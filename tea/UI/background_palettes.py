@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+背景生成的版本和主题配色
+Background generator palettes
+
+与 create_background.py 分开存放，不依赖 NumPy：主程序启动时只需要 GENERATOR_VERSION
+来确定缓存的背景文件名，缓存已存在时不必导入生成器（和 NumPy）。
+"""
+
+# 生成算法的版本，修改算法后递增，使程序缓存的背景重新生成
+GENERATOR_VERSION = 1
+
+# 设计尺寸：装饰边框和装饰点的位置按此尺寸设计，其他尺寸按比例缩放
+DESIGN_SIZE = (1200, 800)
+
+# 各主题的背景配色
+THEME_PALETTES = {
+    "classic": {  # 米色经典
+        'base': (245, 245, 220),
+        'gradient_end': (222, 184, 135),
+        'gradient_strength': 0.6,
+        'grain_amplitude': 8,
+        'frame_outer': (205, 133, 63),
+        'frame_inner': (218, 165, 32),
+        'ornament': (160, 82, 45),
+    },
+    "wooden": {  # 欧式豪华：深棕色木纹，古铜色边框，金色装饰点
+        'base': (139, 69, 19),
+        'gradient_end': (205, 133, 63),
+        'gradient_strength': 0.3,
+        'grain_amplitude': 20,
+        'frame_outer': (205, 133, 63),
+        'frame_inner': (222, 184, 135),
+        'ornament': (218, 165, 32),
+    },
+    "modern": {  # 现代简约
+        'base': (44, 62, 80),
+        'gradient_end': (52, 73, 94),
+        'gradient_strength': 1.0,
+        'grain_amplitude': 6,
+        'frame_outer': (52, 152, 219),
+        'frame_inner': (189, 195, 199),
+        'ornament': (236, 240, 241),
+    },
+}
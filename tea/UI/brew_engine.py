@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+冲泡引擎
+Brewing engine
+
+管理任意数量同时进行的冲泡会话。所有会话共用一个 BrewScheduler：
+每个会话在堆中只有一个待执行的截止任务（当前这次倒茶），
+因此每个会话的开销与会话总数无关。
+
+倒茶截止时间使用单调时钟（time.monotonic），以会话开始时刻为原点逐次累加：
+每次倒茶的起点是上一次的计划截止时间而不是实际触发时间，
+因此调度延迟不会在多次倒茶之间累积，系统时间跳变也不会影响计时。
+
+如果提供了 BrewJournal，会话的每次状态变化都会写入日志（墙上时间），
+下次启动时可通过 resume() 恢复中断的会话；中断太久的会话（最后一次倒茶的计划时间
+已过去超过整个冲泡时长加 RESUME_GRACE_SECONDS）不再恢复，在日志中记为取消。
+
+本模块不依赖 tkinter；回调在调度线程中执行，界面层需自行切回主线程。
+"""
+
+import bisect
+import threading
+import time
+import uuid
+from collections import namedtuple
+
+from brew_scheduler import BrewScheduler
+
+# 恢复中断会话的宽限时间（秒）：最后一次倒茶的计划时间过去超过“冲泡总时长 + 宽限时间”
+# 的会话视为已被放弃
+RESUME_GRACE_SECONDS = 10 * 60
+
+
+class CancellationToken:
+    """冲泡会话的取消令牌
+
+    会话被取消后，已经排队到界面线程的提醒/评价回调应检查 cancelled 并放弃执行。
+    """
+
+    __slots__ = ('_event',)
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+
+class LatenessHistogram:
+    """提醒延迟直方图（毫秒）
+
+    记录实际触发时刻相对计划截止时间的延迟，用于验证提醒精度。
+    """
+
+    # 各桶的上界（毫秒），最后一个桶收集所有更大的值
+    BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._counts = [0] * (len(self.BUCKETS_MS) + 1)
+            self._count = 0
+            self._total_ms = 0.0
+            self._max_ms = 0.0
+
+    def record(self, lateness_seconds):
+        """记录一次延迟（秒），提前触发按 0 计"""
+        lateness_ms = max(0.0, lateness_seconds * 1000)
+        index = bisect.bisect_left(self.BUCKETS_MS, lateness_ms)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._total_ms += lateness_ms
+            self._max_ms = max(self._max_ms, lateness_ms)
+
+    def percentile(self, p):
+        """按桶上界估算第 p 百分位延迟（毫秒）"""
+        with self._lock:
+            counts = list(self._counts)
+            count = self._count
+            max_ms = self._max_ms
+        if not count:
+            return None
+        threshold = count * p / 100
+        seen = 0
+        for index, bucket_count in enumerate(counts):
+            seen += bucket_count
+            if seen >= threshold and bucket_count:
+                return self.BUCKETS_MS[index] if index < len(self.BUCKETS_MS) else max_ms
+        return max_ms
+
+    def snapshot(self):
+        """返回可序列化的统计结果"""
+        with self._lock:
+            counts = list(self._counts)
+            count = self._count
+            total_ms = self._total_ms
+            max_ms = self._max_ms
+        labels = [f"<={bound}ms" for bound in self.BUCKETS_MS] + [f">{self.BUCKETS_MS[-1]}ms"]
+        return {
+            'count': count,
+            'mean_ms': round(total_ms / count, 3) if count else None,
+            'max_ms': round(max_ms, 3) if count else None,
+            'p50_ms': self.percentile(50),
+            'p99_ms': self.percentile(99),
+            'buckets': dict(zip(labels, counts)),
+        }
+
+
+class BrewSnapshot(namedtuple('BrewSnapshot', [
+        'session_id', 'name', 'current_pour', 'pour_count', 'next_pour_time', 'version'])):
+    """冲泡会话在某一时刻的只读视图，各字段彼此一致"""
+
+    __slots__ = ()
+
+
+class EngineSnapshot(namedtuple('EngineSnapshot', ['version', 'sessions'])):
+    """所有会话的只读视图；version 不变说明没有任何会话发生变化"""
+
+    __slots__ = ()
+
+
+class BrewSession:
+    """一次冲泡会话
+
+    调度线程写入、界面线程读取，所以进度字段只能通过 _set_pour/_finish 在锁内修改，
+    界面应通过 snapshot() 读取一致的视图。
+    start_time 为墙上时间（用于记录），其余时间均为调度器的单调时钟。
+    """
+
+    __slots__ = (
+        'session_id', 'tea_data', 'token', 'start_time', 'origin',
+        '_lock', '_current_pour', '_next_pour_time', '_timer', '_version',
+    )
+
+    def __init__(self, session_id, tea_data):
+        self.session_id = session_id
+        self.tea_data = tea_data
+        self.token = CancellationToken()
+        self.start_time = None
+        self.origin = None
+        self._lock = threading.Lock()
+        self._current_pour = 0
+        self._next_pour_time = None
+        self._timer = None
+        self._version = 0
+
+    @property
+    def name(self):
+        return self.tea_data['name']
+
+    @property
+    def pour_count(self):
+        return len(self.tea_data['pour_times'])
+
+    @property
+    def current_pour(self):
+        return self._current_pour
+
+    @property
+    def next_pour_time(self):
+        return self._next_pour_time
+
+    @property
+    def timer(self):
+        return self._timer
+
+    @property
+    def version(self):
+        return self._version
+
+    def _set_pour(self, current_pour, next_pour_time, timer):
+        with self._lock:
+            self._current_pour = current_pour
+            self._next_pour_time = next_pour_time
+            self._timer = timer
+            self._version += 1
+
+    def _finish(self):
+        with self._lock:
+            self._next_pour_time = None
+            self._timer = None
+            self._version += 1
+
+    def snapshot(self):
+        with self._lock:
+            return BrewSnapshot(
+                self.session_id, self.name, self._current_pour, self.pour_count,
+                self._next_pour_time, self._version
+            )
+
+
+class BrewingEngine:
+    """多会话冲泡引擎
+
+    回调（均在调度线程中调用）：
+    - on_pour(session, pour_number, deadline): 第 pour_number 次倒茶时间到，
+      deadline 为计划截止时间（单调时钟），可用于统计提醒送达的延迟
+    - on_finish(session): 会话全部倒茶完成
+    - on_change(): 会话列表或某个会话的进度发生变化
+    """
+
+    def __init__(self, scheduler=None, on_pour=None, on_finish=None, on_change=None, journal=None):
+        self.scheduler = scheduler or BrewScheduler()
+        self.on_pour = on_pour
+        self.on_finish = on_finish
+        self.on_change = on_change
+        self.journal = journal
+        self._lock = threading.RLock()
+        self._sessions = {}
+        # 任意会话增删或进度变化时递增，界面据此跳过无变化的重绘
+        self._version = 0
+        # 调度线程触发倒茶任务时相对计划时间的延迟
+        self.lateness = LatenessHistogram()
+
+    @property
+    def is_brewing(self):
+        with self._lock:
+            return bool(self._sessions)
+
+    def sessions(self):
+        """按开始顺序返回当前所有会话"""
+        with self._lock:
+            return list(self._sessions.values())
+
+    def get(self, session_id):
+        with self._lock:
+            return self._sessions.get(session_id)
+
+    @property
+    def version(self):
+        with self._lock:
+            return self._version
+
+    def snapshot(self):
+        """返回所有会话的一致视图"""
+        with self._lock:
+            return EngineSnapshot(self._version, tuple(session.snapshot() for session in self._sessions.values()))
+
+    def now(self):
+        """调度器的单调时钟"""
+        return self.scheduler.now()
+
+    def remaining(self, session):
+        """距离下次倒茶的剩余秒数，没有待倒的茶时返回 None
+
+        session 可以是 BrewSession 或 BrewSnapshot。
+        """
+        deadline = session.next_pour_time
+        if deadline is None:
+            return None
+        return deadline - self.now()
+
+    def start(self, tea_data, session_id=None):
+        """开始一个新的冲泡会话"""
+        if not tea_data.get('pour_times'):
+            raise ValueError("茶种没有设置倒茶时间")
+        session = BrewSession(session_id or uuid.uuid4().hex, tea_data)
+        session.start_time = time.time()
+        session.origin = self.now()
+        with self._lock:
+            self._sessions[session.session_id] = session
+            self._record('start', session, tea_data=tea_data)
+            self._schedule_pour(session, 0, session.origin)
+            self._version += 1
+        self._notify_change()
+        return session
+
+    def resume(self, entries, grace=RESUME_GRACE_SECONDS):
+        """根据日志回放结果（BrewJournal.replay）恢复中断的会话，返回恢复的会话列表
+
+        程序关闭期间已经错过的倒茶不再逐次提醒，只立即补发最近一次到期的提醒。
+        最后一次倒茶的计划时间已过去超过“冲泡总时长 + grace 秒”的会话不再恢复，
+        在日志中记为取消（不会弹出提醒和评价窗口）。
+        """
+        resumed = []
+        wall_now = time.time()
+        now = self.now()
+        with self._lock:
+            for entry in entries:
+                tea_data = entry['tea_data']
+                pour_times = tea_data.get('pour_times') or []
+                index = entry['index']
+                if entry['session_id'] in self._sessions or not 0 <= index < len(pour_times):
+                    continue
+                last_deadline = entry['deadline'] + sum(pour_times[index + 1:])
+                if wall_now - last_deadline > sum(pour_times) + grace:
+                    if self.journal is not None:
+                        self.journal.append('cancel', entry['session_id'], reason='expired')
+                    continue
+                # 墙上时间的截止时间换算为单调时钟
+                deadline = now + (entry['deadline'] - wall_now)
+                while index + 1 < len(pour_times) and deadline + pour_times[index + 1] <= now:
+                    index += 1
+                    deadline += pour_times[index]
+                
+                session = BrewSession(entry['session_id'], tea_data)
+                session.start_time = wall_now
+                session.origin = deadline - sum(pour_times[:index + 1])
+                self._sessions[session.session_id] = session
+                self._arm(session, index, deadline)
+                resumed.append(session)
+            if resumed:
+                self._version += 1
+        if resumed:
+            self._notify_change()
+        return resumed
+
+    def skip(self, session_id):
+        """提前结束某个会话的当前倒茶，下一次倒茶从此刻重新计时"""
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                return False
+            return self.scheduler.fire_now(session.timer)
+
+    def cancel(self, session_id):
+        """取消某个会话"""
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+            if session is None:
+                return False
+            session.token.cancel()
+            self.scheduler.cancel(session.timer)
+            session._finish()
+            self._record('cancel', session)
+            self._version += 1
+        self._notify_change()
+        return True
+
+    def cancel_all(self, record=True):
+        """取消所有会话
+
+        record=False 时不写入取消事件（程序退出时使用，下次启动可以恢复这些会话）。
+        """
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+            for session in sessions:
+                session.token.cancel()
+                self.scheduler.cancel(session.timer)
+                session._finish()
+                if record:
+                    self._record('cancel', session)
+            if sessions:
+                self._version += 1
+        if sessions:
+            self._notify_change()
+        return len(sessions)
+
+    def shutdown(self, wait=True, timeout=None):
+        """停止所有会话并关闭调度线程，返回调度线程是否已退出
+
+        进行中的会话不记为取消，日志中保留其进度，下次启动时恢复。
+        """
+        self.cancel_all(record=False)
+        if self.journal is not None:
+            self.journal.flush(timeout)
+        return self.scheduler.shutdown(wait=wait, timeout=timeout)
+
+    def _schedule_pour(self, session, index, base):
+        """第 index 次倒茶的截止时间 = 上一次的计划截止时间（或会话原点）+ 本次时长"""
+        self._arm(session, index, base + session.tea_data['pour_times'][index])
+
+    def _arm(self, session, index, deadline):
+        timer = self.scheduler.call_at(deadline, self._on_pour_due, session, index)
+        session._set_pour(index + 1, deadline, timer)
+        self._record('pour', session, index=index, deadline=self._to_wall(deadline))
+
+    def _to_wall(self, deadline):
+        """单调时钟时刻换算为墙上时间"""
+        return time.time() + (deadline - self.now())
+
+    def _record(self, event, session, **fields):
+        if self.journal is not None:
+            self.journal.append(event, session.session_id, **fields)
+
+    def _on_pour_due(self, session, index):
+        fired_at = self.now()
+        with self._lock:
+            if session.token.cancelled or self._sessions.get(session.session_id) is not session:
+                return
+            # 提前结束时 fire_now 已把截止时间改为触发时刻，下一次从这里起算
+            deadline = session.timer.deadline
+            self.lateness.record(fired_at - deadline)
+            finished = index + 1 >= session.pour_count
+            if finished:
+                del self._sessions[session.session_id]
+                session._finish()
+                self._record('finish', session)
+            else:
+                self._schedule_pour(session, index + 1, deadline)
+            self._version += 1
+
+        # 倒茶提醒的回调出错时，结束回调和状态通知仍要执行（会话已从引擎中移除）
+        try:
+            if self.on_pour:
+                self.on_pour(session, index + 1, deadline)
+        finally:
+            if finished and self.on_finish:
+                self.on_finish(session)
+            self._notify_change()
+
+    def _notify_change(self):
+        if self.on_change:
+            self.on_change()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+冲泡日志
+Brew session journal
+
+每个冲泡会话的状态变化（开始、进入第几次倒茶、完成、取消）以 JSON Lines
+追加到日志文件。程序崩溃或中途关闭后，下次启动时回放日志即可恢复仍在进行中的
+会话，并根据记录的截止时间算出剩余时间。
+
+写入由后台线程批量完成（每批一次 fsync），调用 append 只是放入内存队列，
+不会阻塞 Tk 主线程；队列清空后写入线程自动退出。
+日志中的时间均为墙上时间（time.time），因为单调时钟在重启后没有意义。
+"""
+
+import json
+import os
+import threading
+from collections import deque
+
+
+class BrewJournal:
+    """追加写入的冲泡会话日志"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._pending = deque()
+        self._writer = None
+
+    def append(self, event, session_id, **fields):
+        """追加一条事件（非阻塞）"""
+        record = {'event': event, 'session_id': session_id}
+        record.update(fields)
+        with self._lock:
+            self._pending.append(record)
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="brew-journal", daemon=True)
+                self._writer.start()
+
+    def flush(self, timeout=None):
+        """等待已排队的事件全部写入磁盘"""
+        with self._lock:
+            writer = self._writer
+        if writer is not None and writer is not threading.current_thread():
+            writer.join(timeout)
+
+    def _write_loop(self):
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._writer = None
+                    return
+                batch = list(self._pending)
+                self._pending.clear()
+            try:
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    for record in batch:
+                        f.write(json.dumps(record, ensure_ascii=False) + '\n')
+                    f.flush()
+                    os.fsync(f.fileno())
+            except OSError as e:
+                print(f"写入冲泡日志失败: {e}")
+
+    def replay(self):
+        """回放日志，返回仍在进行中的会话列表
+
+        每项为 {'session_id', 'tea_data', 'index', 'deadline'}：
+        正在等待第 index 次倒茶（从 0 开始），截止时间为墙上时间 deadline。
+        """
+        sessions = {}
+        if not os.path.exists(self.path):
+            return []
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        event = record['event']
+                        session_id = record['session_id']
+                    except (ValueError, KeyError, TypeError):
+                        # 崩溃时最后一行可能只写了一半
+                        continue
+                    if event == 'start':
+                        sessions[session_id] = {'session_id': session_id, 'tea_data': record.get('tea_data')}
+                    elif event == 'pour' and session_id in sessions:
+                        sessions[session_id]['index'] = record.get('index')
+                        sessions[session_id]['deadline'] = record.get('deadline')
+                    elif event in ('finish', 'cancel'):
+                        sessions.pop(session_id, None)
+        except OSError as e:
+            print(f"读取冲泡日志失败: {e}")
+            return []
+        return [
+            session for session in sessions.values()
+            if session.get('tea_data') and session.get('index') is not None and session.get('deadline') is not None
+        ]
+
+    def compact(self, live_sessions):
+        """只保留仍在进行中的会话，原子地重写日志文件"""
+        self.flush()
+        temp_path = self.path + '.tmp'
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                for session in live_sessions:
+                    start = {'event': 'start', 'session_id': session['session_id'], 'tea_data': session['tea_data']}
+                    pour = {
+                        'event': 'pour', 'session_id': session['session_id'],
+                        'index': session['index'], 'deadline': session['deadline'],
+                    }
+                    f.write(json.dumps(start, ensure_ascii=False) + '\n')
+                    f.write(json.dumps(pour, ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"整理冲泡日志失败: {e}")
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+冲泡调度器
+Brew scheduler
+
+所有倒茶截止时间放在一个最小堆里，由一个后台线程通过条件变量等待：
+线程只在最近的截止时间到达、或有新任务/取消/提前触发时才被唤醒，
+空闲时完全阻塞，不做任何轮询。
+
+取消和提前触发不在堆中查找任务，只把原来的堆条目标记为失效（O(1)），
+失效条目到达堆顶时被丢弃；失效条目超过一半时整体重建一次堆，
+因此每个会话的开销不随同时进行的会话数增长。
+
+调度线程在堆中没有有效任务时自动退出，下次登记任务时再启动，因此没有冲泡时
+不会留下任何后台线程。
+
+本模块不依赖 tkinter，回调在调度线程中执行；界面代码需要自行通过
+root.after 切回主线程。
+"""
+
+import heapq
+import itertools
+import threading
+import time
+
+
+class ScheduledCall:
+    """调度任务句柄"""
+
+    __slots__ = ('deadline', 'callback', 'args', 'cancelled', 'done', 'seq')
+
+    def __init__(self, deadline, callback, args):
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+        self.done = False
+        # 当前有效的堆条目序号，提前触发时重新入堆，旧条目随之失效
+        self.seq = None
+
+    @property
+    def pending(self):
+        return not (self.cancelled or self.done)
+
+
+class BrewScheduler:
+    """基于截止时间堆和条件变量的单线程调度器"""
+
+    def __init__(self, clock=time.monotonic, name="brew-scheduler"):
+        self._clock = clock
+        self._name = name
+        self._cond = threading.Condition()
+        self._heap = []
+        # 堆中已失效（取消或重新入堆）但尚未弹出的条目数
+        self._dead = 0
+        self._counter = itertools.count()
+        self._thread = None
+        self._stopped = False
+
+    def now(self):
+        return self._clock()
+
+    def call_at(self, deadline, callback, *args):
+        """在调度时钟的 deadline 时刻执行 callback(*args)"""
+        call = ScheduledCall(deadline, callback, args)
+        with self._cond:
+            if self._stopped:
+                raise RuntimeError("调度器已关闭")
+            self._push(call)
+            self._ensure_thread()
+            # 只有新任务成为最早的截止时间时才需要唤醒线程重新计算等待时长
+            if self._heap[0][2] is call:
+                self._cond.notify()
+        return call
+
+    def call_later(self, delay, callback, *args):
+        """delay 秒后执行 callback(*args)"""
+        return self.call_at(self._clock() + max(0.0, delay), callback, *args)
+
+    def cancel(self, call):
+        """取消任务，返回是否真正取消了一个待执行的任务"""
+        with self._cond:
+            if call is None or not call.pending:
+                return False
+            call.cancelled = True
+            self._discard()
+            self._cond.notify()
+            return True
+
+    def fire_now(self, call):
+        """让待执行的任务立即执行（用于提前结束本次倒茶）"""
+        with self._cond:
+            if call is None or not call.pending:
+                return False
+            # 先让旧条目失效，之后即使 _discard() 重建堆也不会把它当作有效条目保留
+            call.seq = None
+            self._discard()
+            call.deadline = self._clock()
+            self._push(call)
+            self._cond.notify()
+            return True
+
+    def pending_count(self):
+        with self._cond:
+            return len(self._heap) - self._dead
+
+    def join(self, timeout=None):
+        """等待调度线程退出（堆清空或关闭后），返回线程是否已退出"""
+        with self._cond:
+            thread = self._thread
+        if thread is None or thread is threading.current_thread():
+            return True
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    def shutdown(self, wait=True, timeout=None):
+        """停止调度线程，丢弃所有未执行的任务
+
+        wait=True 时等待线程退出。注意不要在 Tk 主线程中无限期等待：
+        调度线程里的回调可能正在等待主线程处理 root.after。
+        """
+        with self._cond:
+            self._stopped = True
+            for _, _, call in self._heap:
+                call.cancelled = True
+            self._heap.clear()
+            self._dead = 0
+            self._cond.notify_all()
+        if wait:
+            return self.join(timeout)
+        return True
+
+    def _push(self, call):
+        call.seq = next(self._counter)
+        heapq.heappush(self._heap, (call.deadline, call.seq, call))
+
+    @staticmethod
+    def _live(entry):
+        _, seq, call = entry
+        return call.seq == seq and call.pending
+
+    def _discard(self):
+        """登记一个条目失效；失效条目超过一半时重建堆，均摊开销为常数"""
+        self._dead += 1
+        if self._dead > 64 and self._dead * 2 > len(self._heap):
+            self._heap = [entry for entry in self._heap if self._live(entry)]
+            heapq.heapify(self._heap)
+            self._dead = 0
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    # 丢弃到达堆顶的失效条目
+                    while self._heap and not self._live(self._heap[0]):
+                        heapq.heappop(self._heap)
+                        self._dead -= 1
+                    if self._stopped or not self._heap:
+                        # 没有待执行的任务时退出线程，空闲时不占用任何线程
+                        if self._thread is threading.current_thread():
+                            self._thread = None
+                        return
+                    timeout = self._heap[0][0] - self._clock()
+                    if timeout <= 0:
+                        _, _, call = heapq.heappop(self._heap)
+                        call.done = True
+                        break
+                    self._cond.wait(timeout)
+
+            try:
+                call.callback(*call.args)
+            except Exception as e:
+                print(f"冲泡调度任务执行失败: {e}")
@@ -2,17 +2,121 @@
 # -*- coding: utf-8 -*-
 """
 创建欧式豪华风格背景图片
+Background generator
+
+渐变、木纹、装饰边框和金色装饰点都用 NumPy 数组运算一次生成，可以生成任意尺寸，
+每个界面主题各有一套配色（background_palettes.THEME_PALETTES，与 gal.py 中的 themes 对应）。
+NumPy 在生成时才导入，主程序只读取缓存的背景时不会加载它。
+结果只取决于尺寸和主题，相同参数总是生成相同的图片。
+
+    python create_background.py                         # 生成 background1.jpg（1200x800，欧式豪华）
+    python create_background.py --theme modern --size 1000x700 -o modern.png
+    python create_background.py --benchmark             # 与原来逐行绘制的实现比较耗时
 """
 
+import argparse
+import statistics
+import time
+
 from PIL import Image, ImageDraw, ImageFilter
-import os
 
-def create_luxury_background():
-    """创建欧式豪华风格背景图片"""
-    # 创建图片尺寸
-    width, height = 1200, 800
-    
-    # 创建基础图片
+from background_palettes import DESIGN_SIZE, THEME_PALETTES
+
+# 木纹线条的间距和宽度（像素）
+GRAIN_STEP = 20
+GRAIN_WIDTH = 2
+# 装饰点半径（像素）及个数
+ORNAMENT_RADIUS = 3
+ORNAMENT_COUNT = 20
+
+
+def render_background(width, height, theme="wooden"):
+    """生成 width x height 的背景图片（PIL Image）"""
+    import numpy as np
+
+    palette = THEME_PALETTES[theme]
+    base = np.array(palette['base'], dtype=np.float64)
+    end = np.array(palette['gradient_end'], dtype=np.float64)
+    scale_x = width / DESIGN_SIZE[0]
+    scale_y = height / DESIGN_SIZE[1]
+    scale = min(scale_x, scale_y)
+
+    # 从上到下的渐变：每行一种颜色，广播到整行
+    ratio = np.arange(height, dtype=np.float64)[:, None] / height
+    rows = (base + (end - base) * ratio * palette['gradient_strength']).astype(np.uint8)
+    pixels = np.broadcast_to(rows[:, None, :], (height, width, 3)).copy()
+
+    # 竖直木纹：每隔 GRAIN_STEP 像素一条，颜色按 -1/0/+1 循环明暗变化
+    columns = np.arange(width)
+    starts = columns - columns % GRAIN_STEP
+    grain = (columns % GRAIN_STEP) < GRAIN_WIDTH
+    variation = palette['grain_amplitude'] * ((starts[grain] % 3) - 1)
+    grain_colors = np.clip(base + variation[:, None], 0, 255).astype(np.uint8)
+    pixels[:, grain, :] = grain_colors[None, :, :]
+
+    # 装饰边框（模拟木板）：3 x 2 个双层矩形框
+    margin_x, margin_y = round(50 * scale), round(100 * scale)
+    shrink_x, shrink_y = round(100 * scale), round(200 * scale)
+    inset = round(10 * scale)
+    outer_width, inner_width = max(1, round(3 * scale)), max(1, round(2 * scale))
+    for i in range(3):
+        for j in range(2):
+            x1 = i * (width // 3) + margin_x
+            y1 = j * (height // 2) + margin_y
+            x2 = x1 + (width // 3) - shrink_x
+            y2 = y1 + (height // 2) - shrink_y
+            _draw_frame(pixels, x1, y1, x2, y2, outer_width, palette['frame_outer'])
+            _draw_frame(pixels, x1 + inset, y1 + inset, x2 - inset, y2 - inset, inner_width, palette['frame_inner'])
+
+    # 金色装饰点：所有点的圆形区域一次性计算
+    index = np.arange(ORNAMENT_COUNT)
+    centers_x = np.round(index * 60 * scale_x).astype(int) % width
+    centers_y = np.round(index * 40 * scale_y).astype(int) % height
+    offsets = np.arange(-ORNAMENT_RADIUS, ORNAMENT_RADIUS + 1)
+    dy, dx = np.meshgrid(offsets, offsets, indexing='ij')
+    disc = dx * dx + dy * dy <= ORNAMENT_RADIUS * ORNAMENT_RADIUS + 1
+    ys = (centers_y[:, None] + dy[disc][None, :]).ravel()
+    xs = (centers_x[:, None] + dx[disc][None, :]).ravel()
+    inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+    pixels[ys[inside], xs[inside]] = palette['ornament']
+
+    # 轻微的模糊效果，使背景更柔和
+    return Image.fromarray(_soften(pixels), 'RGB')
+
+
+def _soften(pixels):
+    """[1, 6, 1] / 8 的可分离模糊，效果接近 GaussianBlur(radius=0.5)，边缘像素按重复处理"""
+    import numpy as np
+
+    wide = pixels.astype(np.uint16)
+    horizontal = wide * 6
+    horizontal[:, 1:] += wide[:, :-1]
+    horizontal[:, 0] += wide[:, 0]
+    horizontal[:, :-1] += wide[:, 1:]
+    horizontal[:, -1] += wide[:, -1]
+    both = horizontal * 6
+    both[1:] += horizontal[:-1]
+    both[0] += horizontal[0]
+    both[:-1] += horizontal[1:]
+    both[-1] += horizontal[-1]
+    # 两次各放大 8 倍，四舍五入后除以 64
+    both += 32
+    both >>= 6
+    return both.astype(np.uint8)
+
+
+def _draw_frame(pixels, x1, y1, x2, y2, line_width, color):
+    """在数组上画矩形边框（含端点，与 ImageDraw.rectangle 的 outline 一致）"""
+    if x2 < x1 or y2 < y1:
+        return
+    pixels[y1:y1 + line_width, x1:x2 + 1] = color
+    pixels[max(y1, y2 - line_width + 1):y2 + 1, x1:x2 + 1] = color
+    pixels[y1:y2 + 1, x1:x1 + line_width] = color
+    pixels[y1:y2 + 1, max(x1, x2 - line_width + 1):x2 + 1] = color
+
+
+def render_background_legacy(width=1200, height=800):
+    """原来的实现：逐行画渐变、逐列画木纹（只用于 --benchmark 对比）"""
     img = Image.new('RGB', (width, height), '#8B4513')  # 深棕色背景
     draw = ImageDraw.Draw(img)
     
@@ -56,11 +160,61 @@ def create_luxury_background():
         draw.ellipse([x-3, y-3, x+3, y+3], fill='#DAA520')
     
     # 应用轻微的模糊效果，使背景更柔和
-    img = img.filter(ImageFilter.GaussianBlur(radius=0.5))
-    
-    # 保存图片
-    img.save('background1.jpg', 'JPEG', quality=95)
-    print("背景图片创建成功：background1.jpg")
+    return img.filter(ImageFilter.GaussianBlur(radius=0.5))
+
+
+def create_luxury_background(output='background1.jpg', width=1200, height=800, theme="wooden"):
+    """生成背景图片并保存（.jpg 按 95 质量保存）"""
+    image = render_background(width, height, theme)
+    if output.lower().endswith(('.jpg', '.jpeg')):
+        image.save(output, 'JPEG', quality=95)
+    else:
+        image.save(output)
+    print(f"背景图片创建成功：{output}")
+
+
+def benchmark(repeat=5):
+    """比较原来的逐行实现与数组实现的耗时，并检查两者的像素差异"""
+    import numpy as np
+
+    def best_of(func):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            image = func()
+            timings.append((time.perf_counter() - start) * 1000)
+        return image, min(timings), statistics.median(timings)
+
+    legacy, legacy_best, legacy_median = best_of(lambda: render_background_legacy(1200, 800))
+    print(f"原实现 1200x800: 最快 {legacy_best:.1f} ms，中位数 {legacy_median:.1f} ms")
+    image, best, median = best_of(lambda: render_background(1200, 800))
+    print(f"数组实现 1200x800: 最快 {best:.1f} ms，中位数 {median:.1f} ms（{legacy_median / median:.1f} 倍）")
+    difference = np.abs(np.asarray(image, dtype=np.int16) - np.asarray(legacy, dtype=np.int16))
+    print(f"与原实现的像素差异: 最大 {difference.max()}，平均 {difference.mean():.3f}")
+    for size in ((900, 650), (1400, 900)):
+        for theme in THEME_PALETTES:
+            _, best, median = best_of(lambda: render_background(*size, theme))
+            print(f"数组实现 {size[0]}x{size[1]} {theme}: 最快 {best:.1f} ms，中位数 {median:.1f} ms")
+
+
+def parse_size(text):
+    width, _, height = text.lower().partition('x')
+    return int(width), int(height)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="生成界面背景图片")
+    parser.add_argument("--theme", choices=sorted(THEME_PALETTES), default="wooden", help="主题配色（默认 wooden）")
+    parser.add_argument("--size", type=parse_size, default=DESIGN_SIZE, help="图片尺寸，如 1000x700（默认 1200x800）")
+    parser.add_argument("-o", "--output", default="background1.jpg", help="输出文件（默认 background1.jpg）")
+    parser.add_argument("--benchmark", action="store_true", help="与原来的逐行实现比较耗时")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark()
+    else:
+        create_luxury_background(args.output, *args.size, theme=args.theme)
+
 
 if __name__ == "__main__":
-    create_luxury_background()
\ No newline at end of file
+    main()
@@ -9,24 +9,41 @@ Tea Brewing Timer Application
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog, filedialog
+from tkinter import messagebox
 import json
 import os
-import threading
 import time
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any
-from PIL import Image, ImageTk, ImageDraw, ImageFont
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import numpy as np
-import shutil
 import uuid
 
+from startup_profiler import OperationTimer, profile_phase
+from style_registry import StyleRegistry
+from image_cache import ImageCache, ingest_image, load_button_sprites
+from background_palettes import GENERATOR_VERSION
+from image_store import ImageStore
+from record_images import DEFAULT_MAX_EDGE, ingest_record_image, record_image_extension
+from brew_engine import BrewingEngine, LatenessHistogram
+from brew_journal import BrewJournal
+from tea_store import TeaStore
+# 各页面模块在第一次导航时才导入（趋势分析页面才会导入 matplotlib / numpy）
+from pages import get_page_class
+
+# 边栏颜色角色：优先使用主题专门的侧边栏颜色
+SIDEBAR_BG = ('sidebar_bg', 'text_color_3')
+SIDEBAR_TEXT = ('sidebar_text', 'text_color')
+
 class TeaBrewingApp:
-    def __init__(self, root):
+    # 拖动窗口时背景预览的最短间隔（约一帧），以及尺寸稳定多久后生成高质量背景（毫秒）
+    BACKGROUND_FRAME_MS = 16
+    BACKGROUND_SETTLE_MS = 150
+    
+    def __init__(self, root, profiler=None):
         self.root = root
+        # 启动性能分析器（main.py --profile-startup），为 None 时不计时
+        self.profiler = profiler
+        # 界面操作计时（边栏更新等）；开启性能分析时写入报告
+        self.ui_timer = profiler.operations if profiler is not None else OperationTimer()
         self.root.title("红茶冲泡定时提醒程序")
         
         # 获取屏幕尺寸
@@ -51,50 +68,80 @@ class TeaBrewingApp:
         # 设置窗口大小和位置
         self.root.geometry(f"{window_width}x{window_height}+{x}+{y}")
         
+        # 首次启动时按这个尺寸生成各主题的背景；窗口显示前也按这个尺寸加载背景
+        self.initial_window_size = (window_width, window_height)
+        
         # 设置窗口大小限制
         self.root.minsize(900, 650)  # 最小尺寸
         self.root.maxsize(1400, 900)  # 最大尺寸
         
         # 背景图片相关
-        self.background_image = None
         self.background_photo = None
-        self.background_label = None
-        
-        # 创建tea_closet文件夹
-        self.tea_closet_path = os.path.join(os.path.dirname(__file__), "..", "tea_closet")
-        if not os.path.exists(self.tea_closet_path):
-            os.makedirs(self.tea_closet_path)
-        
-        # 创建record文件夹
-        self.record_path = os.path.join(os.path.dirname(__file__), "..", "record")
-        if not os.path.exists(self.record_path):
-            os.makedirs(self.record_path)
-        
-        # 创建images文件夹
-        self.images_path = os.path.join(self.record_path, "images")
-        if not os.path.exists(self.images_path):
-            os.makedirs(self.images_path)
+        # 使用背景图片的标签（各页面和弹窗各一个），背景更新时原地更换图片
+        self.background_labels = []
+        # 当前显示的高质量背景对应的窗口尺寸（显示预览时不变）
+        self.background_size = None
+        # 最近一次请求的 (背景路径, 窗口尺寸)
+        self.background_target = (None, None)
+        # 各主题生成的背景图片路径（生成失败为 None）
+        self.generated_backgrounds = {}
+        # 拖动窗口时最新的尺寸，以及每帧一次的预览任务
+        self.background_pending_size = None
+        self.background_resize_job = None
+        # 尺寸稳定后的高质量背景任务；序号递增使后台已在生成的旧结果作废
+        self.background_render_job = None
+        self.background_generation = 0
+        self.background_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="background")
+        # 茶记图片的整理（缩小、重新编码、生成缩略图）在这个线程中进行；
+        # 退出时不取消，解释器结束前会等待已提交的图片处理完
+        self.image_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="record-images")
+        # 茶记页面读取缩略图的线程；切换选择时未开始的读取会被取消
+        self.thumbnail_worker = ThreadPoolExecutor(max_workers=2, thread_name_prefix="thumbnails")
+        
+        # 茶柜、茶记和设置文件（与无界面命令行共用），创建 tea_closet、record、images 文件夹
+        self.store = TeaStore(os.path.join(os.path.dirname(__file__), ".."))
+        self.store.ensure_dirs()
+        # 图片索引还不存在时（首次运行新版本）在图片处理线程中建立，需要计算已有图片的哈希
+        self.image_worker.submit(lambda: self.store.images)
         
         # 设置文件路径
-        self.settings_path = os.path.join(self.tea_closet_path, "settings.json")
-        self.tea_records_path = os.path.join(self.record_path, "tea_records.json")
+        self.tea_closet_path = self.store.tea_closet_path
+        self.record_path = self.store.record_path
+        self.images_path = self.store.images_path
+        self.settings_path = self.store.settings_path
+        self.tea_records_path = self.store.tea_records_path
+        
+        # 缩放后的背景图片缓存（内存 LRU + 磁盘），切换页面和预览时不再重复解码
+        self.image_cache = ImageCache(
+            os.path.join(self.store.cache_path, "backgrounds"), master=self.root, timer=self.ui_timer
+        )
         
-        # 当前运行的定时器
-        self.active_timers = []
+        # 已创建的页面实例（页面名 -> 页面对象），只包含用过的页面
+        self.pages = {}
         
-        # 冲泡状态管理
-        self.brewing_status = {
-            'is_brewing': False,
-            'tea_data': None,
-            'current_pour': 0,
-            'start_time': None,
-            'next_pour_time': None,
-            'remaining_time': 0,
-            'skip_current': False  # 跳过当前倒茶的标志
-        }
+        # 边栏倒计时的唯一 after 句柄：重新安排前先取消，没有冲泡时为 None
+        self.countdown_tick = None
+        
+        # 冲泡日志：回放上次未完成的会话，并整理日志文件
+        journal = BrewJournal(self.store.journal_path)
+        interrupted_sessions = journal.replay()
+        journal.compact(interrupted_sessions)
         
-        # 加载背景图片
-        self.load_background_image()
+        # 冲泡状态管理：多个冲泡会话共用一个调度线程
+        self.brewing = BrewingEngine(
+            on_pour=self.on_brewing_pour,
+            on_finish=self.on_brewing_finish,
+            on_change=lambda: self.root.after(0, self.update_sidebar_display),
+            journal=journal
+        )
+        # 恢复程序崩溃或关闭前仍在冲泡的茶；等主循环开始后再恢复，
+        # 已经到时间的倒茶会立即在调度线程中触发，回调里的 root.after 需要主循环在运行
+        self.root.after_idle(lambda: self.brewing.resume(interrupted_sessions))
+        # 提醒弹窗实际显示时刻相对计划倒茶时间的延迟（含 Tk 事件队列的排队时间）
+        self.reminder_lateness = LatenessHistogram()
+        if self.profiler is not None:
+            # 调度线程的触发延迟和提醒弹窗的显示延迟一起写入启动性能报告
+            self.profiler.lateness.update(scheduler=self.brewing.lateness, reminder=self.reminder_lateness)
         
         # 定义主题配置
         self.themes = {
@@ -155,16 +202,38 @@ class TeaBrewingApp:
         # 自定义UI设置
         self.custom_background_path = None
         self.custom_button_background_path = None
+        # 自定义按钮背景：尺寸名（large/medium/small）-> PhotoImage，所有按钮共用
+        self.custom_button_images = {}
+        # 茶记图片的最长边（像素）
+        self.record_image_max_edge = DEFAULT_MAX_EDGE
+        
+        # 控件样式登记表：记录每个控件的主题角色，切换主题时原地重设
+        self.style_registry = StyleRegistry(self.get_theme_config)
         
         # 加载设置
         self.current_theme = "wooden"  # 默认主题为深棕木柜
-        self.load_settings()
+        with profile_phase(self.profiler, 'load_settings'):
+            self.load_settings()
+        
+        # 加载背景图片（在读取设置之后，以便直接使用自定义背景）
+        with profile_phase(self.profiler, 'load_background_image'):
+            self.load_background_image()
+        with profile_phase(self.profiler, 'load_button_sprites'):
+            self.load_button_sprites()
         
         # 应用当前主题
         self.apply_theme()
         
+        # 页面容器：各页面框架叠放在同一格中，用 tkraise 切换
+        self.current_page = None
+        self.page_container = self.style(tk.Frame(self.root), bg='bg_color')
+        self.page_container.pack(fill='both', expand=True)
+        self.page_container.grid_rowconfigure(0, weight=1)
+        self.page_container.grid_columnconfigure(0, weight=1)
+        
         # 创建主界面
-        self.create_main_interface()
+        with profile_phase(self.profiler, 'create_main_interface'):
+            self.create_main_interface()
 
         # 初始化顶层窗口列表，用于ESC关闭弹窗（Toplevel windows）
         # 中文注释：用于记录所有打开的Toplevel弹窗，以便按下ESC时优先关闭弹窗而不是直接返回主页。
@@ -179,6 +248,12 @@ class TeaBrewingApp:
             self.root.bind_all("<Escape>", self.handle_escape)
         except tk.TclError:
             pass
+
+        # 背景跟随窗口尺寸变化
+        self.root.bind("<Configure>", self.on_window_configure, add='+')
+
+        # 关闭窗口时取消所有冲泡会话
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
     
     def load_settings(self):
         """加载设置"""
@@ -189,11 +264,90 @@ class TeaBrewingApp:
                 self.current_theme = settings.get('theme', 'wooden')
                 self.custom_background_path = settings.get('custom_background', None)
                 self.custom_button_background_path = settings.get('custom_button_background', None)
+                self.record_image_max_edge = int(settings.get('record_image_max_edge', DEFAULT_MAX_EDGE))
         except Exception as e:
             print(f"加载设置失败: {e}")
             self.current_theme = "wooden"
             self.custom_background_path = None
             self.custom_button_background_path = None
+        self.migrate_custom_background()
+    
+    def load_button_sprites(self, raise_errors=False):
+        """加载自定义按钮背景图集；没有设置自定义按钮背景时清空"""
+        self.custom_button_images = {}
+        path = self.custom_button_background_path
+        if not path or not os.path.exists(path):
+            return
+        try:
+            self.custom_button_images = load_button_sprites(
+                path, os.path.join(self.store.cache_path, "buttons"), master=self.root
+            )
+        except Exception as e:
+            if raise_errors:
+                raise
+            print(f"加载按钮背景失败: {e}")
+    
+    def button_image(self, size_name):
+        """某种尺寸（large/medium/small）的自定义按钮背景，没有时返回 None"""
+        return self.custom_button_images.get(size_name)
+    
+    def import_record_image(self, source_path, record_id):
+        """在后台线程中整理用户为茶记选择的图片，完成后登记到已保存的茶记 record_id
+        
+        计算原图哈希、整理图片和登记都在图片处理线程中进行（该线程只有一个，依次处理），
+        同一张图片已经保存过时直接复用。处理失败时在主线程中提示，茶记保留但没有图片。
+        """
+        max_edge = self.record_image_max_edge
+        
+        def work():
+            start = time.perf_counter()
+            try:
+                images = self.store.images
+                image_filename = ImageStore.content_filename(source_path, record_image_extension())
+                if not os.path.exists(images.path(image_filename)):
+                    ingest_record_image(source_path, self.images_path, image_filename, max_edge)
+                    images.mark_stored(image_filename)
+                self.store.attach_record_image(record_id, image_filename)
+                elapsed = time.perf_counter() - start
+                done = lambda: self.ui_timer.record('record_image_ingest', elapsed)
+            except Exception as e:
+                message = f"茶记已保存，但图片保存失败: {e}"
+                print(message)
+                done = lambda: messagebox.showerror("错误", message)
+            try:
+                self.root.after(0, done)
+            except (RuntimeError, tk.TclError):
+                # 主窗口已关闭
+                pass
+        
+        self.image_worker.submit(work)
+    
+    def import_custom_background(self, file_path):
+        """把用户选择的背景图片缩小后保存为程序自己的副本，返回副本路径（无效图片会抛出异常）"""
+        return ingest_image(file_path, self.store.backgrounds_path)
+    
+    def migrate_custom_background(self):
+        """旧设置中直接引用了用户原图的，改为引用缩小后的副本；并删除不再使用的副本"""
+        path = self.custom_background_path
+        backgrounds_path = os.path.abspath(self.store.backgrounds_path)
+        if path and os.path.exists(path) and os.path.dirname(os.path.abspath(path)) != backgrounds_path:
+            try:
+                self.custom_background_path = self.import_custom_background(path)
+                self.save_settings()
+            except Exception as e:
+                print(f"转换自定义背景图片失败: {e}")
+        
+        current = os.path.abspath(self.custom_background_path) if self.custom_background_path else None
+        try:
+            entries = list(os.scandir(backgrounds_path))
+        except OSError:
+            return
+        for entry in entries:
+            if entry.is_file() and os.path.abspath(entry.path) != current:
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
     
     def save_settings(self):
         """保存设置"""
@@ -201,7 +355,8 @@ class TeaBrewingApp:
             settings = {
                 'theme': self.current_theme,
                 'custom_background': self.custom_background_path,
-                'custom_button_background': self.custom_button_background_path
+                'custom_button_background': self.custom_button_background_path,
+                'record_image_max_edge': self.record_image_max_edge
             }
             with open(self.settings_path, 'w', encoding='utf-8') as f:
                 json.dump(settings, f, ensure_ascii=False, indent=2)
@@ -209,231 +364,191 @@ class TeaBrewingApp:
             messagebox.showerror("错误", f"保存设置失败：{str(e)}")
     
     def apply_theme(self):
-        """应用主题"""
+        """应用主题：一次遍历重设所有已登记控件的颜色和字体，不重建页面"""
         theme = self.themes[self.current_theme]
         self.root.configure(bg=theme['bg_color'])
+        with self.ui_timer.measure('apply_theme'):
+            self.style_registry.apply(theme)
+        # 没有自定义背景时背景随主题变化
+        if self.background_target[0] is not None and self.background_target[0] != self.background_source():
+            self.refresh_background(force=True)
+    
+    def style(self, widget, **roles):
+        """按主题角色设置控件样式并登记，切换主题时自动更新，返回控件本身
+
+        例如 self.style(tk.Label(parent, text="..."), bg='panel_bg', fg='heading_text',
+        font=('font_family', 12, 'bold'))，角色说明见 style_registry。
+        """
+        return self.style_registry.register(widget, **roles)
+    
+    def theme_color(self, role):
+        """当前主题下某个颜色角色的取值"""
+        return self.style_registry.color(role)
     
     def get_theme_config(self):
         """获取当前主题配置"""
         return self.themes[self.current_theme]
     
-    def load_background_image(self):
-        """加载背景图片"""
+    def background_source(self):
+        """当前背景图片的路径
+        
+        优先使用自定义背景图片，其次是按当前主题生成的背景，无法生成时使用默认背景图片。
+        """
+        if self.custom_background_path and os.path.exists(self.custom_background_path):
+            return self.custom_background_path
+        return self.generated_background() or os.path.join(os.path.dirname(__file__), "background1.jpg")
+    
+    def generated_background(self):
+        """当前主题的生成背景（以首次启动时的窗口尺寸生成，之后直接使用缓存的文件），失败时返回 None"""
+        theme = self.current_theme
+        if theme in self.generated_backgrounds:
+            return self.generated_backgrounds[theme]
+        
+        width, height = self.initial_window_size
+        path = os.path.join(
+            self.store.cache_path, "generated", f"{theme}_v{GENERATOR_VERSION}_{width}x{height}.png"
+        )
+        try:
+            if not os.path.exists(path):
+                # 只有第一次需要生成时才导入生成器（和 numpy）
+                import create_background
+                with self.ui_timer.measure('generate_background'):
+                    image = create_background.render_background(width, height, theme)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                image.save(path + '.tmp', 'PNG', compress_level=1)
+                os.replace(path + '.tmp', path)
+        except Exception as e:
+            print(f"生成背景图片失败: {e}")
+            path = None
+        self.generated_backgrounds[theme] = path
+        return path
+    
+    def window_size(self):
+        """主窗口当前尺寸；窗口尚未显示时为 geometry() 设置的初始尺寸
+        
+        这里不调用 update_idletasks()：它会提前执行 after_idle 中排队的任务（如恢复中断的冲泡）。
+        """
+        width, height = self.root.winfo_width(), self.root.winfo_height()
+        if width <= 1 or height <= 1:
+            return self.initial_window_size
+        return (width, height)
+    
+    def load_background_image(self, size=None):
+        """按窗口尺寸加载背景图片
+        
+        缓存命中时直接使用；否则先显示快速预览，窗口尺寸稳定一段时间后
+        再在后台线程中生成高质量（LANCZOS）版本，完成后回到主线程替换。
+        """
+        size = size or self.window_size()
+        path = self.background_source()
+        self.background_target = (path, size)
+        self.cancel_background_render()
         try:
-            # 优先使用自定义背景图片
-            bg_path = None
-            if hasattr(self, 'custom_background_path') and self.custom_background_path and os.path.exists(self.custom_background_path):
-                bg_path = self.custom_background_path
+            photo = self.image_cache.lookup(path, size)
+            if photo is not None:
+                self.background_size = size
             else:
-                # 使用默认背景图片
-                bg_path = os.path.join(os.path.dirname(__file__), "background1.jpg")
-            
-            if bg_path and os.path.exists(bg_path):
-                # 加载图片
-                self.background_image = Image.open(bg_path)
-                # 获取窗口尺寸
-                self.root.update_idletasks()
-                window_width = self.root.winfo_width() if self.root.winfo_width() > 1 else 800
-                window_height = self.root.winfo_height() if self.root.winfo_height() > 1 else 600
-                
-                # 调整图片大小以适应窗口
-                img_width, img_height = self.background_image.size
-                aspect_ratio = img_width / img_height
-                
-                if window_width / window_height > aspect_ratio:
-                    # 窗口更宽，以高度为准
-                    new_height = window_height
-                    new_width = int(new_height * aspect_ratio)
-                else:
-                    # 窗口更高，以宽度为准
-                    new_width = window_width
-                    new_height = int(new_width / aspect_ratio)
-                
-                # 调整图片大小
-                resized_image = self.background_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                self.background_photo = ImageTk.PhotoImage(resized_image)
-                
+                photo = self.image_cache.preview(path, size)
+                self.background_render_job = self.root.after(self.BACKGROUND_SETTLE_MS, self.render_background)
         except Exception as e:
             print(f"加载背景图片失败: {e}")
-            self.background_image = None
-            self.background_photo = None
+            photo = None
+        self.set_background_photo(photo)
+    
+    def cancel_background_render(self):
+        """取消尚未开始的高质量背景生成，已在后台进行的结果到达时会被丢弃"""
+        self.background_generation += 1
+        if self.background_render_job is not None:
+            self.root.after_cancel(self.background_render_job)
+            self.background_render_job = None
+    
+    def render_background(self):
+        """在后台线程中生成当前目标尺寸的高质量背景"""
+        self.background_render_job = None
+        generation = self.background_generation
+        path, size = self.background_target
+        
+        def work():
+            # 已有更新的请求时直接放弃
+            if generation != self.background_generation:
+                return
+            try:
+                start = time.perf_counter()
+                key, image = self.image_cache.render(path, size)
+                elapsed = time.perf_counter() - start
+            except Exception as e:
+                print(f"生成背景图片失败: {e}")
+                return
+            try:
+                self.root.after(0, self.finish_background, generation, key, image, size, elapsed)
+            except RuntimeError:
+                # 主窗口已关闭
+                pass
+        
+        self.background_worker.submit(work)
+    
+    def finish_background(self, generation, key, image, size, elapsed):
+        """主线程：换上后台生成的高质量背景（过期的结果直接丢弃）"""
+        if generation != self.background_generation:
+            return
+        self.ui_timer.record('image_cache.decode', elapsed)
+        self.set_background_photo(self.image_cache.put(key, image))
+        self.background_size = size
+    
+    def set_background_photo(self, photo):
+        """更换背景图片并原地更新所有背景标签"""
+        self.background_photo = photo
+        self.background_labels = [label for label in self.background_labels if self.widget_alive(label)]
+        for label in self.background_labels:
+            label.config(image=photo or '')
+    
+    def on_window_configure(self, event):
+        """主窗口尺寸变化：每帧最多生成一次预览，高质量版本在尺寸稳定后再生成"""
+        if event.widget is not self.root:
+            return
+        size = (event.width, event.height)
+        if size == self.background_pending_size:
+            return
+        self.background_pending_size = size
+        if self.background_resize_job is None:
+            self.background_resize_job = self.root.after(self.BACKGROUND_FRAME_MS, self.apply_window_resize)
+    
+    def apply_window_resize(self):
+        self.background_resize_job = None
+        size = self.background_pending_size
+        if size != self.background_target[1] or self.background_target[0] != self.background_source():
+            with self.ui_timer.measure('background_resize'):
+                self.load_background_image(size)
     
     def setup_background(self, parent):
         """设置背景图片"""
         if self.background_photo:
             # 创建背景标签
-            if self.background_label:
-                self.background_label.destroy()
-            
-            self.background_label = tk.Label(parent, image=self.background_photo)
-            self.background_label.place(x=0, y=0, relwidth=1, relheight=1)
+            background_label = tk.Label(parent, image=self.background_photo)
+            background_label.place(x=0, y=0, relwidth=1, relheight=1)
             
             # 确保背景在最底层
-            self.background_label.lower()
-
-    def create_main_interface(self):
-        """创建主界面"""
-        # 清空窗口
+            background_label.lower()
+            self.background_labels = [label for label in self.background_labels if self.widget_alive(label)]
+            self.background_labels.append(background_label)
+    
+    def refresh_background(self, force=False):
+        """窗口尺寸与背景不一致（或 force=True，如更换了背景图片）时重新加载背景"""
+        size = self.window_size()
+        if not force and size == self.background_target[1]:
+            return
+        self.load_background_image(size)
+    
+    @staticmethod
+    def widget_alive(widget):
         try:
-            for widget in self.root.winfo_children():
-                widget.destroy()
+            return bool(widget.winfo_exists())
         except tk.TclError:
-            pass
-        
-        # 重置边栏相关属性（但保持冲泡状态）
-        if hasattr(self, 'sidebar'):
-            delattr(self, 'sidebar')
-        if hasattr(self, 'status_frame'):
-            delattr(self, 'status_frame')
-        if hasattr(self, 'countdown_label'):
-            delattr(self, 'countdown_label')
-        
-        # 重新加载背景图片以适应当前窗口大小
-        self.load_background_image()
-        
-        # 设置背景图片
-        self.setup_background(self.root)
-        
-        # 获取当前主题配置
-        theme = self.get_theme_config()
-        
-        # 创建主容器框架（半透明）
-        main_container = tk.Frame(self.root, bg='')
-        main_container.pack(fill='both', expand=True)
-        
-        # 创建左侧主内容区域（半透明背景）
-        main_content = tk.Frame(main_container, bg='#F5F5DC', relief='raised', bd=2)
-        main_content.pack(side='left', fill='both', expand=True, padx=20, pady=20)
-        
-        # 创建右侧边栏（豪华风格）
-        sidebar_bg = theme.get('sidebar_bg', theme['text_color_3'])
-        self.sidebar = tk.Frame(main_container, bg=sidebar_bg, width=250, relief='raised', bd=4)
-        self.sidebar.pack(side='right', fill='y', padx=(10, 20), pady=20)
-        self.sidebar.pack_propagate(False)  # 防止边栏收缩
-        
-        # 标题（增强视觉效果，添加背景）
-        title_frame = tk.Frame(main_content, bg='#8B4513', relief='ridge', bd=3)
-        title_frame.pack(pady=20, padx=20, fill='x')
-        
-        title_label = tk.Label(
-            title_frame, 
-            text="🍵 红茶冲泡定时提醒程序 🍵", 
-            font=(theme['title_font'], 24, "bold"),
-            bg='#8B4513',
-            fg='#F5F5DC',
-            padx=20,
-            pady=10
-        )
-        title_label.pack()
-        
-        # 副标题（优雅风格，添加背景）
-        subtitle_frame = tk.Frame(main_content, bg='#CD853F', relief='groove', bd=2)
-        subtitle_frame.pack(pady=5, padx=40, fill='x')
-        
-        subtitle_label = tk.Label(
-            subtitle_frame,
-            text="专业红茶品尝家的冲泡助手",
-            font=(theme['subtitle_font'], 14, "italic"),
-            bg='#CD853F',
-            fg='#2F4F2F',
-            padx=15,
-            pady=5
-        )
-        subtitle_label.pack()
-        
-        # 主按钮框架（添加背景）
-        button_frame = tk.Frame(main_content, bg='#F5F5DC', relief='sunken', bd=2)
-        button_frame.pack(pady=50, padx=30, fill='x')
-        
-        # 创建茶种按钮（豪华风格，增强对比度）
-        create_button = tk.Button(
-            button_frame,
-            text="🌿 创建新茶种",
-            font=(theme['font_family'], 16, "bold"),
-            bg='#8B4513',
-            fg='#F5F5DC',
-            activebackground='#A0522D',
-            activeforeground='#FFFAF0',
-            relief='raised',
-            bd=4,
-            padx=20,
-            pady=12,
-            cursor='hand2'
-        )
-        create_button.pack(pady=12, fill='x', padx=20)
-        create_button.config(command=self.show_create_tea_page)
-        
-        # 茶柜按钮（增强对比度）
-        closet_button = tk.Button(
-            button_frame,
-            text="🏺 我的茶柜",
-            font=(theme['font_family'], 16, "bold"),
-            bg='#2F4F2F',
-            fg='#F5F5DC',
-            activebackground='#228B22',
-            activeforeground='#FFFAF0',
-            relief='raised',
-            bd=4,
-            padx=20,
-            pady=12,
-            cursor='hand2'
-        )
-        closet_button.pack(pady=12, fill='x', padx=20)
-        closet_button.config(command=self.show_tea_closet_page)
-        
-        # 设置按钮（增强对比度）
-        settings_button = tk.Button(
-            button_frame,
-            text="⚙️ 设置",
-            font=(theme['font_family'], 16, "bold"),
-            bg='#B8860B',
-            fg='#F5F5DC',
-            activebackground='#DAA520',
-            activeforeground='#FFFAF0',
-            relief='raised',
-            bd=4,
-            padx=20,
-            pady=12,
-            cursor='hand2'
-        )
-        settings_button.pack(pady=12, fill='x', padx=20)
-        settings_button.config(command=self.show_settings_page)
-        
-        # 茶记按钮（新增）
-        tea_notes_button = tk.Button(
-            button_frame,
-            text="📝 茶记",
-            font=(theme['font_family'], 16, "bold"),
-            bg='#8B008B',
-            fg='#F5F5DC',
-            activebackground='#9932CC',
-            activeforeground='#FFFAF0',
-            relief='raised',
-            bd=4,
-            padx=20,
-            pady=12,
-            cursor='hand2'
-        )
-        tea_notes_button.pack(pady=12, fill='x', padx=20)
-        tea_notes_button.config(command=self.show_tea_notes_page)
-        
-        # 信息标签（添加背景）
-        info_frame = tk.Frame(main_content, bg='#DEB887', relief='groove', bd=2)
-        info_frame.pack(pady=30, padx=40, fill='x')
-        
-        info_label = tk.Label(
-            info_frame,
-            text="让每一泡茶都恰到好处 ☕",
-            font=(theme['font_family'], 12, "italic"),
-            bg='#DEB887',
-            fg='#8B4513',
-            padx=15,
-            pady=8
-        )
-        info_label.pack()
-        
-        # 创建边栏内容
-        self.create_sidebar_content()
+            return False
+
+    def create_main_interface(self):
+        """显示主界面"""
+        self.show_page('home')
 
     # ========================= ESC 返回/关闭 相关工具方法 =========================
     def handle_escape(self, event=None):
@@ -498,40 +613,58 @@ class TeaBrewingApp:
     
     def create_sidebar_content(self):
         """创建边栏内容"""
-        theme = self.get_theme_config()
-        
-        # 使用专门的侧边栏背景色（如果有的话）
-        sidebar_bg = theme.get('sidebar_bg', theme['text_color_3'])
-        sidebar_text = theme.get('sidebar_text', theme['text_color'])
-        
         # 边栏标题
-        sidebar_title = tk.Label(
+        sidebar_title = self.style(tk.Label(
             self.sidebar,
             text="🍵 冲泡状态",
-            font=(theme['font_family'], 16, "bold"),
-            bg=sidebar_bg,
-            fg=sidebar_text,
             relief='raised',
             bd=2
-        )
+        ), font=('font_family', 16, "bold"), bg=SIDEBAR_BG, fg=SIDEBAR_TEXT)
         sidebar_title.pack(pady=(20, 10))
         
         # 分隔线（增强视觉效果）
-        separator = tk.Frame(self.sidebar, height=3, bg=theme.get('border_color', theme['text_color_2']), relief='sunken', bd=1)
+        separator = self.style(tk.Frame(self.sidebar, height=3, relief='sunken', bd=1), bg=('border_color', 'text_color_2'))
         separator.pack(fill='x', padx=20, pady=5)
         
         # 冲泡状态显示区域
-        self.status_frame = tk.Frame(self.sidebar, bg=sidebar_bg, relief='sunken', bd=2)
+        self.status_frame = self.style(tk.Frame(self.sidebar, relief='sunken', bd=2), bg=SIDEBAR_BG)
         self.status_frame.pack(fill='both', expand=True, padx=10, pady=10)
         
-        # 初始化边栏显示
-        self.update_sidebar_display()
+        # 停止全部冲泡（只在有冲泡时显示）
+        self.stop_all_button = self.style(tk.Button(
+            self.sidebar,
+            text="⏹ 停止全部冲泡",
+            fg='white',
+            activeforeground='white',
+            relief='raised',
+            bd=2,
+            command=self.confirm_stop_all,
+            cursor='hand2'
+        ), font=('font_family', 11, "bold"), bg='action_danger', activebackground='action_danger_active')
+        
+        # 边栏组件在这里创建一次，之后由 update_sidebar_display 原地更新：
+        # 每个冲泡会话一个面板（会话ID -> 面板组件），以及无冲泡时的提示
+        self.session_panels = {}
+        self.sidebar_brewing = None
+        self.no_brewing_label = self.style(tk.Label(
+            self.status_frame,
+            text="暂无冲泡中的茶",
+            relief='sunken',
+            bd=2,
+            padx=15,
+            pady=20
+        ), font=('font_family', 12, "italic"), bg=SIDEBAR_BG, fg='text_color_2')
         
-        # 启动定时更新
-        self.update_countdown()
+        # 初始化边栏显示（新建的边栏必须重绘），有冲泡时会同时安排倒计时刷新
+        self.update_sidebar_display(force=True)
     
-    def update_sidebar_display(self):
-        """更新边栏显示内容"""
+    def update_sidebar_display(self, force=False):
+        """更新边栏显示内容
+
+        读取冲泡引擎的一致快照；快照版本与上次绘制相同时跳过。
+        已有会话的面板只通过 config(text=...) 更新文字，只有会话开始/结束时才增删面板，
+        只有“有冲泡/无冲泡”状态切换时才显示或隐藏空状态提示。
+        """
         # 检查边栏和状态框架是否存在
         if not hasattr(self, 'sidebar') or not hasattr(self, 'status_frame'):
             return
@@ -543,2304 +676,380 @@ class TeaBrewingApp:
         except tk.TclError:
             return
         
-        theme = self.get_theme_config()
-        
-        # 清空状态框架
-        try:
-            for widget in self.status_frame.winfo_children():
-                widget.destroy()
-        except tk.TclError:
+        snapshot = self.brewing.snapshot()
+        if not force and snapshot.version == getattr(self, 'sidebar_version', None):
             return
+        self.sidebar_version = snapshot.version
         
-        if self.brewing_status['is_brewing']:
-            # 显示冲泡中的茶信息
-            tea_data = self.brewing_status['tea_data']
-            
-            # 使用专门的侧边栏颜色
-            sidebar_bg = theme.get('sidebar_bg', theme['text_color_3'])
-            sidebar_text = theme.get('sidebar_text', theme['text_color'])
-            
-            try:
-                # 茶名（增强视觉效果）
-                tea_name_label = tk.Label(
-                    self.status_frame,
-                    text=f"茶种: {tea_data['name']}",
-                    font=(theme['font_family'], 12, "bold"),
-                    bg=sidebar_bg,
-                    fg=sidebar_text,
-                    wraplength=200,
-                    relief='ridge',
-                    bd=2,
-                    padx=10,
-                    pady=5
-                )
-                tea_name_label.pack(pady=(0, 10), padx=5, fill='x')
-                
-                # 当前倒茶次数
-                pour_info_label = tk.Label(
-                    self.status_frame,
-                    text=f"第 {self.brewing_status['current_pour']} / {tea_data['pour_count']} 次",
-                    font=(theme['font_family'], 11),
-                    bg=sidebar_bg,
-                    fg=theme.get('accent_color', theme['text_color_2']),
-                    relief='groove',
-                    bd=1,
-                    padx=8,
-                    pady=3
-                )
-                pour_info_label.pack(pady=(0, 15), padx=5, fill='x')
-                
-                # 倒计时显示（豪华风格）
-                self.countdown_label = tk.Label(
-                    self.status_frame,
-                    text="计算中...",
-                    font=(theme['font_family'], 14, "bold"),
-                    bg=theme.get('accent_color', theme['button_color']),
-                    fg='white',
-                    relief='raised',
-                    bd=3,
-                    padx=10,
-                    pady=8
-                )
-                self.countdown_label.pack(pady=(0, 10), padx=5, fill='x')
-                
-                # 下次倒茶时间
-                next_pour_label = tk.Label(
-                    self.status_frame,
-                    text="下次倒茶倒计时",
-                    font=(theme['font_family'], 10),
-                    bg=sidebar_bg,
-                    fg=theme['text_color_2'],
-                    relief='flat',
-                    padx=5,
-                    pady=2
-                )
-                next_pour_label.pack(padx=5)
-                
-                # 提前结束按钮（豪华风格）
-                skip_button = tk.Button(
-                    self.status_frame,
-                    text="⏭ 提前结束本次倒茶",
-                    font=(theme['font_family'], 10, "bold"),
-                    bg=theme.get('accent_color', theme['button_color_4']),
-                    fg='white',
-                    activebackground=theme['button_color_2'],
-                    activeforeground='white',
-                    relief='raised',
-                    bd=3,
-                    padx=12,
-                    pady=6,
-                    command=self.skip_current_pour,
-                    cursor='hand2'
-                )
-                skip_button.pack(pady=(20, 10), padx=5, fill='x')
-            except tk.TclError:
-                return
-            
-        else:
+        with self.ui_timer.measure('sidebar_update'):
             try:
-                # 使用专门的侧边栏颜色
-                sidebar_bg = theme.get('sidebar_bg', theme['text_color_3'])
-                sidebar_text = theme.get('sidebar_text', theme['text_color'])
-                
-                # 显示无冲泡状态（豪华风格）
-                no_brewing_label = tk.Label(
-                    self.status_frame,
-                    text="暂无冲泡中的茶",
-                    font=(theme['font_family'], 12, "italic"),
-                    bg=sidebar_bg,
-                    fg=theme['text_color_2'],
-                    relief='sunken',
-                    bd=2,
-                    padx=15,
-                    pady=20
-                )
-                no_brewing_label.pack(pady=50, padx=10, fill='x')
+                self.sync_session_panels(snapshot.sessions)
             except tk.TclError:
                 return
+        
+        # 会话开始/结束或进入下一次倒茶后，重新对齐倒计时刷新
+        self.schedule_countdown_tick(snapshot.sessions)
+    
+    def sync_session_panels(self, sessions):
+        """让边栏面板与会话快照一致（sessions 为 BrewSnapshot 序列）"""
+        live_ids = {session.session_id for session in sessions}
+        for session_id in [sid for sid in self.session_panels if sid not in live_ids]:
+            self.session_panels.pop(session_id)['frame'].destroy()
+            self.ui_timer.count('sidebar_panels_destroyed')
+        
+        for session in sessions:
+            panel = self.session_panels.get(session.session_id)
+            if panel is None:
+                panel = self.create_session_panel(session)
+                self.session_panels[session.session_id] = panel
+                self.ui_timer.count('sidebar_panels_created')
+            else:
+                self.set_label_text(panel, 'title', self.session_title(session))
+            self.update_session_countdown(session, panel)
+        
+        brewing = bool(sessions)
+        if brewing != self.sidebar_brewing:
+            if brewing:
+                self.no_brewing_label.pack_forget()
+                self.stop_all_button.pack(after=self.status_frame, fill='x', padx=10, pady=(0, 10))
+            else:
+                self.no_brewing_label.pack(pady=50, padx=10, fill='x')
+                self.stop_all_button.pack_forget()
+            self.sidebar_brewing = brewing
+    
+    def session_title(self, session):
+        return f"{session.name}  第 {session.current_pour}/{session.pour_count} 次"
+    
+    def set_label_text(self, panel, key, text):
+        """文字变化时才调用 config，避免无谓的重绘"""
+        if panel['texts'].get(key) != text:
+            panel[key].config(text=text)
+            panel['texts'][key] = text
+    
+    def create_session_panel(self, session):
+        """在边栏中创建一个冲泡会话的状态面板（session 为 BrewSnapshot），返回面板组件字典"""
+        frame = self.style(tk.Frame(self.status_frame, relief='ridge', bd=2), bg=SIDEBAR_BG)
+        frame.pack(pady=(0, 8), padx=5, fill='x')
+        
+        # 茶名和当前倒茶次数
+        title = self.session_title(session)
+        title_label = self.style(tk.Label(
+            frame,
+            text=title,
+            wraplength=200,
+            anchor='w',
+            justify='left'
+        ), font=('font_family', 10, "bold"), bg=SIDEBAR_BG, fg=SIDEBAR_TEXT)
+        title_label.pack(fill='x', padx=5, pady=(3, 2))
+        
+        row = self.style(tk.Frame(frame), bg=SIDEBAR_BG)
+        row.pack(fill='x', padx=5, pady=(0, 4))
+        
+        # 下次倒茶倒计时
+        countdown_label = self.style(tk.Label(
+            row,
+            text="计算中...",
+            fg='white',
+            relief='raised',
+            bd=2,
+            padx=6,
+            pady=2
+        ), font=('font_family', 12, "bold"), bg=('accent_color', 'button_color'))
+        countdown_label.pack(side='left', fill='x', expand=True)
+        
+        # 提前结束本次倒茶
+        self.style(tk.Button(
+            row,
+            text="⏭",
+            fg='white',
+            activeforeground='white',
+            relief='raised',
+            bd=2,
+            padx=6,
+            command=lambda sid=session.session_id: self.skip_current_pour(sid),
+            cursor='hand2'
+        ), font=('font_family', 10, "bold"), bg=('accent_color', 'button_color_4'), activebackground='button_color_2').pack(side='right', padx=(5, 0))
+        
+        # 取消这次冲泡（写入日志，下次启动不再恢复）
+        self.style(tk.Button(
+            row,
+            text="✖",
+            fg='white',
+            activeforeground='white',
+            relief='raised',
+            bd=2,
+            padx=6,
+            command=lambda sid=session.session_id: self.cancel_brewing(sid),
+            cursor='hand2'
+        ), font=('font_family', 10, "bold"), bg='action_danger', activebackground='action_danger_active').pack(side='right', padx=(5, 0))
+        
+        return {
+            'frame': frame,
+            'title': title_label,
+            'countdown': countdown_label,
+            'texts': {'title': title, 'countdown': "计算中..."},
+        }
     
     def update_countdown(self):
         """更新倒计时显示"""
+        self.countdown_tick = None
+        sessions = self.brewing.snapshot().sessions
         try:
-            if (self.brewing_status['is_brewing'] and 
-                hasattr(self, 'countdown_label') and 
-                self.countdown_label.winfo_exists()):
-                
-                current_time = time.time()
-                if self.brewing_status['next_pour_time']:
-                    remaining = self.brewing_status['next_pour_time'] - current_time
-                    if remaining > 0:
-                        minutes = int(remaining // 60)
-                        seconds = int(remaining % 60)
-                        self.countdown_label.config(text=f"{minutes}分{seconds}秒")
-                    else:
-                        self.countdown_label.config(text="准备倒茶")
+            if hasattr(self, 'session_panels'):
+                for session in sessions:
+                    panel = self.session_panels.get(session.session_id)
+                    if panel is not None and panel['countdown'].winfo_exists():
+                        self.update_session_countdown(session, panel)
         except (tk.TclError, AttributeError):
             pass
         
-        # 每秒更新一次
+        self.schedule_countdown_tick(sessions)
+    
+    def schedule_countdown_tick(self, sessions):
+        """安排下一次倒计时刷新，始终只保留一个 after 句柄
+
+        刷新时刻对齐到某个会话剩余时间跨过整秒的时刻，显示的秒数不会跳过或停顿；
+        没有冲泡或边栏不存在时不安排刷新，直到下次会话变化再唤醒。
+        """
+        self.cancel_countdown_tick()
+        if not sessions or not hasattr(self, 'session_panels'):
+            return
+        
+        delay = 1.0
+        for session in sessions:
+            remaining = self.brewing.remaining(session)
+            if remaining is not None and remaining > 0:
+                delay = min(delay, remaining % 1.0)
+        # 稍微越过整秒再刷新，保证读到的剩余秒数已经变化
+        delay_ms = int(delay * 1000) + 5
         try:
-            self.root.after(1000, self.update_countdown)
+            self.countdown_tick = self.root.after(delay_ms, self.update_countdown)
         except tk.TclError:
             pass
+    
+    def cancel_countdown_tick(self):
+        """取消已安排的倒计时刷新"""
+        if self.countdown_tick is not None:
+            try:
+                self.root.after_cancel(self.countdown_tick)
+            except tk.TclError:
+                pass
+            self.countdown_tick = None
+
+    def update_session_countdown(self, session, panel):
+        """刷新单个会话的倒计时文字"""
+        remaining = self.brewing.remaining(session)
+        if remaining is not None:
+            if remaining > 0:
+                minutes = int(remaining // 60)
+                seconds = int(remaining % 60)
+                self.set_label_text(panel, 'countdown', f"{minutes}分{seconds}秒")
+            else:
+                self.set_label_text(panel, 'countdown', "准备倒茶")
+
+    # ========================= 页面注册与导航 =========================
+    def get_page(self, name):
+        """获取页面实例，页面模块在第一次使用时才导入"""
+        page = self.pages.get(name)
+        if page is None:
+            page = get_page_class(name)(self)
+            self.pages[name] = page
+        return page
+
+    def show_page(self, name, *args, **kwargs):
+        """显示指定页面"""
+        with self.ui_timer.measure(f'page_show.{name}'):
+            return self.get_page(name).show(*args, **kwargs)
+
+    def create_page_frame(self):
+        """在页面容器中创建一个页面框架"""
+        frame = self.style(tk.Frame(self.page_container), bg='bg_color')
+        frame.grid(row=0, column=0, sticky='nsew')
+        self.ui_timer.count('pages_built')
+        return frame
+
+    def raise_page(self, page):
+        """把已创建的页面提到最上层"""
+        if self.current_page is not None and self.current_page is not page:
+            self.current_page.hide()
+        self.current_page = page
+        # 只有窗口尺寸变化后才重新生成背景
+        self.refresh_background()
+        page.frame.tkraise()
 
     def show_create_tea_page(self):
         """显示创建茶种页面"""
-        # 停止所有定时器并清理状态
-        self.stop_all_timers()
-        
-        # 清空窗口
-        try:
-            for widget in self.root.winfo_children():
-                widget.destroy()
-        except tk.TclError:
-            pass
-        
-        # 获取当前主题配置
-        theme = self.get_theme_config()
-        
-        # 创建滚动框架
-        canvas = tk.Canvas(self.root, bg=theme['bg_color'])
-        scrollbar = ttk.Scrollbar(self.root, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg=theme['bg_color'])
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # 标题
-        title_label = tk.Label(
-            scrollable_frame,
-            text="🌿 创建新茶种",
-            font=(theme['title_font'], 20, "bold"),
-            bg=theme['bg_color'],
-            fg=theme['text_color']
-        )
-        title_label.pack(pady=20)
-        
-        # 创建输入框架
-        input_frame = tk.Frame(scrollable_frame, bg=theme['bg_color'])
-        input_frame.pack(padx=50, pady=20, fill='both', expand=True)
-        
-        # 茶名输入
-        tk.Label(input_frame, text="茶叶名称:", font=(theme['font_family'], 12, "bold"), bg=theme['bg_color'], fg=theme['text_color']).grid(row=0, column=0, sticky='w', pady=5)
-        self.tea_name_entry = tk.Entry(input_frame, font=(theme['font_family'], 12), width=30)
-        self.tea_name_entry.grid(row=0, column=1, pady=5, padx=10)
+        self.show_page('create_tea')
+
+    def show_tea_closet_page(self):
+        """显示茶柜页面"""
+        self.show_page('tea_closet')
+
+    def show_tea_notes_page(self):
+        """显示茶记页面"""
+        self.show_page('tea_notes')
+
+    def show_settings_page(self):
+        """显示设置页面"""
+        self.show_page('settings')
+
+    def show_tea_evaluation(self, tea_data):
+        """显示茶叶评价界面"""
+        # 多个会话可能先后完成，每次评价使用独立的弹窗实例
+        get_page_class('evaluation')(self).show(tea_data)
+
+    def show_trend_analysis(self):
+        """显示趋势分析"""
+        self.show_page('trend')
+
+    def generate_daily_report(self):
+        """生成日报告"""
+        self.show_page('daily_report')
+
+    def start_brewing_timers(self, tea_data):
+        """启动冲泡定时器（新增一个冲泡会话，不影响其他正在冲泡的茶）"""
+        return self.brewing.start(tea_data)
+
+    def on_brewing_pour(self, session, pour_number, deadline):
+        """倒茶时间到（在调度线程中执行），在主线程中显示提醒"""
+        def remind():
+            # 排队期间会话可能已被取消
+            if not session.token.cancelled:
+                self.reminder_lateness.record(self.brewing.now() - deadline)
+                self.show_brewing_reminder(session.tea_data, pour_number)
+        self.root.after(0, remind)
+
+    def on_brewing_finish(self, session):
+        """冲泡完成后显示评价界面"""
+        def evaluate():
+            if not session.token.cancelled:
+                self.show_tea_evaluation(session.tea_data)
+        self.root.after(1000, evaluate)
+
+    def show_brewing_reminder(self, tea_data, pour_number):
+        """显示冲泡提醒"""
+        # 创建提醒窗口
+        reminder_window = self.style(tk.Toplevel(self.root), bg='text_color_2')
+        reminder_window.title("冲泡提醒")
+        reminder_window.geometry("400x300")
+        # 注册弹窗以支持 ESC 关闭（Toplevel window register）
+        self.register_toplevel(reminder_window)
         
-        # 水温输入
-        tk.Label(input_frame, text="冲泡水温(°C):", font=(theme['font_family'], 12, "bold"), bg=theme['bg_color'], fg=theme['text_color']).grid(row=1, column=0, sticky='w', pady=5)
-        self.water_temp_entry = tk.Entry(input_frame, font=(theme['font_family'], 12), width=30)
-        self.water_temp_entry.grid(row=1, column=1, pady=5, padx=10)
+        # 置顶显示
+        reminder_window.attributes('-topmost', True)
         
-        # 茶具输入
-        tk.Label(input_frame, text="使用茶具:", font=(theme['font_family'], 12, "bold"), bg=theme['bg_color'], fg=theme['text_color']).grid(row=2, column=0, sticky='w', pady=5)
-        self.tea_ware_entry = tk.Entry(input_frame, font=(theme['font_family'], 12), width=30)
-        self.tea_ware_entry.grid(row=2, column=1, pady=5, padx=10)
+        # 居中显示
+        reminder_window.transient(self.root)
+        reminder_window.grab_set()
         
-        # 水量输入
-        tk.Label(input_frame, text="水量(ml):", font=(theme['font_family'], 12, "bold"), bg=theme['bg_color'], fg=theme['text_color']).grid(row=3, column=0, sticky='w', pady=5)
-        self.water_amount_entry = tk.Entry(input_frame, font=(theme['font_family'], 12), width=30)
-        self.water_amount_entry.grid(row=3, column=1, pady=5, padx=10)
+        # 提醒内容
+        self.style(tk.Label(
+            reminder_window,
+            text="⏰ 冲泡提醒 ⏰"
+        ), font=('title_font', 18, "bold"), bg='text_color_2', fg='bg_color').pack(pady=20)
         
-        # 茶叶重量输入
-        tk.Label(input_frame, text="茶叶重量(g):", font=(theme['font_family'], 12, "bold"), bg=theme['bg_color'], fg=theme['text_color']).grid(row=4, column=0, sticky='w', pady=5)
-        self.tea_weight_entry = tk.Entry(input_frame, font=(theme['font_family'], 12), width=30)
-        self.tea_weight_entry.grid(row=4, column=1, pady=5, padx=10)
+        self.style(tk.Label(
+            reminder_window,
+            text=f"🍵 {tea_data['name']}"
+        ), font=('font_family', 16, "bold"), bg='text_color_2', fg='text_color_3').pack(pady=10)
         
-        # 是否加奶
-        tk.Label(input_frame, text="是否加奶:", font=(theme['font_family'], 12, "bold"), bg=theme['bg_color'], fg=theme['text_color']).grid(row=5, column=0, sticky='w', pady=5)
-        self.add_milk_var = tk.BooleanVar()
-        milk_checkbox = tk.Checkbutton(input_frame, text="加奶", variable=self.add_milk_var, font=(theme['font_family'], 12), bg=theme['bg_color'], fg=theme['text_color_2'])
-        milk_checkbox.grid(row=5, column=1, sticky='w', pady=5, padx=10)
+        self.style(tk.Label(
+            reminder_window,
+            text=f"第 {pour_number} 次倒茶"
+        ), font=('font_family', 20, "bold"), bg='text_color_2', fg='button_color_4').pack(pady=20)
         
-        # 倒茶次数和时间设置
-        tk.Label(input_frame, text="倒茶设置:", font=(theme['font_family'], 12, "bold"), bg=theme['bg_color'], fg=theme['text_color']).grid(row=6, column=0, sticky='w', pady=10)
+        if tea_data['add_milk'] and pour_number == tea_data['pour_count']:
+            self.style(tk.Label(
+                reminder_window,
+                text="🥛 记得加奶哦！"
+            ), font=('font_family', 14), bg='text_color_2', fg='button_color_5').pack(pady=10)
         
-        # 倒茶次数
-        tk.Label(input_frame, text="倒茶次数:", font=(theme['font_family'], 10), bg=theme['bg_color'], fg=theme['text_color_2']).grid(row=7, column=0, sticky='w', pady=5)
-        self.pour_count_var = tk.IntVar(value=3)
-        pour_count_spinbox = tk.Spinbox(input_frame, from_=1, to=10, textvariable=self.pour_count_var, font=(theme['font_family'], 10), width=10)
-        pour_count_spinbox.grid(row=7, column=1, sticky='w', pady=5, padx=10)
+        # 确认按钮
+        self.style(tk.Button(
+            reminder_window,
+            text="✅ 已完成",
+            fg='white',
+            width=10,
+            command=reminder_window.destroy
+        ), font=('font_family', 14, "bold"), bg='button_color_3').pack(pady=20)
         
-        # 动态创建时间输入框
-        self.time_entries_frame = tk.Frame(input_frame, bg=theme['bg_color'])
-        self.time_entries_frame.grid(row=8, column=0, columnspan=2, pady=10, sticky='w')
+        # 播放系统提示音
+        reminder_window.bell()
+
+    def load_tea_records(self):
+        """加载茶记录"""
+        return self.store.load_tea_records()
+    
+    def skip_current_pour(self, session_id):
+        """提前结束某个冲泡会话的当前倒茶"""
+        session = self.brewing.get(session_id)
+        if session is None:
+            return
         
-        self.time_entries = []
-        self.update_time_entries()
+        # 显示确认对话框
+        result = messagebox.askyesno(
+            "确认提前结束",
+            f"确定要提前结束 '{session.name}' 的本次倒茶吗？\n将立即进入下一次倒茶或结束冲泡。",
+            icon='question'
+        )
         
-        # 绑定倒茶次数变化事件
-        self.pour_count_var.trace('w', lambda *args: self.update_time_entries())
+        if result:
+            # 立即触发当前倒茶的截止任务
+            self.brewing.skip(session_id)
+    
+    def cancel_brewing(self, session_id):
+        """取消某个冲泡会话（确认后写入取消事件，面板随会话移除）"""
+        session = self.brewing.get(session_id)
+        if session is None:
+            return
         
-        # 按钮框架
-        button_frame = tk.Frame(scrollable_frame, bg=theme['bg_color'])
-        button_frame.pack(pady=30)
+        result = messagebox.askyesno(
+            "确认取消冲泡",
+            f"确定要取消 '{session.name}' 的冲泡吗？\n取消后不会再提醒倒茶，也不会保存茶记。",
+            icon='warning'
+        )
         
-        # 保存按钮
-        save_button = tk.Button(
-            button_frame,
-            text="💾 保存茶种",
-            font=(theme['font_family'], 14, "bold"),
-            bg=theme['button_color_3'],
-            fg='white',
-            width=12,
-            height=2,
-            command=self.save_tea_instance
-        )
-        save_button.pack(side='left', padx=10)
-        
-        # 返回按钮
-        back_button = tk.Button(
-            button_frame,
-            text="🔙 返回主页",
-            font=(theme['font_family'], 14, "bold"),
-            bg=theme['button_color_4'],
-            fg='white',
-            width=12,
-            height=2,
-            command=self.create_main_interface
-        )
-        back_button.pack(side='left', padx=10)
-        
-        # 配置滚动
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
-        # 绑定鼠标滚轮
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
-
-    def update_time_entries(self):
-        """更新时间输入框"""
-        # 清空现有的时间输入框
-        for widget in self.time_entries_frame.winfo_children():
-            widget.destroy()
-        
-        # 获取当前主题配置
-        theme = self.get_theme_config()
-        
-        self.time_entries = []
-        count = self.pour_count_var.get()
-        
-        tk.Label(self.time_entries_frame, text="各次倒茶时间间隔:", font=(theme['font_family'], 10, "bold"), bg=theme['bg_color'], fg=theme['text_color']).grid(row=0, column=0, columnspan=4, sticky='w', pady=5)
-        
-        for i in range(count):
-            tk.Label(self.time_entries_frame, text=f"第{i+1}次:", font=(theme['font_family'], 10), bg=theme['bg_color'], fg=theme['text_color_2']).grid(row=i+1, column=0, sticky='w', pady=2)
-            
-            # 分钟输入
-            minutes_var = tk.IntVar(value=0 if i == 0 else 1)
-            minutes_spinbox = tk.Spinbox(self.time_entries_frame, from_=0, to=60, textvariable=minutes_var, font=(theme['font_family'], 10), width=5)
-            minutes_spinbox.grid(row=i+1, column=1, pady=2, padx=2)
-            tk.Label(self.time_entries_frame, text="分", font=(theme['font_family'], 10), bg=theme['bg_color'], fg=theme['text_color_2']).grid(row=i+1, column=2, sticky='w', pady=2)
-            
-            # 秒数输入
-            seconds_var = tk.IntVar(value=30 if i == 0 else 0)
-            seconds_spinbox = tk.Spinbox(self.time_entries_frame, from_=0, to=59, textvariable=seconds_var, font=(theme['font_family'], 10), width=5)
-            seconds_spinbox.grid(row=i+1, column=3, pady=2, padx=2)
-            tk.Label(self.time_entries_frame, text="秒", font=(theme['font_family'], 10), bg=theme['bg_color'], fg=theme['text_color_2']).grid(row=i+1, column=4, sticky='w', pady=2)
-            
-            self.time_entries.append({'minutes': minutes_var, 'seconds': seconds_var})
-
-    def save_tea_instance(self):
-        """保存茶种实例"""
-        try:
-            # 获取输入数据
-            tea_name = self.tea_name_entry.get().strip()
-            if not tea_name:
-                messagebox.showerror("错误", "请输入茶叶名称！")
-                return
-            
-            water_temp = self.water_temp_entry.get().strip()
-            if not water_temp:
-                messagebox.showerror("错误", "请输入冲泡水温！")
-                return
-            
-            tea_ware = self.tea_ware_entry.get().strip()
-            if not tea_ware:
-                messagebox.showerror("错误", "请输入使用的茶具！")
-                return
-            
-            water_amount = self.water_amount_entry.get().strip()
-            if not water_amount:
-                messagebox.showerror("错误", "请输入水量！")
-                return
-            
-            tea_weight = self.tea_weight_entry.get().strip()
-            if not tea_weight:
-                messagebox.showerror("错误", "请输入茶叶重量！")
-                return
-            
-            # 获取倒茶时间
-            pour_times = []
-            for i, time_entry in enumerate(self.time_entries):
-                minutes = time_entry['minutes'].get()
-                seconds = time_entry['seconds'].get()
-                total_seconds = minutes * 60 + seconds
-                if total_seconds <= 0:
-                    messagebox.showerror("错误", f"第{i+1}次倒茶时间必须大于0！")
-                    return
-                pour_times.append(total_seconds)
-            
-            # 创建茶种数据
-            tea_data = {
-                "name": tea_name,
-                "water_temp": water_temp,
-                "tea_ware": tea_ware,
-                "water_amount": water_amount,
-                "tea_weight": tea_weight,
-                "add_milk": self.add_milk_var.get(),
-                "pour_count": self.pour_count_var.get(),
-                "pour_times": pour_times,
-                "created_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
-            
-            # 保存到文件
-            filename = f"tea_{tea_name.replace(' ', '_')}.json"
-            filepath = os.path.join(self.tea_closet_path, filename)
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(tea_data, f, ensure_ascii=False, indent=2)
-            
-            messagebox.showinfo("成功", f"茶种 '{tea_name}' 已成功保存到茶柜！")
-            self.create_main_interface()
-            
-        except Exception as e:
-            messagebox.showerror("错误", f"保存失败：{str(e)}")
-
-    def show_tea_closet_page(self):
-        """显示茶柜页面"""
-        # 停止所有定时器并清理状态
-        self.stop_all_timers()
-        
-        # 清空窗口
-        try:
-            for widget in self.root.winfo_children():
-                widget.destroy()
-        except tk.TclError:
-            pass
-        
-        # 获取当前主题配置
-        theme = self.get_theme_config()
-        
-        # 标题
-        title_label = tk.Label(
-            self.root,
-            text="🗄️ 我的茶柜",
-            font=(theme['title_font'], 20, "bold"),
-            bg=theme['bg_color'],
-            fg=theme['text_color']
-        )
-        title_label.pack(pady=20)
-        
-        # 茶种列表框架
-        list_frame = tk.Frame(self.root, bg=theme['bg_color'])
-        list_frame.pack(padx=50, pady=20, fill='both', expand=True)
-        
-        # 创建列表框和滚动条
-        listbox_frame = tk.Frame(list_frame, bg=theme['bg_color'])
-        listbox_frame.pack(fill='both', expand=True)
-        
-        scrollbar = tk.Scrollbar(listbox_frame)
-        scrollbar.pack(side='right', fill='y')
-        
-        self.tea_listbox = tk.Listbox(
-            listbox_frame,
-            font=(theme['font_family'], 12),
-            yscrollcommand=scrollbar.set,
-            selectmode='single',
-            height=15,
-            bg=theme['text_color_3'],
-            fg=theme['bg_color']
-        )
-        self.tea_listbox.pack(side='left', fill='both', expand=True)
-        scrollbar.config(command=self.tea_listbox.yview)
-        
-        # 加载茶种列表
-        self.load_tea_list()
-        
-        # 按钮框架
-        button_frame = tk.Frame(self.root, bg=theme['bg_color'])
-        button_frame.pack(pady=20)
-        
-        # 查看详情按钮
-        view_button = tk.Button(
-            button_frame,
-            text="👁️ 查看详情",
-            font=(theme['font_family'], 12, "bold"),
-            bg=theme['button_color_5'],
-            fg='white',
-            width=12,
-            command=self.view_tea_details
-        )
-        view_button.pack(side='left', padx=10)
-        
-        # 开始冲泡按钮
-        brew_button = tk.Button(
-            button_frame,
-            text="☕ 开始冲泡",
-            font=(theme['font_family'], 12, "bold"),
-            bg=theme['button_color'],
-            fg='white',
-            width=12,
-            command=self.start_brewing
-        )
-        brew_button.pack(side='left', padx=10)
-        
-        # 删除茶种按钮
-        delete_button = tk.Button(
-            button_frame,
-            text="🗑️ 删除茶种",
-            font=(theme['font_family'], 12, "bold"),
-            bg=theme['button_color_4'],
-            fg='white',
-            width=12,
-            command=self.delete_tea
-        )
-        delete_button.pack(side='left', padx=10)
-        
-        # 返回按钮
-        back_button = tk.Button(
-            button_frame,
-            text="🔙 返回主页",
-            font=(theme['font_family'], 12, "bold"),
-            bg=theme['button_color_6'],
-            fg='white',
-            width=12,
-            command=self.create_main_interface
-        )
-        back_button.pack(side='left', padx=10)
-
-    def load_tea_list(self):
-        """加载茶种列表"""
-        self.tea_listbox.delete(0, tk.END)
-        self.tea_files = []
-        
-        try:
-            for filename in os.listdir(self.tea_closet_path):
-                if filename.endswith('.json') and filename.startswith('tea_'):
-                    filepath = os.path.join(self.tea_closet_path, filename)
-                    try:
-                        with open(filepath, 'r', encoding='utf-8') as f:
-                            tea_data = json.load(f)
-                        
-                        display_text = f"🍵 {tea_data['name']} - {tea_data['water_temp']}°C - {tea_data['pour_count']}次倒茶"
-                        self.tea_listbox.insert(tk.END, display_text)
-                        self.tea_files.append(filepath)
-                    except Exception as e:
-                        print(f"加载茶种文件 {filename} 失败: {e}")
-            
-            if not self.tea_files:
-                self.tea_listbox.insert(tk.END, "暂无茶种，请先创建茶种实例")
-                
-        except Exception as e:
-            messagebox.showerror("错误", f"加载茶柜失败：{str(e)}")
-
-    def view_tea_details(self):
-        """查看茶种详情"""
-        selection = self.tea_listbox.curselection()
-        if not selection:
-            messagebox.showwarning("提示", "请先选择一个茶种！")
-            return
-        
-        try:
-            filepath = self.tea_files[selection[0]]
-            with open(filepath, 'r', encoding='utf-8') as f:
-                tea_data = json.load(f)
-            
-            # 获取当前主题配置
-            theme = self.get_theme_config()
-            
-            # 创建详情窗口
-            detail_window = tk.Toplevel(self.root)
-            detail_window.title(f"茶种详情 - {tea_data['name']}")
-            detail_window.geometry("500x600")
-            detail_window.configure(bg=theme['bg_color'])
-            # 注册弹窗以支持 ESC 关闭（Toplevel window register）
-            self.register_toplevel(detail_window)
-            
-            # 详情内容
-            detail_text = f"""
-🍵 茶叶名称: {tea_data['name']}
-🌡️ 冲泡水温: {tea_data['water_temp']}°C
-🫖 使用茶具: {tea_data['tea_ware']}
-💧 水量: {tea_data['water_amount']}ml
-⚖️ 茶叶重量: {tea_data.get('tea_weight', '未设置')}g
-🥛 是否加奶: {'是' if tea_data['add_milk'] else '否'}
-🔢 倒茶次数: {tea_data['pour_count']}次
-
-⏰ 倒茶时间安排:
-"""
-            
-            for i, pour_time in enumerate(tea_data['pour_times']):
-                minutes = pour_time // 60
-                seconds = pour_time % 60
-                if minutes > 0:
-                    time_str = f"{minutes}分{seconds}秒" if seconds > 0 else f"{minutes}分"
-                else:
-                    time_str = f"{seconds}秒"
-                detail_text += f"   第{i+1}次: {time_str}后\n"
-            
-            detail_text += f"\n📅 创建时间: {tea_data['created_time']}"
-            
-            text_widget = tk.Text(
-                detail_window,
-                font=(theme['font_family'], 12),
-                bg=theme['text_color_3'],
-                fg=theme['bg_color'],
-                wrap='word',
-                padx=20,
-                pady=20
-            )
-            text_widget.pack(fill='both', expand=True, padx=20, pady=20)
-            text_widget.insert('1.0', detail_text)
-            text_widget.config(state='disabled')
-            
-        except Exception as e:
-            messagebox.showerror("错误", f"查看详情失败：{str(e)}")
-
-    def start_brewing(self):
-        """开始冲泡"""
-        selection = self.tea_listbox.curselection()
-        if not selection:
-            messagebox.showwarning("提示", "请先选择一个茶种！")
-            return
-        
-        try:
-            filepath = self.tea_files[selection[0]]
-            with open(filepath, 'r', encoding='utf-8') as f:
-                tea_data = json.load(f)
-            
-            # 确认开始冲泡
-            result = messagebox.askyesno(
-                "开始冲泡",
-                f"确定要开始冲泡 '{tea_data['name']}' 吗？\n\n"
-                f"水温: {tea_data['water_temp']}°C\n"
-                f"茶具: {tea_data['tea_ware']}\n"
-                f"水量: {tea_data['water_amount']}ml\n"
-                f"倒茶次数: {tea_data['pour_count']}次\n"
-                f"是否加奶: {'是' if tea_data['add_milk'] else '否'}"
-            )
-            
-            if result:
-                # 停止之前的定时器
-                self.stop_all_timers()
-                
-                # 开始新的冲泡定时器
-                self.start_brewing_timers(tea_data)
-                messagebox.showinfo("开始冲泡", f"'{tea_data['name']}' 冲泡计时已开始！\n请准备好茶具和热水。")
-                
-        except Exception as e:
-            messagebox.showerror("错误", f"开始冲泡失败：{str(e)}")
-
-    def start_brewing_timers(self, tea_data):
-        """启动冲泡定时器"""
-        # 更新冲泡状态
-        self.brewing_status['is_brewing'] = True
-        self.brewing_status['tea_data'] = tea_data
-        self.brewing_status['current_pour'] = 1
-        self.brewing_status['start_time'] = time.time()
-        self.brewing_status['skip_current'] = False
-        
-        def timer_thread():
-            for i, pour_time in enumerate(tea_data['pour_times']):
-                # 更新下次倒茶时间
-                self.brewing_status['next_pour_time'] = time.time() + pour_time
-                self.brewing_status['current_pour'] = i + 1
-                
-                # 更新边栏显示
-                self.root.after(0, self.update_sidebar_display)
-                
-                # 等待指定时间，但要检查跳过标志
-                start_time = time.time()
-                while time.time() - start_time < pour_time:
-                    if self.brewing_status['skip_current']:
-                        # 重置跳过标志
-                        self.brewing_status['skip_current'] = False
-                        break
-                    time.sleep(0.1)  # 短暂休眠，避免CPU占用过高
-                
-                # 在主线程中显示提醒
-                self.root.after(0, lambda i=i: self.show_brewing_reminder(tea_data, i+1))
-            
-            # 冲泡完成，重置状态
-            self.brewing_status['is_brewing'] = False
-            self.brewing_status['tea_data'] = None
-            self.brewing_status['current_pour'] = 0
-            self.brewing_status['next_pour_time'] = None
-            self.brewing_status['skip_current'] = False
-            self.root.after(0, self.update_sidebar_display)
-            
-            # 冲泡完成后显示评价界面
-            self.root.after(1000, lambda: self.show_tea_evaluation(tea_data))
-        
-        # 在新线程中运行定时器
-        timer = threading.Thread(target=timer_thread, daemon=True)
-        timer.start()
-        self.active_timers.append(timer)
-
-    def show_brewing_reminder(self, tea_data, pour_number):
-        """显示冲泡提醒"""
-        # 获取当前主题配置
-        theme = self.get_theme_config()
-        
-        # 创建提醒窗口
-        reminder_window = tk.Toplevel(self.root)
-        reminder_window.title("冲泡提醒")
-        reminder_window.geometry("400x300")
-        reminder_window.configure(bg=theme['text_color_2'])
-        # 注册弹窗以支持 ESC 关闭（Toplevel window register）
-        self.register_toplevel(reminder_window)
-        
-        # 置顶显示
-        reminder_window.attributes('-topmost', True)
-        
-        # 居中显示
-        reminder_window.transient(self.root)
-        reminder_window.grab_set()
-        
-        # 提醒内容
-        tk.Label(
-            reminder_window,
-            text="⏰ 冲泡提醒 ⏰",
-            font=(theme['title_font'], 18, "bold"),
-            bg=theme['text_color_2'],
-            fg=theme['bg_color']
-        ).pack(pady=20)
-        
-        tk.Label(
-            reminder_window,
-            text=f"🍵 {tea_data['name']}",
-            font=(theme['font_family'], 16, "bold"),
-            bg=theme['text_color_2'],
-            fg=theme['text_color_3']
-        ).pack(pady=10)
-        
-        tk.Label(
-            reminder_window,
-            text=f"第 {pour_number} 次倒茶",
-            font=(theme['font_family'], 20, "bold"),
-            bg=theme['text_color_2'],
-            fg=theme['button_color_4']
-        ).pack(pady=20)
-        
-        if tea_data['add_milk'] and pour_number == tea_data['pour_count']:
-            tk.Label(
-                reminder_window,
-                text="🥛 记得加奶哦！",
-                font=(theme['font_family'], 14),
-                bg=theme['text_color_2'],
-                fg=theme['button_color_5']
-            ).pack(pady=10)
-        
-        # 确认按钮
-        tk.Button(
-            reminder_window,
-            text="✅ 已完成",
-            font=(theme['font_family'], 14, "bold"),
-            bg=theme['button_color_3'],
-            fg='white',
-            width=10,
-            command=reminder_window.destroy
-        ).pack(pady=20)
-        
-        # 播放系统提示音
-        reminder_window.bell()
-
-    def show_tea_evaluation(self, tea_data):
-        """显示茶叶评价界面"""
-        theme = self.get_theme_config()
-        
-        # 创建评价窗口
-        eval_window = tk.Toplevel(self.root)
-        eval_window.title("茶记评价")
-        # 注册弹窗以支持 ESC 关闭（Toplevel window register）
-        self.register_toplevel(eval_window)
-        
-        # 获取屏幕尺寸
-        screen_width = eval_window.winfo_screenwidth()
-        screen_height = eval_window.winfo_screenheight()
-        
-        # 设置评价窗口最佳尺寸
-        window_width = 600
-        window_height = 750
-        
-        # 计算窗口居中位置
-        x = (screen_width - window_width) // 2
-        y = (screen_height - window_height) // 2
-        
-        # 设置窗口大小和位置
-        eval_window.geometry(f"{window_width}x{window_height}+{x}+{y}")
-        
-        # 设置窗口大小限制
-        eval_window.minsize(550, 700)
-        eval_window.maxsize(700, 850)
-        
-        eval_window.configure(bg=theme['text_color_2'])
-        
-        # 设置背景
-        self.setup_background(eval_window)
-        
-        # 置顶显示
-        eval_window.attributes('-topmost', True)
-        eval_window.transient(self.root)
-        eval_window.grab_set()
-        
-        # 主框架
-        main_frame = tk.Frame(eval_window, bg='#F5F5DC', relief='raised', bd=3)
-        main_frame.pack(fill='both', expand=True, padx=20, pady=20)
-        
-        # 标题
-        title_label = tk.Label(
-            main_frame,
-            text="🍵 茶记评价",
-            font=(theme['title_font'], 20, "bold"),
-            bg='#F5F5DC',
-            fg='#8B4513'
-        )
-        title_label.pack(pady=20)
-        
-        # 茶种信息
-        tea_info_label = tk.Label(
-            main_frame,
-            text=f"茶种：{tea_data['name']}",
-            font=(theme['font_family'], 14, "bold"),
-            bg='#F5F5DC',
-            fg='#2F4F2F'
-        )
-        tea_info_label.pack(pady=10)
-        
-        # 美味值评分
-        rating_frame = tk.Frame(main_frame, bg='#F5F5DC')
-        rating_frame.pack(pady=20)
-        
-        tk.Label(
-            rating_frame,
-            text="美味值评分 (1-10星):",
-            font=(theme['font_family'], 14, "bold"),
-            bg='#F5F5DC',
-            fg='#8B4513'
-        ).pack()
-        
-        # 星级评分
-        star_frame = tk.Frame(rating_frame, bg='#F5F5DC')
-        star_frame.pack(pady=10)
-        
-        self.rating_var = tk.IntVar(value=5)
-        self.star_buttons = []
-        
-        for i in range(1, 11):
-            star_btn = tk.Button(
-                star_frame,
-                text="⭐",
-                font=("Arial", 16),
-                bg='#F5F5DC',
-                fg='#FFD700' if i <= 5 else '#D3D3D3',
-                relief='flat',
-                bd=0,
-                command=lambda x=i: self.update_rating(x)
-            )
-            star_btn.pack(side='left', padx=2)
-            self.star_buttons.append(star_btn)
-        
-        # 评分显示
-        self.rating_display = tk.Label(
-            rating_frame,
-            text="当前评分: 5/10",
-            font=(theme['font_family'], 12),
-            bg='#F5F5DC',
-            fg='#8B4513'
-        )
-        self.rating_display.pack(pady=5)
-        
-        # 图片上传区域
-        image_frame = tk.Frame(main_frame, bg='#F5F5DC')
-        image_frame.pack(pady=10, fill='x')
-        
-        tk.Label(
-            image_frame,
-            text="茶记图片:",
-            font=(theme['font_family'], 14, "bold"),
-            bg='#F5F5DC',
-            fg='#8B4513'
-        ).pack(anchor='w')
-        
-        # 图片选择按钮
-        image_button_frame = tk.Frame(image_frame, bg='#F5F5DC')
-        image_button_frame.pack(fill='x', pady=5)
-        
-        self.selected_image_path = None
-        self.image_preview_label = None
-        
-        select_image_btn = tk.Button(
-            image_button_frame,
-            text="📷 添加图片",
-            font=(theme['font_family'], 12, "bold"),
-            bg='#4169E1',
-            fg='white',
-            activebackground='#6495ED',
-            relief='raised',
-            bd=2,
-            padx=15,
-            pady=5,
-            command=self.select_image
-        )
-        select_image_btn.pack(side='left', padx=5)
-        
-        # 清除图片按钮
-        self.clear_image_btn = tk.Button(
-            image_button_frame,
-            text="🗑️ 清除图片",
-            font=(theme['font_family'], 12),
-            bg='#DC143C',
-            fg='white',
-            activebackground='#FF6347',
-            relief='raised',
-            bd=2,
-            padx=15,
-            pady=5,
-            command=self.clear_selected_image,
-            state='disabled'
-        )
-        self.clear_image_btn.pack(side='left', padx=5)
-        
-        # 图片预览区域
-        self.image_preview_frame = tk.Frame(image_frame, bg='#F5F5DC', relief='sunken', bd=2)
-        self.image_preview_frame.pack(fill='x', pady=5)
-        
-        # 笔记输入
-        notes_frame = tk.Frame(main_frame, bg='#F5F5DC')
-        notes_frame.pack(pady=10, fill='both', expand=True)
-        
-        tk.Label(
-            notes_frame,
-            text="品茶笔记:",
-            font=(theme['font_family'], 14, "bold"),
-            bg='#F5F5DC',
-            fg='#8B4513'
-        ).pack(anchor='w')
-        
-        self.notes_text = tk.Text(
-            notes_frame,
-            height=6,
-            width=50,
-            font=(theme['font_family'], 11),
-            bg='#FFFAF0',
-            fg='#2F4F2F',
-            relief='sunken',
-            bd=2,
-            wrap='word'
-        )
-        self.notes_text.pack(pady=10, fill='both', expand=True)
-        
-        # 按钮框架
-        button_frame = tk.Frame(main_frame, bg='#F5F5DC')
-        button_frame.pack(pady=20)
-        
-        # 保存按钮
-        save_btn = tk.Button(
-            button_frame,
-            text="💾 保存茶记",
-            font=(theme['font_family'], 14, "bold"),
-            bg='#228B22',
-            fg='white',
-            activebackground='#32CD32',
-            relief='raised',
-            bd=3,
-            padx=20,
-            pady=10,
-            command=lambda: self.save_tea_record(tea_data, eval_window)
-        )
-        save_btn.pack(side='left', padx=10)
-        
-        # 取消按钮
-        cancel_btn = tk.Button(
-            button_frame,
-            text="❌ 取消",
-            font=(theme['font_family'], 14, "bold"),
-            bg='#DC143C',
-            fg='white',
-            activebackground='#FF6347',
-            relief='raised',
-            bd=3,
-            padx=20,
-            pady=10,
-            command=eval_window.destroy
-        )
-        cancel_btn.pack(side='left', padx=10)
-    
-    def update_rating(self, rating):
-        """更新星级评分"""
-        self.rating_var.set(rating)
-        
-        # 更新星星显示
-        for i, btn in enumerate(self.star_buttons):
-            if i < rating:
-                btn.config(fg='#FFD700')  # 金色
-            else:
-                btn.config(fg='#D3D3D3')  # 灰色
-        
-        # 更新评分显示
-        self.rating_display.config(text=f"当前评分: {rating}/10")
-    
-    def select_image(self):
-        """选择图片文件"""
-        file_types = [
-            ("图片文件", "*.jpg *.jpeg *.png *.gif *.bmp"),
-            ("JPEG文件", "*.jpg *.jpeg"),
-            ("PNG文件", "*.png"),
-            ("GIF文件", "*.gif"),
-            ("所有文件", "*.*")
-        ]
-        
-        file_path = filedialog.askopenfilename(
-            title="选择茶记图片",
-            filetypes=file_types
-        )
-        
-        if file_path:
-            self.selected_image_path = file_path
-            self.show_image_preview()
-            self.clear_image_btn.config(state='normal')
-    
-    def clear_selected_image(self):
-        """清除选中的图片"""
-        self.selected_image_path = None
-        self.clear_image_preview()
-        self.clear_image_btn.config(state='disabled')
-    
-    def show_image_preview(self):
-        """显示图片预览"""
-        if not self.selected_image_path:
-            return
-        
-        try:
-            # 清除之前的预览
-            self.clear_image_preview()
-            
-            # 加载并调整图片大小
-            image = Image.open(self.selected_image_path)
-            
-            # 计算缩放比例，保持宽高比
-            max_width, max_height = 300, 200
-            image.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
-            
-            # 转换为PhotoImage
-            photo = ImageTk.PhotoImage(image)
-            
-            # 创建预览标签
-            self.image_preview_label = tk.Label(
-                self.image_preview_frame,
-                image=photo,
-                bg='#F5F5DC'
-            )
-            self.image_preview_label.image = photo  # 保持引用
-            self.image_preview_label.pack(pady=10)
-            
-            # 显示文件名
-            filename = os.path.basename(self.selected_image_path)
-            filename_label = tk.Label(
-                self.image_preview_frame,
-                text=f"已选择: {filename}",
-                font=('Arial', 10),
-                bg='#F5F5DC',
-                fg='#666666'
-            )
-            filename_label.pack()
-            
-        except Exception as e:
-            messagebox.showerror("错误", f"无法加载图片: {str(e)}")
-            self.selected_image_path = None
-            self.clear_image_btn.config(state='disabled')
-    
-    def clear_image_preview(self):
-        """清除图片预览"""
-        for widget in self.image_preview_frame.winfo_children():
-            widget.destroy()
-    
-    def save_tea_record(self, tea_data, eval_window):
-        """保存茶记录"""
-        rating = self.rating_var.get()
-        notes = self.notes_text.get("1.0", tk.END).strip()
-        
-        if not notes:
-            messagebox.showwarning("提示", "请输入品茶笔记！")
-            return
-        
-        # 处理图片保存（Image save）
-        # 中文说明：使用 getattr 安全获取 selected_image_path，避免未选择图片时出现 AttributeError。
-        # 专业术语：AttributeError, getattr, fallback
-        image_filename = None
-        selected_image_path = getattr(self, 'selected_image_path', None)
-        if selected_image_path:
-            try:
-                # 生成唯一的图片文件名（timestamp + 原扩展名）
-                timestamp = str(int(time.time() * 1000))
-                file_extension = os.path.splitext(selected_image_path)[1]
-                image_filename = f"tea_image_{timestamp}{file_extension}"
-                
-                # 复制图片到 images 文件夹（copy2 保留 metadata）
-                images_dir = os.path.join(self.record_path, 'images')
-                destination_path = os.path.join(images_dir, image_filename)
-                shutil.copy2(selected_image_path, destination_path)
-            except Exception as e:
-                messagebox.showerror("错误", f"保存图片失败: {str(e)}")
-                return
-        
-        # 创建记录（Record create）
-        # 中文说明：使用 dict.get 安全读取可能不存在的字段（如 intervals），避免 KeyError 导致无法保存。
-        try:
-            record = {
-                'id': str(int(time.time() * 1000)),  # 使用时间戳作为ID
-                'tea_name': tea_data['name'],
-                'rating': int(rating) if isinstance(rating, (int, float)) else 0,
-                'notes': notes,
-                'brewing_time': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                'pour_count': tea_data.get('pour_count', 0),
-                'add_milk': tea_data.get('add_milk', False),
-                'image_filename': image_filename,  # 添加图片文件名
-                'brewing_params': {
-                    'pour_times': tea_data.get('pour_times', []),
-                    'intervals': tea_data.get('intervals', [])
-                }
-            }
-        except Exception as e:
-            messagebox.showerror("错误", f"创建茶记录失败：{str(e)}")
-            return
-        
-        # 读取现有记录
-        records = self.load_tea_records()
-        records.append(record)
-        
-        # 保存记录
-        try:
-            with open(self.tea_records_path, 'w', encoding='utf-8') as f:
-                json.dump(records, f, ensure_ascii=False, indent=2)
-            
-            messagebox.showinfo("成功", "茶记保存成功！")
-            eval_window.destroy()
-            # 保存成功后，重置选中的图片路径，避免下次误用（cleanup）╰(°▽°)╯
-            try:
-                self.selected_image_path = None
-            except Exception:
-                pass
-        except Exception as e:
-            messagebox.showerror("错误", f"保存失败：{str(e)}")
-    
-    def load_tea_records(self):
-        """加载茶记录"""
-        if not os.path.exists(self.tea_records_path):
-            return []
-        
-        try:
-            with open(self.tea_records_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception:
-            return []
-    
-    def show_tea_notes_page(self):
-        """显示茶记页面"""
-        # 清除现有内容
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        
-        # 重新加载和设置背景
-        self.load_background_image()
-        self.setup_background(self.root)
-        
-        # 获取主题配置
-        theme = self.get_theme_config()
-        
-        # 主容器
-        main_container = tk.Frame(self.root, bg='#F5F5DC', relief='raised', bd=3)
-        main_container.pack(fill='both', expand=True, padx=20, pady=20)
-        
-        # 标题框架
-        title_frame = tk.Frame(main_container, bg='#DEB887', relief='groove', bd=2)
-        title_frame.pack(fill='x', pady=(0, 20))
-        
-        title_label = tk.Label(
-            title_frame,
-            text="📝 茶记管理",
-            font=(theme['title_font'], 24, "bold"),
-            bg='#DEB887',
-            fg='#8B4513',
-            pady=15
-        )
-        title_label.pack()
-        
-        # 内容框架
-        content_frame = tk.Frame(main_container, bg='#F5F5DC')
-        content_frame.pack(fill='both', expand=True)
-        
-        # 左侧：记录列表
-        left_frame = tk.Frame(content_frame, bg='#F5F5DC', relief='sunken', bd=2)
-        left_frame.pack(side='left', fill='both', expand=True, padx=(0, 10))
-        
-        # 列表标题
-        list_title = tk.Label(
-            left_frame,
-            text="历史茶记",
-            font=(theme['font_family'], 16, "bold"),
-            bg='#F5F5DC',
-            fg='#8B4513'
-        )
-        list_title.pack(pady=10)
-        
-        # 记录列表框架
-        list_frame = tk.Frame(left_frame, bg='#F5F5DC')
-        list_frame.pack(fill='both', expand=True, padx=10, pady=10)
-        
-        # 滚动条
-        scrollbar = tk.Scrollbar(list_frame)
-        scrollbar.pack(side='right', fill='y')
-        
-        # 列表框
-        self.records_listbox = tk.Listbox(
-            list_frame,
-            font=(theme['font_family'], 11),
-            bg='#FFFAF0',
-            fg='#2F4F2F',
-            selectbackground='#DEB887',
-            yscrollcommand=scrollbar.set,
-            height=15
-        )
-        self.records_listbox.pack(side='left', fill='both', expand=True)
-        scrollbar.config(command=self.records_listbox.yview)
-        
-        # 右侧：详情和操作
-        right_frame = tk.Frame(content_frame, bg='#F5F5DC', relief='sunken', bd=2)
-        right_frame.pack(side='right', fill='both', expand=True, padx=(10, 0))
-        
-        # 详情标题
-        detail_title = tk.Label(
-            right_frame,
-            text="茶记详情",
-            font=(theme['font_family'], 16, "bold"),
-            bg='#F5F5DC',
-            fg='#8B4513'
-        )
-        detail_title.pack(pady=10)
-        
-        # 详情显示区域容器
-        detail_container = tk.Frame(right_frame, bg='#F5F5DC')
-        detail_container.pack(pady=10, padx=10, fill='both', expand=True)
-        
-        # 图片显示区域
-        self.image_display_frame = tk.Frame(detail_container, bg='#FFFAF0', relief='sunken', bd=2)
-        self.image_display_frame.pack(fill='x', pady=(0, 10))
-        
-        # 文字详情显示区域
-        self.detail_text = tk.Text(
-            detail_container,
-            height=10,
-            width=40,
-            font=(theme['font_family'], 11),
-            bg='#FFFAF0',
-            fg='#2F4F2F',
-            relief='sunken',
-            bd=2,
-            wrap='word',
-            state='disabled'
-        )
-        self.detail_text.pack(fill='both', expand=True)
-        
-        # 操作按钮框架
-        button_frame = tk.Frame(right_frame, bg='#F5F5DC')
-        button_frame.pack(pady=20)
-        
-        # 查看趋势按钮
-        trend_btn = tk.Button(
-            button_frame,
-            text="📊 查看趋势",
-            font=(theme['font_family'], 12, "bold"),
-            bg='#4169E1',
-            fg='white',
-            activebackground='#6495ED',
-            relief='raised',
-            bd=3,
-            padx=15,
-            pady=8,
-            command=lambda: messagebox.showinfo("功能提示", "趋势分析功能正在开发中...")
-        )
-        trend_btn.pack(pady=5, fill='x')
-        
-        # 另存为按钮
-        save_as_btn = tk.Button(
-            button_frame,
-            text="💾 另存为",
-            font=(theme['font_family'], 12, "bold"),
-            bg='#FF8C00',
-            fg='white',
-            activebackground='#FFA500',
-            relief='raised',
-            bd=3,
-            padx=15,
-            pady=8,
-            command=self.save_record_as
-        )
-        save_as_btn.pack(pady=5, fill='x')
-        
-        # 删除记录按钮
-        delete_btn = tk.Button(
-            button_frame,
-            text="🗑️ 删除记录",
-            font=(theme['font_family'], 12, "bold"),
-            bg='#DC143C',
-            fg='white',
-            activebackground='#FF6347',
-            relief='raised',
-            bd=3,
-            padx=15,
-            pady=8,
-            command=self.delete_tea_record
-        )
-        delete_btn.pack(pady=5, fill='x')
-        
-        # 生成日报告按钮
-        daily_report_btn = tk.Button(
-            button_frame,
-            text="📊 生成日报告",
-            font=(theme['font_family'], 12, "bold"),
-            bg='#9370DB',
-            fg='white',
-            activebackground='#BA55D3',
-            relief='raised',
-            bd=3,
-            padx=15,
-            pady=8,
-            command=self.generate_daily_report
-        )
-        daily_report_btn.pack(pady=5, fill='x')
-        
-        # 返回按钮
-        back_btn = tk.Button(
-            button_frame,
-            text="🏠 返回首页",
-            font=(theme['font_family'], 12, "bold"),
-            bg='#228B22',
-            fg='white',
-            activebackground='#32CD32',
-            relief='raised',
-            bd=3,
-            padx=15,
-            pady=8,
-            command=self.create_main_interface
-        )
-        back_btn.pack(pady=5, fill='x')
-        
-        # 绑定列表选择事件
-        self.records_listbox.bind('<<ListboxSelect>>', self.on_record_select)
-        
-        # 加载茶记录
-        self.load_records_list()
-    
-    def load_records_list(self):
-        """加载茶记录列表"""
-        self.records_listbox.delete(0, tk.END)
-        records = self.load_tea_records()
-        
-        # 按时间倒序排列
-        records.sort(key=lambda x: x['brewing_time'], reverse=True)
-        
-        for record in records:
-            # 格式化显示
-            stars = "⭐" * record['rating']
-            display_text = f"{record['brewing_time'][:10]} | {record['tea_name']} | {stars} ({record['rating']}/10)"
-            self.records_listbox.insert(tk.END, display_text)
-        
-        # 存储记录数据供后续使用
-        self.current_records = records
-    
-    def on_record_select(self, event):
-        """处理记录选择事件"""
-        selection = self.records_listbox.curselection()
-        if not selection:
-            return
-        
-        index = selection[0]
-        if index >= len(self.current_records):
-            return
-        
-        record = self.current_records[index]
-        self.selected_record = record  # 保存选中的记录
-        
-        # 清除之前的图片显示
-        for widget in self.image_display_frame.winfo_children():
-            widget.destroy()
-        
-        # 显示图片（如果有）
-        if record.get('image_filename'):
-            self.display_record_image(record['image_filename'])
-        
-        # 显示详情
-        self.detail_text.config(state='normal')
-        self.detail_text.delete('1.0', tk.END)
-        
-        detail_info = f"""茶种名称: {record['tea_name']}
-冲泡时间: {record['brewing_time']}
-美味评分: {"⭐" * record['rating']} ({record['rating']}/10)
-冲泡次数: {record['pour_count']}次
-是否加奶: {'是' if record['add_milk'] else '否'}
-
-品茶笔记:
-{record['notes']}
-
-冲泡参数:
-倒茶时间: {', '.join(map(str, record['brewing_params']['pour_times']))}秒
-间隔时间: {', '.join(map(str, record['brewing_params']['intervals']))}秒
-"""
-        
-        self.detail_text.insert('1.0', detail_info)
-        self.detail_text.config(state='disabled')
-    
-    def display_record_image(self, image_filename):
-        """显示茶记录中的图片"""
-        try:
-            image_path = os.path.join(self.record_path, 'images', image_filename)
-            if not os.path.exists(image_path):
-                return
-            
-            # 加载并调整图片大小
-            image = Image.open(image_path)
-            
-            # 计算缩放比例，保持宽高比
-            max_width, max_height = 250, 150
-            image.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
-            
-            # 转换为PhotoImage
-            photo = ImageTk.PhotoImage(image)
-            
-            # 创建图片标签
-            image_label = tk.Label(
-                self.image_display_frame,
-                image=photo,
-                bg='#FFFAF0',
-                cursor='hand2'
-            )
-            image_label.image = photo  # 保持引用
-            image_label.pack(pady=10)
-            
-            # 绑定点击事件查看大图
-            image_label.bind('<Button-1>', lambda e: self.show_full_image(image_path))
-            
-            # 添加提示文字
-            tip_label = tk.Label(
-                self.image_display_frame,
-                text="点击图片查看大图",
-                font=('Arial', 9),
-                bg='#FFFAF0',
-                fg='#666666'
-            )
-            tip_label.pack()
-            
-        except Exception as e:
-            print(f"显示图片失败: {str(e)}")
-    
-    def show_full_image(self, image_path):
-        """显示完整大小的图片"""
-        try:
-            # 创建新窗口
-            image_window = tk.Toplevel(self.root)
-            image_window.title("茶记图片")
-            image_window.configure(bg='#F5F5DC')
-            # 注册弹窗以支持 ESC 关闭（Toplevel window register）
-            self.register_toplevel(image_window)
-            
-            # 加载原始图片
-            image = Image.open(image_path)
-            
-            # 获取屏幕尺寸
-            screen_width = image_window.winfo_screenwidth()
-            screen_height = image_window.winfo_screenheight()
-            
-            # 设置图片查看窗口的最大尺寸（屏幕的80%）
-            max_width = int(screen_width * 0.8)
-            max_height = int(screen_height * 0.8)
-            
-            # 计算最佳显示尺寸
-            display_width = min(image.width, max_width)
-            display_height = min(image.height, max_height)
-            
-            # 如果图片太大，按比例缩放
-            if image.width > max_width or image.height > max_height:
-                # 计算缩放比例
-                width_ratio = max_width / image.width
-                height_ratio = max_height / image.height
-                scale_ratio = min(width_ratio, height_ratio)
-                
-                # 计算新尺寸
-                new_width = int(image.width * scale_ratio)
-                new_height = int(image.height * scale_ratio)
-                
-                # 调整图片大小
-                image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                display_width = new_width
-                display_height = new_height
-            
-            # 转换为PhotoImage
-            photo = ImageTk.PhotoImage(image)
-            
-            # 创建图片标签
-            image_label = tk.Label(image_window, image=photo, bg='#F5F5DC')
-            image_label.image = photo  # 保持引用
-            image_label.pack(padx=20, pady=20)
-            
-            # 设置窗口大小和位置
-            window_width = display_width + 40
-            window_height = display_height + 40
-            
-            # 确保窗口不会超出屏幕
-            window_width = min(window_width, screen_width - 100)
-            window_height = min(window_height, screen_height - 100)
-            
-            # 计算居中位置
-            x = (screen_width - window_width) // 2
-            y = (screen_height - window_height) // 2
-            
-            # 设置窗口大小、位置和限制
-            image_window.geometry(f"{window_width}x{window_height}+{x}+{y}")
-            image_window.minsize(300, 200)  # 最小尺寸
-            image_window.maxsize(screen_width - 50, screen_height - 50)  # 最大尺寸
-            
-        except Exception as e:
-            messagebox.showerror("错误", f"无法显示图片: {str(e)}")
-    
-    def delete_tea_record(self):
-        """删除茶记录"""
-        selection = self.records_listbox.curselection()
-        if not selection:
-            messagebox.showwarning("提示", "请先选择要删除的记录！")
-            return
-        
-        if messagebox.askyesno("确认删除", "确定要删除这条茶记录吗？\n删除后将无法恢复！"):
-            index = selection[0]
-            record_to_delete = self.current_records[index]
-            
-            # 删除关联的图片文件
-            if record_to_delete.get('image_filename'):
-                try:
-                    image_path = os.path.join(self.record_path, 'images', record_to_delete['image_filename'])
-                    if os.path.exists(image_path):
-                        os.remove(image_path)
-                except Exception as e:
-                    print(f"删除图片文件失败: {str(e)}")
-            
-            # 从记录中删除
-            records = self.load_tea_records()
-            records = [r for r in records if r['id'] != record_to_delete['id']]
-            
-            # 保存更新后的记录
-            try:
-                with open(self.tea_records_path, 'w', encoding='utf-8') as f:
-                    json.dump(records, f, ensure_ascii=False, indent=2)
-                
-                messagebox.showinfo("成功", "记录删除成功！")
-                self.load_records_list()  # 重新加载列表
-                
-                # 清空详情显示
-                self.detail_text.config(state='normal')
-                self.detail_text.delete('1.0', tk.END)
-                self.detail_text.config(state='disabled')
-                
-                # 清空图片显示
-                for widget in self.image_display_frame.winfo_children():
-                    widget.destroy()
-                
-            except Exception as e:
-                messagebox.showerror("错误", f"删除失败：{str(e)}")
-    
-    def save_record_as(self):
-        """另存为茶记录"""
-        if not hasattr(self, 'selected_record') or not self.selected_record:
-            messagebox.showwarning("提示", "请先选择要导出的记录！")
-            return
-        
-        # 选择保存格式
-        format_choice = messagebox.askyesnocancel(
-            "选择格式",
-            "选择导出格式：\n是 - 文本格式(.txt)\n否 - JSON格式(.json)\n取消 - 取消操作"
-        )
-        
-        if format_choice is None:  # 用户取消
-            return
-        
-        record = self.selected_record
-        
-        if format_choice:  # 文本格式
-            file_types = [("文本文件", "*.txt"), ("所有文件", "*.*")]
-            default_name = f"茶记_{record['tea_name']}_{record['brewing_time'][:10]}.txt"
-        else:  # JSON格式
-            file_types = [("JSON文件", "*.json"), ("所有文件", "*.*")]
-            default_name = f"茶记_{record['tea_name']}_{record['brewing_time'][:10]}.json"
-        
-        file_path = filedialog.asksaveasfilename(
-            title="保存茶记录",
-            defaultextension=".txt" if format_choice else ".json",
-            filetypes=file_types,
-            initialname=default_name
-        )
-        
-        if not file_path:
-            return
-        
-        try:
-            if format_choice:  # 文本格式
-                content = f"""茶记录导出
-================
-
-茶种名称: {record['tea_name']}
-冲泡时间: {record['brewing_time']}
-美味评分: {"⭐" * record['rating']} ({record['rating']}/10)
-冲泡次数: {record['pour_count']}次
-是否加奶: {'是' if record['add_milk'] else '否'}
-
-品茶笔记:
-{record['notes']}
-
-冲泡参数:
-倒茶时间: {', '.join(map(str, record['brewing_params']['pour_times']))}秒
-间隔时间: {', '.join(map(str, record['brewing_params']['intervals']))}秒
-
-图片信息: {'有图片' if record.get('image_filename') else '无图片'}
-"""
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-            else:  # JSON格式
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(record, f, ensure_ascii=False, indent=2)
-            
-            messagebox.showinfo("成功", f"茶记录已保存到：\n{file_path}")
-            
-        except Exception as e:
-            messagebox.showerror("错误", f"保存失败：{str(e)}")
-    
-    def generate_daily_report(self):
-        """生成日报告"""
-        # 选择日期
-        from tkinter import simpledialog
-        
-        date_str = simpledialog.askstring(
-            "选择日期",
-            "请输入要生成报告的日期 (格式: YYYY-MM-DD):",
-            initialvalue=datetime.now().strftime("%Y-%m-%d")
-        )
-        
-        if not date_str:
-            return
-        
-        try:
-            # 验证日期格式
-            datetime.strptime(date_str, "%Y-%m-%d")
-        except ValueError:
-            messagebox.showerror("错误", "日期格式不正确，请使用 YYYY-MM-DD 格式")
-            return
-        
-        # 筛选指定日期的记录
-        records = self.load_tea_records()
-        daily_records = [r for r in records if r['brewing_time'].startswith(date_str)]
-        
-        if not daily_records:
-            messagebox.showinfo("提示", f"没有找到 {date_str} 的茶记录")
-            return
-        
-        # 选择保存位置
-        file_path = filedialog.asksaveasfilename(
-            title="保存日报告",
-            defaultextension=".jpg",
-            filetypes=[("JPEG图片", "*.jpg"), ("PNG图片", "*.png"), ("所有文件", "*.*")],
-            initialname=f"茶记日报告_{date_str}.jpg"
-        )
-        
-        if not file_path:
-            return
-        
-        try:
-            self.create_daily_report_image(daily_records, date_str, file_path)
-            messagebox.showinfo("成功", f"日报告已生成：\n{file_path}")
-            
-        except Exception as e:
-            messagebox.showerror("错误", f"生成报告失败：{str(e)}")
+        if result:
+            self.brewing.cancel(session_id)
     
-    def create_daily_report_image(self, records, date_str, output_path):
-        """创建日报告图片"""
-        from PIL import ImageDraw, ImageFont
-        
-        # 图片尺寸
-        img_width = 800
-        img_height = 600 + len(records) * 200  # 根据记录数量调整高度
-        
-        # 创建白色背景图片
-        img = Image.new('RGB', (img_width, img_height), color='#F5F5DC')
-        draw = ImageDraw.Draw(img)
-        
-        # 尝试加载字体
-        try:
-            title_font = ImageFont.truetype("arial.ttf", 32)
-            header_font = ImageFont.truetype("arial.ttf", 20)
-            text_font = ImageFont.truetype("arial.ttf", 16)
-        except:
-            # 如果无法加载字体，使用默认字体
-            title_font = ImageFont.load_default()
-            header_font = ImageFont.load_default()
-            text_font = ImageFont.load_default()
-        
-        # 绘制标题
-        title = f"茶记日报告 - {date_str}"
-        title_bbox = draw.textbbox((0, 0), title, font=title_font)
-        title_width = title_bbox[2] - title_bbox[0]
-        draw.text(((img_width - title_width) // 2, 30), title, fill='#8B4513', font=title_font)
-        
-        # 绘制统计信息
-        stats_y = 100
-        total_records = len(records)
-        avg_rating = sum(r['rating'] for r in records) / total_records if total_records > 0 else 0
-        
-        stats_text = f"总记录数: {total_records}    平均评分: {avg_rating:.1f}/10"
-        draw.text((50, stats_y), stats_text, fill='#2F4F2F', font=header_font)
-        
-        # 绘制分隔线
-        draw.line([(50, stats_y + 40), (img_width - 50, stats_y + 40)], fill='#DEB887', width=2)
-        
-        # 绘制每条记录
-        y_offset = stats_y + 80
-        
-        for i, record in enumerate(records):
-            # 记录背景
-            record_bg_y1 = y_offset - 10
-            record_bg_y2 = y_offset + 160
-            draw.rectangle([(30, record_bg_y1), (img_width - 30, record_bg_y2)], 
-                         fill='#FFFAF0', outline='#DEB887', width=2)
-            
-            # 茶名和时间
-            tea_info = f"{record['tea_name']} - {record['brewing_time'][11:16]}"
-            draw.text((50, y_offset), tea_info, fill='#8B4513', font=header_font)
-            
-            # 评分
-            stars = "⭐" * record['rating']
-            rating_text = f"评分: {stars} ({record['rating']}/10)"
-            draw.text((50, y_offset + 30), rating_text, fill='#FF8C00', font=text_font)
-            
-            # 冲泡信息
-            brew_info = f"冲泡次数: {record['pour_count']}次    加奶: {'是' if record['add_milk'] else '否'}"
-            draw.text((50, y_offset + 55), brew_info, fill='#2F4F2F', font=text_font)
-            
-            # 笔记（截取前100个字符）
-            notes = record['notes'][:100] + "..." if len(record['notes']) > 100 else record['notes']
-            notes_lines = notes.split('\n')[:3]  # 最多显示3行
-            
-            for j, line in enumerate(notes_lines):
-                draw.text((50, y_offset + 80 + j * 20), line, fill='#2F4F2F', font=text_font)
-            
-            # 如果有图片，显示标识
-            if record.get('image_filename'):
-                draw.text((img_width - 150, y_offset), "📷 有图片", fill='#4169E1', font=text_font)
-            
-            y_offset += 180
-        
-        # 绘制页脚
-        footer_text = f"生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        footer_bbox = draw.textbbox((0, 0), footer_text, font=text_font)
-        footer_width = footer_bbox[2] - footer_bbox[0]
-        draw.text(((img_width - footer_width) // 2, img_height - 40), footer_text, fill='#666666', font=text_font)
-        
-        # 保存图片
-        img.save(output_path, 'JPEG', quality=95)
-
-    def delete_tea(self):
-        """删除茶种"""
-        selection = self.tea_listbox.curselection()
-        if not selection:
-            messagebox.showwarning("提示", "请先选择要删除的茶种！")
-            return
-        
-        try:
-            filepath = self.tea_files[selection[0]]
-            with open(filepath, 'r', encoding='utf-8') as f:
-                tea_data = json.load(f)
-            
-            result = messagebox.askyesno(
-                "确认删除",
-                f"确定要删除茶种 '{tea_data['name']}' 吗？\n此操作不可恢复！"
-            )
-            
-            if result:
-                os.remove(filepath)
-                messagebox.showinfo("删除成功", f"茶种 '{tea_data['name']}' 已删除！")
-                self.load_tea_list()  # 重新加载列表
-                
-        except Exception as e:
-            messagebox.showerror("错误", f"删除失败：{str(e)}")
-
-    def skip_current_pour(self):
-        """提前结束当前倒茶"""
-        if not self.brewing_status['is_brewing']:
+    def confirm_stop_all(self):
+        """确认后停止所有冲泡会话"""
+        count = len(self.brewing.sessions())
+        if not count:
             return
-        
-        # 显示确认对话框
-        result = messagebox.askyesno(
-            "确认提前结束",
-            "确定要提前结束本次倒茶吗？\n将立即进入下一次倒茶或结束冲泡。",
-            icon='question'
-        )
-        
-        if result:
-            # 设置跳过标志
-            self.brewing_status['skip_current'] = True
+        if messagebox.askyesno(
+            "确认停止全部冲泡",
+            f"确定要停止全部 {count} 个冲泡吗？\n停止后不会再提醒倒茶，也不会保存茶记。",
+            icon='warning'
+        ):
+            self.stop_all_timers()
     
     def stop_all_timers(self):
-        """停止所有活动的定时器"""
-        self.active_timers.clear()
-        # 重置冲泡状态
-        self.brewing_status['is_brewing'] = False
-        self.brewing_status['tea_data'] = None
-        self.brewing_status['current_pour'] = 0
-        self.brewing_status['next_pour_time'] = None
-        self.brewing_status['skip_current'] = False
+        """停止所有冲泡会话"""
+        # 取消令牌会阻止已排队的提醒；堆清空后调度线程自行退出
+        self.brewing.cancel_all()
         # 更新边栏显示
         if hasattr(self, 'sidebar'):
             self.update_sidebar_display()
 
-    def show_settings_page(self):
-        """显示设置页面"""
-        # 停止所有定时器并清理状态
-        self.stop_all_timers()
-        
-        # 清空窗口
-        try:
-            for widget in self.root.winfo_children():
-                widget.destroy()
-        except tk.TclError:
-            pass
-        
-        # 获取当前主题配置
-        theme = self.get_theme_config()
-        
-        # 标题
-        title_label = tk.Label(
-            self.root,
-            text="⚙️ 程序设置",
-            font=(theme['title_font'], 20, "bold"),
-            bg=theme['bg_color'],
-            fg=theme['text_color']
-        )
-        title_label.pack(pady=30)
-        
-        # 设置框架
-        settings_frame = tk.Frame(self.root, bg=theme['bg_color'])
-        settings_frame.pack(padx=50, pady=30, fill='both', expand=True)
-        
-        # 主题设置标题
-        theme_title = tk.Label(
-            settings_frame,
-            text="🎨 UI主题风格",
-            font=(theme['font_family'], 16, "bold"),
-            bg=theme['bg_color'],
-            fg=theme['text_color']
-        )
-        theme_title.pack(pady=(0, 20))
-        
-        # 主题选择框架
-        theme_frame = tk.Frame(settings_frame, bg=theme['bg_color'])
-        theme_frame.pack(pady=20)
-        
-        # 主题选择变量
-        self.theme_var = tk.StringVar(value=self.current_theme)
-        
-        # 创建主题选择按钮
-        for theme_key, theme_info in self.themes.items():
-            theme_button = tk.Radiobutton(
-                theme_frame,
-                text=f"{theme_info['name']} - {theme_key}",
-                variable=self.theme_var,
-                value=theme_key,
-                font=(theme['font_family'], 14),
-                bg=theme['bg_color'],
-                fg=theme['text_color_2'],
-                selectcolor=theme['button_color'],
-                activebackground=theme['bg_color'],
-                activeforeground=theme['text_color'],
-                command=self.preview_theme
-            )
-            theme_button.pack(anchor='w', pady=5)
-        
-        # 主题预览说明
-        preview_label = tk.Label(
-            settings_frame,
-            text="💡 选择主题后会立即预览效果",
-            font=(theme['font_family'], 12),
-            bg=theme['bg_color'],
-            fg=theme['text_color_2']
-        )
-        preview_label.pack(pady=10)
-        
-        # 分隔线
-        separator1 = tk.Frame(settings_frame, height=2, bg=theme['text_color_2'])
-        separator1.pack(fill='x', pady=20)
-        
-        # 自定义背景设置标题
-        custom_bg_title = tk.Label(
-            settings_frame,
-            text="🖼️ 自定义背景图片",
-            font=(theme['font_family'], 16, "bold"),
-            bg=theme['bg_color'],
-            fg=theme['text_color']
-        )
-        custom_bg_title.pack(pady=(0, 20))
-        
-        # 自定义背景框架
-        custom_bg_frame = tk.Frame(settings_frame, bg=theme['bg_color'])
-        custom_bg_frame.pack(pady=10, fill='x')
-        
-        # 当前背景显示
-        current_bg_label = tk.Label(
-            custom_bg_frame,
-            text=f"当前背景: {'自定义图片' if self.custom_background_path else '默认背景'}",
-            font=(theme['font_family'], 12),
-            bg=theme['bg_color'],
-            fg=theme['text_color_2']
-        )
-        current_bg_label.pack(pady=5)
-        
-        # 背景选择按钮框架
-        bg_button_frame = tk.Frame(custom_bg_frame, bg=theme['bg_color'])
-        bg_button_frame.pack(pady=10)
-        
-        # 选择背景图片按钮
-        select_bg_button = tk.Button(
-            bg_button_frame,
-            text="📁 选择背景图片",
-            font=(theme['font_family'], 12, "bold"),
-            bg='#4CAF50',
-            fg='white',
-            activebackground='#45a049',
-            relief='raised',
-            bd=3,
-            padx=15,
-            pady=8,
-            command=self.select_custom_background
-        )
-        select_bg_button.pack(side='left', padx=5)
-        
-        # 重置背景按钮
-        reset_bg_button = tk.Button(
-            bg_button_frame,
-            text="🔄 重置为默认",
-            font=(theme['font_family'], 12, "bold"),
-            bg='#FF9800',
-            fg='white',
-            activebackground='#e68900',
-            relief='raised',
-            bd=3,
-            padx=15,
-            pady=8,
-            command=self.reset_custom_background
-        )
-        reset_bg_button.pack(side='left', padx=5)
-        
-        # 预览背景按钮
-        preview_bg_button = tk.Button(
-            bg_button_frame,
-            text="👁️ 预览效果",
-            font=(theme['font_family'], 12, "bold"),
-            bg='#2196F3',
-            fg='white',
-            activebackground='#1976D2',
-            relief='raised',
-            bd=3,
-            padx=15,
-            pady=8,
-            command=self.preview_custom_background
-        )
-        preview_bg_button.pack(side='left', padx=5)
-        
-        # 分隔线2
-        separator2 = tk.Frame(settings_frame, height=2, bg=theme['text_color_2'])
-        separator2.pack(fill='x', pady=20)
-        
-        # 自定义按钮背景设置标题
-        custom_btn_title = tk.Label(
-            settings_frame,
-            text="🎨 自定义按钮样式",
-            font=(theme['font_family'], 16, "bold"),
-            bg=theme['bg_color'],
-            fg=theme['text_color']
-        )
-        custom_btn_title.pack(pady=(0, 20))
-        
-        # 自定义按钮框架
-        custom_btn_frame = tk.Frame(settings_frame, bg=theme['bg_color'])
-        custom_btn_frame.pack(pady=10, fill='x')
-        
-        # 当前按钮样式显示
-        current_btn_label = tk.Label(
-            custom_btn_frame,
-            text=f"当前按钮样式: {'自定义样式' if self.custom_button_background_path else '默认样式'}",
-            font=(theme['font_family'], 12),
-            bg=theme['bg_color'],
-            fg=theme['text_color_2']
-        )
-        current_btn_label.pack(pady=5)
-        
-        # 按钮样式选择按钮框架
-        btn_button_frame = tk.Frame(custom_btn_frame, bg=theme['bg_color'])
-        btn_button_frame.pack(pady=10)
-        
-        # 选择按钮背景图片按钮
-        select_btn_bg_button = tk.Button(
-            btn_button_frame,
-            text="🎨 选择按钮背景",
-            font=(theme['font_family'], 12, "bold"),
-            bg='#9C27B0',
-            fg='white',
-            activebackground='#7B1FA2',
-            relief='raised',
-            bd=3,
-            padx=15,
-            pady=8,
-            command=self.select_custom_button_background
-        )
-        select_btn_bg_button.pack(side='left', padx=5)
-        
-        # 重置按钮样式按钮
-        reset_btn_bg_button = tk.Button(
-            btn_button_frame,
-            text="🔄 重置按钮样式",
-            font=(theme['font_family'], 12, "bold"),
-            bg='#FF5722',
-            fg='white',
-            activebackground='#D84315',
-            relief='raised',
-            bd=3,
-            padx=15,
-            pady=8,
-            command=self.reset_custom_button_background
-        )
-        reset_btn_bg_button.pack(side='left', padx=5)
-        
-        # 按钮框架
-        button_frame = tk.Frame(self.root, bg=theme['bg_color'])
-        button_frame.pack(pady=30)
-        
-        # 保存设置按钮
-        save_button = tk.Button(
-            button_frame,
-            text="💾 保存设置",
-            font=(theme['font_family'], 14, "bold"),
-            bg=theme['button_color_3'],
-            fg='white',
-            width=12,
-            height=2,
-            command=self.save_theme_settings
-        )
-        save_button.pack(side='left', padx=10)
-        
-        # 返回按钮
-        back_button = tk.Button(
-            button_frame,
-            text="🔙 返回主页",
-            font=(theme['font_family'], 14, "bold"),
-            bg=theme['button_color_4'],
-            fg='white',
-            width=12,
-            height=2,
-            command=self.create_main_interface
-        )
-        back_button.pack(side='left', padx=10)
-
-    def preview_theme(self):
-        """预览主题效果"""
-        selected_theme = self.theme_var.get()
-        if selected_theme != self.current_theme:
-            # 临时切换主题进行预览
-            old_theme = self.current_theme
-            self.current_theme = selected_theme
-            self.apply_theme()
-            self.show_settings_page()  # 重新显示设置页面以应用新主题
-
-    def save_theme_settings(self):
-        """保存主题设置"""
-        selected_theme = self.theme_var.get()
-        self.current_theme = selected_theme
-        self.save_settings()
-        self.apply_theme()
-        messagebox.showinfo("设置保存", f"主题已切换为：{self.themes[selected_theme]['name']}")
-        self.create_main_interface()
-    
-    def select_custom_background(self):
-        """选择自定义背景图片"""
-        try:
-            # 支持的图片格式
-            filetypes = [
-                ("图片文件", "*.jpg *.jpeg *.png *.gif *.bmp"),
-                ("JPEG文件", "*.jpg *.jpeg"),
-                ("PNG文件", "*.png"),
-                ("GIF文件", "*.gif"),
-                ("BMP文件", "*.bmp"),
-                ("所有文件", "*.*")
-            ]
-            
-            # 打开文件选择对话框
-            file_path = filedialog.askopenfilename(
-                title="选择背景图片",
-                filetypes=filetypes,
-                initialdir=os.path.expanduser("~")  # 从用户主目录开始
-            )
-            
-            if file_path:
-                # 验证图片文件
-                try:
-                    # 尝试打开图片以验证格式
-                    test_image = Image.open(file_path)
-                    test_image.close()
-                    
-                    # 保存自定义背景路径
-                    self.custom_background_path = os.path.abspath(file_path)
-                    
-                    # 立即预览效果
-                    self.preview_custom_background()
-                    
-                    messagebox.showinfo("成功", f"背景图片已选择：\n{os.path.basename(file_path)}")
-                    
-                except Exception as e:
-                    messagebox.showerror("错误", f"无效的图片文件：\n{str(e)}")
-                    
-        except Exception as e:
-            messagebox.showerror("错误", f"选择图片失败：\n{str(e)}")
-    
-    def reset_custom_background(self):
-        """重置为默认背景"""
-        try:
-            self.custom_background_path = None
-            self.load_background_image()
-            self.show_settings_page()  # 刷新设置页面
-            messagebox.showinfo("成功", "已重置为默认背景")
-        except Exception as e:
-            messagebox.showerror("错误", f"重置背景失败：\n{str(e)}")
-    
-    def preview_custom_background(self):
-        """预览自定义背景效果"""
-        try:
-            # 重新加载背景图片
-            self.load_background_image()
-            # 刷新设置页面以显示新背景
-            self.show_settings_page()
-        except Exception as e:
-            messagebox.showerror("错误", f"预览背景失败：\n{str(e)}")
-    
-    def select_custom_button_background(self):
-        """选择自定义按钮背景图片"""
-        from tkinter import filedialog
-        
-        file_path = filedialog.askopenfilename(
-            title="选择按钮背景图片",
-            filetypes=[
-                ("图片文件", "*.jpg *.jpeg *.png *.gif *.bmp"),
-                ("JPEG文件", "*.jpg *.jpeg"),
-                ("PNG文件", "*.png"),
-                ("GIF文件", "*.gif"),
-                ("BMP文件", "*.bmp"),
-                ("所有文件", "*.*")
-            ]
-        )
-        
-        if file_path:
-            try:
-                # 验证图片文件
-                from PIL import Image
-                with Image.open(file_path) as img:
-                    # 检查图片尺寸
-                    width, height = img.size
-                    if width < 50 or height < 50:
-                        messagebox.showwarning("警告", "图片尺寸太小，建议选择至少50x50像素的图片！")
-                        return
-                    
-                    # 保存路径
-                    self.custom_button_background_path = file_path
-                    messagebox.showinfo("成功", f"按钮背景图片已选择：\n{file_path}")
-                    
-                    # 立即应用效果
-                    self.apply_custom_button_styles()
-                    
-            except Exception as e:
-                messagebox.showerror("错误", f"无法加载图片文件：\n{str(e)}")
-    
-    def reset_custom_button_background(self):
-        """重置按钮背景为默认样式"""
-        self.custom_button_background_path = None
-        messagebox.showinfo("重置", "按钮样式已重置为默认！")
-        
-        # 重新应用主题样式
-        self.apply_theme()
-    
-    def apply_custom_button_styles(self):
-        """应用自定义按钮样式"""
-        if not self.custom_button_background_path:
-            return
-            
-        try:
-            from PIL import Image, ImageTk
-            
-            # 加载并处理按钮背景图片
-            with Image.open(self.custom_button_background_path) as img:
-                # 创建不同尺寸的按钮背景
-                button_sizes = [
-                    (200, 50),   # 主按钮
-                    (150, 40),   # 中等按钮
-                    (120, 35),   # 小按钮
-                ]
-                
-                self.custom_button_images = {}
-                
-                for size_name, (width, height) in zip(['large', 'medium', 'small'], button_sizes):
-                    # 调整图片大小
-                    resized_img = img.resize((width, height), Image.Resampling.LANCZOS)
-                    
-                    # 添加半透明覆盖层以确保文字可读性
-                    overlay = Image.new('RGBA', (width, height), (0, 0, 0, 100))
-                    resized_img = resized_img.convert('RGBA')
-                    combined = Image.alpha_composite(resized_img, overlay)
-                    
-                    # 转换为PhotoImage
-                    self.custom_button_images[size_name] = ImageTk.PhotoImage(combined)
-                    
-            messagebox.showinfo("成功", "自定义按钮样式已应用！")
-            
-        except Exception as e:
-            messagebox.showerror("错误", f"应用按钮样式时出错：\n{str(e)}")
-            self.custom_button_background_path = None
-
-def main():
-    """主函数"""
-    root = tk.Tk()
-    app = TeaBrewingApp(root)
-    root.mainloop()
-
-    def show_trend_analysis(self):
-        """显示趋势分析"""
-        records = self.load_tea_records()
-        if not records:
-            messagebox.showinfo("提示", "暂无茶记录数据！")
-            return
-        
-        # 创建趋势分析窗口
-        trend_window = tk.Toplevel(self.root)
-        trend_window.title("美味值趋势分析")
-        trend_window.geometry("900x700")
-        trend_window.configure(bg='#F5F5DC')
-        # 注册弹窗以支持 ESC 关闭（Toplevel window register）
-        self.register_toplevel(trend_window)
-        
-        # 设置背景
-        self.setup_background(trend_window)
-        
-        # 主框架
-        main_frame = tk.Frame(trend_window, bg='#F5F5DC', relief='raised', bd=3)
-        main_frame.pack(fill='both', expand=True, padx=20, pady=20)
-        
-        # 标题
-        title_label = tk.Label(
-            main_frame,
-            text="📊 美味值趋势分析",
-            font=("Arial", 18, "bold"),
-            bg='#F5F5DC',
-            fg='#8B4513'
-        )
-        title_label.pack(pady=10)
-        
-        # 创建图表
-        self.create_trend_charts(main_frame, records)
-        
-        # 关闭按钮
-        close_btn = tk.Button(
-            main_frame,
-            text="关闭",
-            font=("Arial", 12, "bold"),
-            bg='#DC143C',
-            fg='white',
-            command=trend_window.destroy
-        )
-        close_btn.pack(pady=10)
+    def on_close(self):
+        """关闭主窗口：取消所有冲泡并停止调度线程"""
+        # 这里不等待线程退出：调度线程中的回调可能正等待主线程处理 root.after，
+        # 由 main() 在主循环结束后再 join
+        self.cancel_countdown_tick()
+        self.cancel_background_render()
+        self.background_worker.shutdown(wait=False, cancel_futures=True)
+        self.thumbnail_worker.shutdown(wait=False, cancel_futures=True)
+        self.brewing.shutdown(wait=False)
+        self.root.destroy()
 
-    def create_trend_charts(self, parent, records):
-        """创建趋势图表"""
-        # 准备数据
-        dates = []
-        ratings = []
-        tea_names = []
-        
-        for record in records:
-            try:
-                date = datetime.strptime(record['brewing_time'], "%Y-%m-%d %H:%M:%S")
-                dates.append(date)
-                ratings.append(record['rating'])
-                tea_names.append(record['tea_name'])
-            except:
-                continue
-        
-        if not dates:
-            tk.Label(parent, text="暂无有效数据", font=("Arial", 14), bg='#F5F5DC').pack(pady=20)
-            return
-        
-        # 创建matplotlib图表
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8))
-        fig.patch.set_facecolor('#F5F5DC')
-        
-        # 时间趋势图
-        ax1.plot(dates, ratings, marker='o', linewidth=2, markersize=6, color='#8B4513')
-        ax1.set_title('美味值时间趋势', fontsize=14, fontweight='bold', color='#8B4513')
-        ax1.set_ylabel('美味值', fontsize=12, color='#8B4513')
-        ax1.grid(True, alpha=0.3)
-        ax1.set_facecolor('#FFFAF0')
-        
-        # 格式化日期显示
-        ax1.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d'))
-        ax1.xaxis.set_major_locator(mdates.DayLocator(interval=max(1, len(dates)//10)))
-        plt.setp(ax1.xaxis.get_majorticklabels(), rotation=45)
-        
-        # 按茶种统计
-        tea_stats = {}
-        for tea_name, rating in zip(tea_names, ratings):
-            if tea_name not in tea_stats:
-                tea_stats[tea_name] = []
-            tea_stats[tea_name].append(rating)
-        
-        # 计算平均值
-        tea_avg = {name: np.mean(ratings) for name, ratings in tea_stats.items()}
-        
-        # 茶种平均美味值柱状图
-        names = list(tea_avg.keys())
-        avg_ratings = list(tea_avg.values())
-        
-        bars = ax2.bar(names, avg_ratings, color=['#8B4513', '#2F4F2F', '#B8860B', '#8B008B'][:len(names)])
-        ax2.set_title('各茶种平均美味值', fontsize=14, fontweight='bold', color='#8B4513')
-        ax2.set_ylabel('平均美味值', fontsize=12, color='#8B4513')
-        ax2.set_ylim(0, 10)
-        ax2.set_facecolor('#FFFAF0')
-        
-        # 在柱状图上显示数值
-        for bar, avg in zip(bars, avg_ratings):
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                    f'{avg:.1f}', ha='center', va='bottom', fontweight='bold')
-        
-        plt.setp(ax2.xaxis.get_majorticklabels(), rotation=45)
-        plt.tight_layout()
-        
-        # 将图表嵌入到tkinter窗口
-        canvas = FigureCanvasTkAgg(fig, parent)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill='both', expand=True, padx=10, pady=10)
 
 
 def main():
     root = tk.Tk()
     app = TeaBrewingApp(root)
     root.mainloop()
+    app.brewing.shutdown()
 
 
 if __name__ == "__main__":
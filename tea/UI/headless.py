@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+无界面命令行
+Headless command line
+
+用于没有显示器的设备，只提供冲泡计时和茶记：
+
+    python main.py --headless list
+    python main.py --headless brew <茶名> [--rating N] [--notes 文本] [--no-record]
+    python main.py --headless records [-n N]
+    python main.py --headless thumbnails
+    python main.py --headless verify [--full] [--repair]
+
+本模块及其依赖（brew_engine、brew_journal、tea_store）只使用标准库，
+不会导入 tkinter、PIL 或 matplotlib；只有 thumbnails 命令需要 PIL。
+"""
+
+import argparse
+import sys
+import threading
+import time
+
+from brew_engine import BrewingEngine
+from brew_journal import BrewJournal
+from tea_store import TeaStore
+
+
+def format_seconds(seconds):
+    """把秒数格式化为 mm:ss"""
+    seconds = max(0, int(seconds + 0.999))
+    return f"{seconds // 60:02d}:{seconds % 60:02d}"
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="main.py --headless", description="茶叶冲泡定时提醒程序（无界面）")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="列出茶柜中的茶种")
+
+    brew = commands.add_parser("brew", help="开始冲泡并在终端提醒每次倒茶")
+    brew.add_argument("tea", help="茶名（可以只写唯一的前缀）")
+    brew.add_argument("--rating", type=int, choices=range(1, 11), metavar="1-10", help="冲泡完成后的评分")
+    brew.add_argument("--notes", help="冲泡完成后的品茶笔记")
+    brew.add_argument("--no-record", action="store_true", help="冲泡完成后不保存茶记")
+
+    records = commands.add_parser("records", help="列出最近的茶记")
+    records.add_argument("-n", type=int, default=10, help="显示的条数（默认 10）")
+
+    commands.add_parser("thumbnails", help="为已有的茶记图片补齐缩略图")
+
+    verify = commands.add_parser("verify", help="检查茶记图片与图片索引是否一致")
+    verify.add_argument("--full", action="store_true", help="重新计算每张图片的 SHA-256（默认只比较大小）")
+    verify.add_argument("--repair", action="store_true", help="按茶记重建图片索引并删除没有茶记引用的图片")
+    return parser.parse_args(argv)
+
+
+def print_lateness(histogram):
+    """输出倒茶提醒相对计划时间的延迟统计"""
+    stats = histogram.snapshot()
+    if not stats['count']:
+        return
+    print(f"提醒延迟：共 {stats['count']} 次，平均 {stats['mean_ms']} ms，"
+          f"p50 ≤ {stats['p50_ms']} ms，p99 ≤ {stats['p99_ms']} ms，最大 {stats['max_ms']} ms")
+    print("  " + "  ".join(f"{label}: {count}" for label, count in stats['buckets'].items() if count))
+
+
+def list_teas(store):
+    teas = store.list_teas()
+    if not teas:
+        print("暂无茶种，请先创建茶种实例")
+        return 0
+    for _, tea_data in teas:
+        print(f"🍵 {tea_data['name']} - {tea_data['water_temp']}°C - {tea_data['pour_count']}次倒茶")
+    return 0
+
+
+def list_records(store, count):
+    records = store.load_tea_records()
+    records.sort(key=lambda x: x['brewing_time'], reverse=True)
+    for record in records[:count]:
+        print(f"{record['brewing_time']} | {record['tea_name']} | {record['rating']}/10 | {record['notes']}")
+    return 0
+
+
+def backfill_thumbnails(store):
+    # 只有这个命令需要 PIL
+    from record_images import backfill_thumbnails as backfill
+
+    image_filenames = [record['image_filename'] for record in store.load_tea_records() if record.get('image_filename')]
+    created, existing, failed = backfill(store.images_path, image_filenames)
+    print(f"缩略图：新生成 {created} 张，已存在 {existing} 张，失败 {failed} 张")
+    return 1 if failed else 0
+
+
+def verify_images(store, full, repair):
+    records = store.load_tea_records()
+    problems = store.images.verify(records, full=full)
+    for kind, image_filename, message in problems:
+        print(f"[{kind}] {image_filename}: {message}")
+    if not problems:
+        print("茶记图片检查通过")
+        return 0
+    if not repair:
+        print(f"发现 {len(problems)} 个问题（使用 --repair 修复）")
+        return 1
+
+    store.images.rebuild(records)
+    removed = store.images.remove_orphans(records)
+    print(f"已重建图片索引，删除 {len(removed)} 张没有茶记引用的图片")
+    remaining = store.images.verify(records, full=full)
+    for kind, image_filename, message in remaining:
+        print(f"[{kind}] {image_filename}: {message}")
+    return 1 if remaining else 0
+
+
+def ask(prompt):
+    """交互终端中读取一行输入，非交互时返回空字符串"""
+    if not sys.stdin.isatty():
+        return ""
+    try:
+        return input(prompt).strip()
+    except EOFError:
+        return ""
+
+
+def save_record(store, tea_data, rating, notes):
+    """冲泡完成后保存茶记；缺少的评分和笔记在交互终端中询问"""
+    if rating is None:
+        answer = ask("评分 (1-10，直接回车为 5): ")
+        rating = int(answer) if answer.isdigit() and 1 <= int(answer) <= 10 else 5
+    if notes is None:
+        notes = ask("品茶笔记 (直接回车跳过保存): ")
+    if not notes:
+        print("未填写品茶笔记，茶记未保存")
+        return
+    store.add_tea_record(store.build_record(tea_data, rating, notes))
+    print("茶记保存成功！")
+
+
+# 倒茶截止时间过去这么久（秒）仍没有后续记录的会话，说明所在的进程已被强制结束
+ABANDONED_AFTER_SECONDS = 60
+
+
+def close_abandoned_sessions(journal):
+    """报告上次被强制结束的无界面冲泡，并把它们从日志中去掉
+
+    仍在其他终端中进行的冲泡（截止时间未到或刚到）保留在日志中。
+    """
+    now = time.time()
+    live = []
+    for entry in journal.replay():
+        if entry['deadline'] + ABANDONED_AFTER_SECONDS < now:
+            print(f"上次未完成的冲泡已放弃：{entry['tea_data'].get('name')}"
+                  f"（停在第{entry['index'] + 1}次倒茶，"
+                  f"{time.strftime('%Y-%m-%d %H:%M', time.localtime(entry['deadline']))}）")
+        else:
+            live.append(entry)
+    journal.compact(live)
+
+
+def brew(store, args):
+    tea_data = store.find_tea(args.tea)
+    if tea_data is None:
+        print(f"茶柜中没有找到茶种: {args.tea}", file=sys.stderr)
+        return 1
+
+    # 使用单独的日志文件；去掉其中已经结束或被强制结束的会话
+    journal = BrewJournal(store.headless_journal_path)
+    close_abandoned_sessions(journal)
+
+    finished = threading.Event()
+    engine = BrewingEngine(
+        on_pour=lambda session, pour_number, deadline: print(
+            f"\n\a🫖 倒茶时间到！{session.name} 第{pour_number}次倒茶 / 共{session.pour_count}次", flush=True
+        ),
+        on_finish=lambda session: finished.set(),
+        journal=journal
+    )
+    session = engine.start(tea_data)
+    print(f"开始冲泡 '{tea_data['name']}'：水温 {tea_data['water_temp']}°C，"
+          f"共{session.pour_count}次倒茶（Ctrl+C 取消）")
+
+    interactive = sys.stdout.isatty()
+    try:
+        while not finished.wait(1.0 if interactive else None):
+            snapshot = session.snapshot()
+            remaining = engine.remaining(snapshot)
+            if remaining is not None:
+                print(f"\r第{snapshot.current_pour}次倒茶倒计时 {format_seconds(remaining)}", end="", flush=True)
+    except KeyboardInterrupt:
+        engine.cancel(session.session_id)
+        engine.shutdown()
+        print("\n冲泡已取消")
+        return 130
+    engine.shutdown()
+
+    print(f"\n🎉 '{tea_data['name']}' 冲泡完成！")
+    print_lateness(engine.lateness)
+    if not args.no_record:
+        save_record(store, tea_data, args.rating, args.notes)
+    return 0
+
+
+def run(argv, base_dir):
+    """执行无界面命令，返回进程退出码"""
+    args = parse_args(argv)
+    store = TeaStore(base_dir)
+    store.ensure_dirs()
+
+    if args.command == "list":
+        return list_teas(store)
+    if args.command == "records":
+        return list_records(store, args.n)
+    if args.command == "thumbnails":
+        return backfill_thumbnails(store)
+    if args.command == "verify":
+        return verify_images(store, args.full, args.repair)
+    return brew(store, args)
@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+背景图片缓存
+Background image cache
+
+按 (图片路径, 修改时间, 目标尺寸, 重采样方式) 缓存缩放后的背景图片：
+- 内存中保留最近使用的若干个 PhotoImage（LRU），切换页面、重新预览时不再解码
+- 缩放结果另存到磁盘缓存目录（PNG），冷启动时由 Tk 直接读取，省去原图解码和 LANCZOS 缩放
+- 未命中时可先用常驻内存的已解码原图快速生成预览，高质量缩放放到后台线程
+- 每张背景只解码一次原图，生成按窗口预设尺寸排列的金字塔存到磁盘，
+  之后任意尺寸都从不小于它的最近一层缩放，每次缩放的工作量有上限
+
+源图片被修改后修改时间不同，旧的缓存自然失效，磁盘上的旧文件按最近使用时间淘汰。
+
+ingest_image() 在选择自定义背景时把原图缩小成程序自己的副本，之后每次启动只解码这个副本。
+load_button_sprites() 把自定义按钮背景的各种尺寸存成一张图集，启动时只解码一次。
+"""
+
+import hashlib
+import json
+import os
+import threading
+import tkinter as tk
+from collections import OrderedDict
+from contextlib import nullcontext
+
+from PIL import Image, ImageOps, ImageTk
+
+from image_store import file_digest
+
+
+# 主窗口的最大尺寸（gal.py 中 root.maxsize），背景图片不需要比它更大
+MAX_BACKGROUND_SIZE = (1400, 900)
+
+
+def ingest_image(source, dest_dir, max_size=MAX_BACKGROUND_SIZE, prefix="background"):
+    """把用户选择的图片缩小到 max_size 以内，另存一份程序自己的副本，返回副本路径
+
+    JPEG 用 draft() 在解码时直接按 1/2、1/4、1/8 缩小，其他格式先用 reduce() 整数倍缩小，
+    最后再用 LANCZOS 精确缩放，因此几千万像素的照片也不需要完整解码。
+    副本以原图内容的哈希命名，重复选择同一张图片时直接复用。
+    """
+    dest_base = os.path.join(dest_dir, f"{prefix}_{file_digest(source)[:16]}")
+    for ext in ('.jpg', '.png'):
+        if os.path.exists(dest_base + ext):
+            return dest_base + ext
+
+    max_width, max_height = max_size
+    with Image.open(source) as image:
+        # 按长边请求，照片旋转后也不会小于目标尺寸
+        longest = max(max_size)
+        image.draft('RGB', (longest, longest))
+        image = ImageOps.exif_transpose(image)
+        has_alpha = image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info)
+        image = image.convert('RGBA' if has_alpha else 'RGB')
+        factor = min(image.width // max_width, image.height // max_height)
+        if factor >= 2:
+            image = image.reduce(factor)
+        if image.width > max_width or image.height > max_height:
+            image = image.resize(fit_size(image.size, max_size), Image.Resampling.LANCZOS)
+
+    # 有透明通道的保存为 PNG，其余保存为 JPEG
+    if has_alpha:
+        dest = dest_base + '.png'
+        save_args = {'format': 'PNG'}
+    else:
+        dest = dest_base + '.jpg'
+        save_args = {'format': 'JPEG', 'quality': 90, 'optimize': True}
+    os.makedirs(dest_dir, exist_ok=True)
+    temp_path = dest + '.tmp'
+    image.save(temp_path, **save_args)
+    os.replace(temp_path, dest)
+    return dest
+
+
+# 自定义按钮背景的各种尺寸，按此顺序从上到下排列在同一张图集中
+BUTTON_SPRITE_SIZES = (
+    ('large', (200, 50)),   # 主按钮
+    ('medium', (150, 40)),  # 中等按钮
+    ('small', (120, 35)),   # 小按钮
+)
+# 半透明覆盖层，确保按钮文字可读
+BUTTON_OVERLAY = (0, 0, 0, 100)
+
+
+def button_atlas_path(source, cache_dir):
+    """按钮图集的路径，以原图内容的哈希命名
+
+    原图的 (路径, 大小, 修改时间) 与 cache_dir/buttons.json 中记录的相同时直接使用记录的文件名，
+    只有原图变化后才重新读取原图计算哈希。
+    """
+    stat = os.stat(source)
+    signature = [os.path.abspath(source), stat.st_size, stat.st_mtime_ns]
+    manifest_path = os.path.join(cache_dir, "buttons.json")
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest['source'] == signature:
+            return os.path.join(cache_dir, manifest['atlas'])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    atlas_name = f"buttons_{file_digest(source)[:16]}.png"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(manifest_path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump({'source': signature, 'atlas': atlas_name}, f, ensure_ascii=False)
+        os.replace(manifest_path + '.tmp', manifest_path)
+    except OSError:
+        pass
+    return os.path.join(cache_dir, atlas_name)
+
+
+def build_button_atlas(source, atlas_path):
+    """把按钮背景缩放成各种尺寸并叠加覆盖层，拼成一张图集写入 atlas_path"""
+    atlas_width = max(width for _, (width, _) in BUTTON_SPRITE_SIZES)
+    atlas_height = sum(height for _, (_, height) in BUTTON_SPRITE_SIZES)
+    atlas = Image.new('RGBA', (atlas_width, atlas_height), (0, 0, 0, 0))
+    with Image.open(source) as image:
+        # JPEG 直接按接近最大按钮的尺寸解码
+        image.draft('RGB', (atlas_width, atlas_height))
+        image = image.convert('RGBA')
+        top = 0
+        for _, (width, height) in BUTTON_SPRITE_SIZES:
+            resized = image.resize((width, height), Image.Resampling.LANCZOS)
+            overlay = Image.new('RGBA', (width, height), BUTTON_OVERLAY)
+            atlas.paste(Image.alpha_composite(resized, overlay), (0, top))
+            top += height
+
+    os.makedirs(os.path.dirname(atlas_path), exist_ok=True)
+    temp_path = atlas_path + '.tmp'
+    atlas.save(temp_path, 'PNG')
+    os.replace(temp_path, atlas_path)
+
+
+def load_button_sprites(source, cache_dir, master=None):
+    """返回 {尺寸名: PhotoImage}
+
+    图集不存在时先生成；之后每次启动只由 Tk 解码一次图集，各尺寸从图集中按区域复制，
+    不再重复缩放和合成。目录中其他原图的旧图集会被删除。
+    """
+    atlas_path = button_atlas_path(source, cache_dir)
+    if not os.path.exists(atlas_path):
+        build_button_atlas(source, atlas_path)
+        for entry in os.scandir(cache_dir):
+            if entry.name.startswith('buttons_') and entry.path != atlas_path:
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+
+    atlas = tk.PhotoImage(master=master, file=atlas_path)
+    sprites = {}
+    top = 0
+    for name, (width, height) in BUTTON_SPRITE_SIZES:
+        sprite = tk.PhotoImage(master=master, width=width, height=height)
+        sprite.tk.call(sprite, 'copy', atlas, '-from', 0, top, width, top + height)
+        sprites[name] = sprite
+        top += height
+    return sprites
+
+
+def fit_size(image_size, box):
+    """保持宽高比缩放到 box 内的最大尺寸"""
+    img_width, img_height = image_size
+    box_width, box_height = box
+    aspect_ratio = img_width / img_height
+    if box_width / box_height > aspect_ratio:
+        # 目标更宽，以高度为准
+        return max(1, int(box_height * aspect_ratio)), box_height
+    # 目标更高，以宽度为准
+    return box_width, max(1, int(box_width / aspect_ratio))
+
+
+class ImageCache:
+    """缩放后图片的内存 LRU 缓存和磁盘缓存
+
+    get() 返回的 PhotoImage 被淘汰后仍可继续使用，只要调用方自己持有引用。
+    不想阻塞界面时，可以先 lookup()，未命中再显示 preview()，
+    同时在后台线程中 render()，完成后回到主线程 put()。
+    timer 为 OperationTimer（可选），记录命中次数和解码耗时。
+    """
+
+    # 背景金字塔各层的尺寸：主窗口的三种预设尺寸和最大尺寸（不超过原图）
+    PYRAMID_BOXES = ((900, 650), (1000, 700), (1200, 800), MAX_BACKGROUND_SIZE)
+    # 磁盘上保留金字塔的图片数
+    MAX_PYRAMIDS = 4
+
+    def __init__(self, cache_dir, master=None, max_entries=4, max_disk_entries=24, timer=None):
+        self.cache_dir = cache_dir
+        self.master = master
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.timer = timer
+        self._photos = OrderedDict()
+        # 快速预览用的已解码原图：路径 -> (修改时间, 图片)
+        self._preview_sources = {}
+        # 已加载的金字塔：键 -> [((宽, 高), 文件路径)]，由小到大
+        self._pyramids = {}
+        self._pyramid_lock = threading.Lock()
+        self.stats = {'memory_hit': 0, 'disk_hit': 0, 'miss': 0, 'preview': 0}
+
+    def _count(self, name):
+        self.stats[name] += 1
+        if self.timer is not None:
+            self.timer.count(f'image_cache.{name}')
+
+    @staticmethod
+    def make_key(path, box, resample=Image.Resampling.LANCZOS):
+        """缓存键；文件不存在时抛出 OSError"""
+        path = os.path.abspath(path)
+        return (path, os.stat(path).st_mtime_ns, tuple(box), Image.Resampling(resample).name)
+
+    def disk_path(self, key):
+        digest = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.png")
+
+    def get(self, path, box, resample=Image.Resampling.LANCZOS):
+        """返回 path 保持宽高比缩放到 box 内的 PhotoImage（未命中时在当前线程解码）"""
+        photo = self.lookup(path, box, resample)
+        if photo is not None:
+            return photo
+        measure = self.timer.measure('image_cache.decode') if self.timer is not None else nullcontext()
+        with measure:
+            key, image = self.render(path, box, resample)
+        return self.put(key, image)
+
+    def lookup(self, path, box, resample=Image.Resampling.LANCZOS):
+        """只查内存和磁盘缓存，未命中时返回 None（计为一次 miss）"""
+        key = self.make_key(path, box, resample)
+
+        photo = self._photos.get(key)
+        if photo is not None:
+            self._photos.move_to_end(key)
+            self._count('memory_hit')
+            return photo
+
+        photo = self._load_disk(self.disk_path(key))
+        if photo is not None:
+            self._count('disk_hit')
+            return self._remember(key, photo)
+        self._count('miss')
+        return None
+
+    def render(self, path, box, resample=Image.Resampling.LANCZOS):
+        """解码并缩放原图、写入磁盘缓存，返回 (缓存键, PIL 图片)
+
+        不访问 Tk，可以在后台线程中调用；得到的图片再在主线程中交给 put()。
+        """
+        key = self.make_key(path, box, resample)
+        levels = self.pyramid(path)
+        # 从不小于目标尺寸的最小一层缩放；目标比最大一层还大时从最大一层放大
+        wanted = fit_size(levels[-1][0], box)
+        level_path = next(
+            (level_path for size, level_path in levels if size[0] >= wanted[0] and size[1] >= wanted[1]),
+            levels[-1][1]
+        )
+        with Image.open(level_path) as level:
+            if level.size == wanted:
+                resized = level.copy()
+            else:
+                resized = level.resize(wanted, Image.Resampling(resample))
+        self._store_disk(resized, self.disk_path(key))
+        return key, resized
+
+    def pyramid_key(self, path):
+        path = os.path.abspath(path)
+        return hashlib.sha1(f"{path}|{os.stat(path).st_mtime_ns}".encode('utf-8')).hexdigest()[:16]
+
+    def pyramid(self, path):
+        """返回 path 的金字塔各层 [((宽, 高), 文件路径)]，由小到大
+
+        金字塔保存在磁盘缓存目录的 levels 子目录中，缺少时先生成；不访问 Tk，可以在后台线程中调用。
+        """
+        key = self.pyramid_key(path)
+        with self._pyramid_lock:
+            levels = self._pyramids.get(key)
+            if levels is None:
+                levels = self._load_pyramid(key)
+                if levels is None:
+                    if self.timer is not None:
+                        self.timer.count('image_cache.pyramid_build')
+                    levels = self._build_pyramid(path, key)
+                self._pyramids[key] = levels
+        return levels
+
+    def _levels_dir(self):
+        return os.path.join(self.cache_dir, "levels")
+
+    def _load_pyramid(self, key):
+        """读取磁盘上的金字塔清单，缺少任何一层时返回 None"""
+        manifest = os.path.join(self._levels_dir(), f"{key}.json")
+        try:
+            with open(manifest, 'r', encoding='utf-8') as f:
+                sizes = [tuple(size) for size in json.load(f)]
+        except (OSError, ValueError, TypeError):
+            return None
+        levels = [(size, self._level_path(key, size)) for size in sizes]
+        if not levels or not all(os.path.exists(level_path) for _, level_path in levels):
+            return None
+        # 更新修改时间，作为金字塔的最近使用时间
+        try:
+            os.utime(manifest)
+        except OSError:
+            pass
+        return levels
+
+    def _level_path(self, key, size):
+        return os.path.join(self._levels_dir(), f"{key}_{size[0]}x{size[1]}.png")
+
+    def _build_pyramid(self, path, key):
+        """解码原图一次，生成各层并写入磁盘（写入失败时抛出 OSError）"""
+        with Image.open(path) as image:
+            # JPEG 直接按接近最大一层的尺寸解码
+            image.draft('RGB', MAX_BACKGROUND_SIZE)
+            source = image.convert('RGBA' if 'A' in image.getbands() else 'RGB')
+
+        sizes = set()
+        for box in self.PYRAMID_BOXES:
+            size = fit_size(source.size, box)
+            sizes.add(size if size[0] <= source.width else source.size)
+        sizes = sorted(sizes)
+
+        levels_dir = self._levels_dir()
+        os.makedirs(levels_dir, exist_ok=True)
+        levels = []
+        for size in sizes:
+            level = source if size == source.size else source.resize(size, Image.Resampling.LANCZOS)
+            level_path = self._level_path(key, size)
+            temp_path = level_path + '.tmp'
+            level.save(temp_path, 'PNG', compress_level=1)
+            os.replace(temp_path, level_path)
+            levels.append((size, level_path))
+
+        # 清单最后写入，清单存在即说明各层都已完整
+        manifest = os.path.join(levels_dir, f"{key}.json")
+        with open(manifest + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump([list(size) for size in sizes], f)
+        os.replace(manifest + '.tmp', manifest)
+        self._prune_pyramids()
+        return levels
+
+    def _prune_pyramids(self):
+        """只保留最近使用的 MAX_PYRAMIDS 个金字塔"""
+        levels_dir = self._levels_dir()
+        try:
+            manifests = [entry for entry in os.scandir(levels_dir) if entry.name.endswith('.json')]
+        except OSError:
+            return
+        manifests.sort(key=lambda entry: entry.stat().st_mtime_ns, reverse=True)
+        stale = {entry.name[:-len('.json')] for entry in manifests[self.MAX_PYRAMIDS:]}
+        if not stale:
+            return
+        for entry in os.scandir(levels_dir):
+            if entry.name.split('_')[0].split('.')[0] in stale:
+                self._remove(entry.path)
+        for key in stale:
+            self._pyramids.pop(key, None)
+
+    def put(self, key, image):
+        """把 render() 的结果转换为 PhotoImage 放入内存缓存（须在主线程调用）"""
+        return self._remember(key, ImageTk.PhotoImage(image, master=self.master))
+
+    def _remember(self, key, photo):
+        self._photos[key] = photo
+        self._photos.move_to_end(key)
+        while len(self._photos) > self.max_entries:
+            self._photos.popitem(last=False)
+        return photo
+
+    def preview(self, path, box):
+        """快速预览：从常驻内存的已解码原图用最近邻缩放，几毫秒即可完成（须在主线程调用）"""
+        path = os.path.abspath(path)
+        mtime = os.stat(path).st_mtime_ns
+        cached = self._preview_sources.get(path)
+        if cached is None or cached[0] != mtime:
+            # 已有金字塔时读取最大一层，否则解码原图（JPEG 直接按接近的尺寸解码）
+            levels = self._pyramids.get(self.pyramid_key(path))
+            with Image.open(levels[-1][1] if levels else path) as image:
+                image.draft('RGB', MAX_BACKGROUND_SIZE)
+                source = image.convert('RGB')
+            source.thumbnail(MAX_BACKGROUND_SIZE, Image.Resampling.BILINEAR)
+            self._preview_sources.pop(path, None)
+            self._preview_sources[path] = cached = (mtime, source)
+            while len(self._preview_sources) > 2:
+                self._preview_sources.pop(next(iter(self._preview_sources)))
+        source = cached[1]
+        self._count('preview')
+        return ImageTk.PhotoImage(source.resize(fit_size(source.size, box), Image.Resampling.NEAREST), master=self.master)
+
+    def _load_disk(self, cached_file):
+        """读取磁盘缓存（Tk 原生解码 PNG），不存在或损坏时返回 None"""
+        if not os.path.exists(cached_file):
+            return None
+        try:
+            photo = tk.PhotoImage(master=self.master, file=cached_file)
+        except tk.TclError:
+            self._remove(cached_file)
+            return None
+        # 更新修改时间，作为磁盘缓存的最近使用时间
+        try:
+            os.utime(cached_file)
+        except OSError:
+            pass
+        return photo
+
+    def _store_disk(self, image, cached_file):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = cached_file + '.tmp'
+            if image.mode not in ('RGB', 'RGBA', 'L', 'LA'):
+                image = image.convert('RGBA' if 'A' in image.getbands() else 'RGB')
+            image.save(temp_path, 'PNG', compress_level=1)
+            os.replace(temp_path, cached_file)
+            self._prune_disk()
+        except OSError as e:
+            print(f"写入图片缓存失败: {e}")
+
+    def _prune_disk(self):
+        """只保留最近使用的 max_disk_entries 个缓存文件"""
+        try:
+            entries = [entry for entry in os.scandir(self.cache_dir) if entry.name.endswith('.png')]
+        except OSError:
+            return
+        if len(entries) <= self.max_disk_entries:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime_ns, reverse=True)
+        for entry in entries[self.max_disk_entries:]:
+            self._remove(entry.path)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def clear(self):
+        """清空内存缓存（磁盘缓存保留）"""
+        self._photos.clear()
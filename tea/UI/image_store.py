@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+茶记图片仓库
+Content-addressed record image store
+
+新的茶记图片按用户所选原图内容的 SHA-256 命名（img_<哈希>.webp），
+同一张照片用于多条茶记时只保存一份。record/images/index.json 记录每个图片文件
+被多少条茶记引用，以及保存后的大小和 SHA-256；删除茶记时引用数减一，
+减到 0 才删除图片和它的缩略图。
+
+verify() 对照茶记检查仓库：文件缺失、大小不符（full=True 时再校验哈希）、
+引用数不符、没有茶记引用的孤立文件。旧版本按时间戳命名的图片同样登记在索引中。
+
+只使用标准库，界面和无界面命令行（main.py --headless verify）共用。
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+INDEX_FILENAME = "index.json"
+THUMBS_DIRNAME = "thumbs"
+
+
+def file_digest(path, algorithm='sha1', chunk_size=1 << 20):
+    """文件内容的哈希（十六进制），algorithm 为 hashlib 中的算法名；背景缓存和茶记图片共用"""
+    digest = hashlib.new(algorithm)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def count_references(records):
+    """茶记中每个图片文件名被引用的次数"""
+    counts = {}
+    for record in records:
+        image_filename = record.get('image_filename')
+        if image_filename:
+            counts[image_filename] = counts.get(image_filename, 0) + 1
+    return counts
+
+
+class ImageStore:
+    """record/images 中的图片文件及其引用计数索引
+
+    索引格式：{文件名: {'refs': 引用数, 'size': 字节数, 'sha256': 保存后的哈希}}，
+    size/sha256 在图片写入完成后由 mark_stored() 填写。各方法可在多个线程中调用。
+    """
+
+    def __init__(self, images_path):
+        self.images_path = images_path
+        self.index_path = os.path.join(images_path, INDEX_FILENAME)
+        self._lock = threading.RLock()
+        self._index = None
+
+    @staticmethod
+    def content_filename(source_path, extension):
+        """按原图内容生成的图片文件名"""
+        return f"img_{file_digest(source_path, 'sha256')[:32]}{extension}"
+
+    def path(self, image_filename):
+        return os.path.join(self.images_path, image_filename)
+
+    def has_index(self):
+        return os.path.exists(self.index_path)
+
+    def ensure_index(self, load_records):
+        """还没有索引时按 load_records() 返回的茶记建立；其他线程正在建立时等待其完成"""
+        with self._lock:
+            if not self.has_index():
+                self.rebuild(load_records())
+
+    def _load(self):
+        if self._index is None:
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    self._index = json.load(f)
+            except (OSError, ValueError):
+                self._index = {}
+        return self._index
+
+    def _save(self):
+        os.makedirs(self.images_path, exist_ok=True)
+        temp_path = self.index_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._index, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(temp_path, self.index_path)
+
+    def refs(self, image_filename):
+        with self._lock:
+            return self._load().get(image_filename, {}).get('refs', 0)
+
+    def add_ref(self, image_filename):
+        """新增一条引用该图片的茶记，返回引用数"""
+        with self._lock:
+            entry = self._load().setdefault(image_filename, {'refs': 0})
+            entry['refs'] += 1
+            self._save()
+            return entry['refs']
+
+    def release(self, image_filename):
+        """删除一条引用该图片的茶记；最后一个引用消失时删除图片和缩略图，返回是否已删除"""
+        with self._lock:
+            index = self._load()
+            entry = index.get(image_filename)
+            if entry is not None and entry['refs'] > 1:
+                entry['refs'] -= 1
+                self._save()
+                return False
+            index.pop(image_filename, None)
+            self._save()
+            self._remove_files(image_filename)
+            return True
+
+    def mark_stored(self, image_filename):
+        """图片文件写入完成后登记其大小和哈希（供 verify 使用）"""
+        path = self.path(image_filename)
+        size, sha256 = os.path.getsize(path), file_digest(path, 'sha256')
+        with self._lock:
+            entry = self._load().setdefault(image_filename, {'refs': 0})
+            entry['size'] = size
+            entry['sha256'] = sha256
+            self._save()
+
+    def _remove_files(self, image_filename):
+        paths = [self.path(image_filename)]
+        thumbs_path = os.path.join(self.images_path, THUMBS_DIRNAME)
+        try:
+            paths += [entry.path for entry in os.scandir(thumbs_path) if entry.name.startswith(image_filename + '.')]
+        except OSError:
+            pass
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def stored_files(self):
+        """images 目录中的图片文件名（不含索引、临时文件和缩略图目录）"""
+        try:
+            return {
+                entry.name for entry in os.scandir(self.images_path)
+                if entry.is_file() and entry.name != INDEX_FILENAME and not entry.name.endswith('.tmp')
+            }
+        except OSError:
+            return set()
+
+    def rebuild(self, records):
+        """按茶记重新计算引用数，登记已存在文件的大小和哈希（用于首次建立索引或修复）"""
+        counts = count_references(records)
+        with self._lock:
+            old = self._load()
+            index = {}
+            for image_filename, refs in counts.items():
+                entry = {'refs': refs}
+                path = self.path(image_filename)
+                if os.path.exists(path):
+                    previous = old.get(image_filename, {})
+                    size = os.path.getsize(path)
+                    if previous.get('size') == size and previous.get('sha256'):
+                        entry.update(size=size, sha256=previous['sha256'])
+                    else:
+                        entry.update(size=size, sha256=file_digest(path, 'sha256'))
+                index[image_filename] = entry
+            self._index = index
+            self._save()
+
+    def verify(self, records, full=False):
+        """检查仓库与茶记是否一致，返回问题列表 [(类型, 文件名, 说明)]；没有问题时为空列表
+
+        默认只比较文件大小，full=True 时重新计算每个文件的 SHA-256。
+        """
+        problems = []
+        counts = count_references(records)
+        with self._lock:
+            index = {name: dict(entry) for name, entry in self._load().items()}
+        files = self.stored_files()
+
+        for image_filename, entry in sorted(index.items()):
+            refs = counts.get(image_filename, 0)
+            if entry.get('refs', 0) != refs:
+                problems.append(('refs', image_filename, f"索引引用数 {entry.get('refs', 0)}，茶记实际引用 {refs}"))
+            if image_filename not in files:
+                problems.append(('missing', image_filename, "图片文件不存在"))
+                continue
+            size = entry.get('size')
+            if size is None:
+                problems.append(('unverified', image_filename, "索引中没有大小和哈希"))
+                continue
+            path = self.path(image_filename)
+            if os.path.getsize(path) != size:
+                problems.append(('size', image_filename, f"大小 {os.path.getsize(path)}，索引中为 {size}"))
+            elif full and file_digest(path, 'sha256') != entry.get('sha256'):
+                problems.append(('sha256', image_filename, "内容与索引中的哈希不符"))
+
+        for image_filename in sorted(set(counts) - set(index)):
+            problems.append(('unindexed', image_filename, f"被 {counts[image_filename]} 条茶记引用，但不在索引中"))
+        for image_filename in sorted(files - set(index) - set(counts)):
+            problems.append(('orphan', image_filename, "没有茶记引用"))
+        return problems
+
+    def remove_orphans(self, records):
+        """删除没有茶记引用、也不在索引中的图片文件，返回删除的文件名"""
+        counts = count_references(records)
+        with self._lock:
+            known = set(self._load()) | set(counts)
+            orphans = sorted(self.stored_files() - known)
+            for image_filename in orphans:
+                self._remove_files(image_filename)
+        return orphans
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+延迟导入工具
+Lazy import helpers
+
+matplotlib / numpy 只在趋势分析等少数功能中用到，在启动时导入会拖慢首屏。
+这里提供：
+- module_available: 只查找模块规格（find_spec），不执行包代码
+- lazy_import: 返回一个代理对象，第一次访问属性时才真正导入
+- import_report: 汇总延迟模块的加载情况与实际导入耗时
+"""
+
+import importlib
+import importlib.util
+import os
+import subprocess
+import sys
+import threading
+import time
+
+# 记录每个延迟模块的实际导入耗时（秒），未加载的模块不在其中
+_load_times = {}
+_registry = {}
+_lock = threading.RLock()
+
+
+def module_available(name):
+    """检查模块是否可导入，但不执行其代码"""
+    if name in sys.modules:
+        return True
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class LazyModule:
+    """模块代理：首次访问属性时导入真实模块"""
+
+    def __init__(self, name):
+        object.__setattr__(self, '_lazy_name', name)
+        object.__setattr__(self, '_lazy_module', None)
+
+    def _load(self):
+        module = self._lazy_module
+        if module is None:
+            with _lock:
+                module = self._lazy_module
+                if module is None:
+                    start = time.perf_counter()
+                    module = importlib.import_module(self._lazy_name)
+                    _load_times.setdefault(self._lazy_name, time.perf_counter() - start)
+                    object.__setattr__(self, '_lazy_module', module)
+        return module
+
+    @property
+    def is_loaded(self):
+        return self._lazy_module is not None
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __repr__(self):
+        state = "loaded" if self._lazy_module is not None else "not loaded"
+        return f"<LazyModule {self._lazy_name!r} ({state})>"
+
+
+def lazy_import(name):
+    """返回模块 name 的延迟代理（同名模块共享同一个代理）"""
+    with _lock:
+        proxy = _registry.get(name)
+        if proxy is None:
+            proxy = LazyModule(name)
+            _registry[name] = proxy
+        return proxy
+
+
+def measure_import_cost(names, preload=(), timeout=60):
+    """在独立的子进程中测量冷导入模块的耗时（毫秒），失败时返回 None
+
+    names 可以是单个模块名，也可以是模块名列表（一起导入，共享依赖只计一次）。
+    preload 中的模块会先导入且不计时，用来扣除启动时本来就要付出的成本。
+    """
+    if isinstance(names, str):
+        names = [names]
+    code = (
+        "import time, importlib\n"
+        f"for name in {list(preload)!r}:\n"
+        "    importlib.import_module(name)\n"
+        "t = time.perf_counter()\n"
+        f"for name in {list(names)!r}:\n"
+        "    importlib.import_module(name)\n"
+        "print((time.perf_counter() - t) * 1000)\n"
+    )
+    # 子进程沿用当前的模块搜索路径，以便测量 UI 目录下的页面模块
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(path for path in sys.path if path)
+    try:
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, timeout=timeout, env=env
+        )
+        if result.returncode != 0:
+            return None
+        return float(result.stdout.strip().splitlines()[-1])
+    except (OSError, ValueError, IndexError, subprocess.SubprocessError):
+        return None
+
+
+def import_report(measure=False, preload=()):
+    """生成延迟导入报告
+
+    measure=True 时会为每个尚未加载的模块启动子进程测量冷导入耗时，
+    即启动阶段节省下来的导入成本；preload 为启动时已导入的模块。
+    """
+    modules = []
+    deferred = []
+    with _lock:
+        names = sorted(_registry)
+    for name in names:
+        loaded = _registry[name].is_loaded
+        entry = {
+            'module': name,
+            'loaded': loaded,
+            'load_ms': round(_load_times[name] * 1000, 2) if name in _load_times else None,
+        }
+        if measure and not loaded:
+            cost = measure_import_cost(name, preload)
+            entry['deferred_cost_ms'] = round(cost, 2) if cost is not None else None
+            deferred.append(name)
+        modules.append(entry)
+
+    report = {'modules': modules}
+    if measure:
+        # 单个模块的耗时包含共享依赖，总节省时间需要一起导入测量
+        saved = measure_import_cost(deferred, preload) if deferred else 0.0
+        report['saved_ms'] = round(saved, 2) if saved is not None else None
+    return report
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+页面注册表
+Page registry
+
+每个页面（以及评价、趋势、日报告等弹窗）放在独立模块中，
+第一次导航到该页面时才导入模块并创建实例；主窗口中的页面创建后一直保留，
+之后用 tkraise 切换。
+"""
+
+from lazy_imports import lazy_import
+
+# 页面名 -> (模块名, 类名)
+PAGE_REGISTRY = {
+    'home': ('pages.home', 'HomePage'),
+    'create_tea': ('pages.create_tea', 'CreateTeaPage'),
+    'tea_closet': ('pages.tea_closet', 'TeaClosetPage'),
+    'tea_notes': ('pages.tea_notes', 'TeaNotesPage'),
+    'settings': ('pages.settings', 'SettingsPage'),
+    'evaluation': ('pages.evaluation', 'TeaEvaluationDialog'),
+    'trend': ('pages.trend', 'TrendAnalysisWindow'),
+    'daily_report': ('pages.daily_report', 'DailyReport'),
+}
+
+# 每次启动都会显示的页面（主页），它们的导入不算延迟导入节省的时间
+STARTUP_PAGES = ('home',)
+
+# 预先登记延迟模块，启动报告中可以看到哪些页面尚未加载
+_page_modules = {name: lazy_import(module_name) for name, (module_name, _) in PAGE_REGISTRY.items()}
+
+
+def get_page_class(name):
+    """返回页面类，必要时导入其所在模块"""
+    if name not in PAGE_REGISTRY:
+        raise KeyError(f"未知页面: {name}")
+    class_name = PAGE_REGISTRY[name][1]
+    return getattr(_page_modules[name], class_name)
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+页面基类
+"""
+
+import tkinter as tk
+
+
+class BasePage:
+    """页面基类：持有应用实例，通过 self.app 访问共享状态和方法
+
+    主窗口中的页面只在第一次显示时调用 build() 创建组件（放在 self.frame 中），
+    之后一直保留，切换页面只是 tkraise。每次显示前比较 data_signature()，
+    数据有变化时才调用 refresh() 重新加载。
+    弹窗类页面（评价、趋势、日报告）直接重写 show()。
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.root = app.root
+        self.frame = None
+        self._signature = None
+        self._refreshed = False
+
+    @property
+    def is_built(self):
+        try:
+            return self.frame is not None and bool(self.frame.winfo_exists())
+        except tk.TclError:
+            return False
+
+    def build(self):
+        """在 self.frame 中创建页面组件（每个页面只调用一次）
+
+        颜色和字体通过 self.app.style 按主题角色设置，切换主题时无需重建。
+        """
+        raise NotImplementedError
+
+    def refresh(self):
+        """重新加载页面数据"""
+
+    def data_signature(self):
+        """页面数据的签名，与上次刷新时相同则跳过 refresh()；返回 None 表示每次显示都刷新"""
+        return None
+
+    def show(self):
+        """显示页面：必要时创建组件和刷新数据，然后提到最上层"""
+        if not self.is_built:
+            self.frame = self.app.create_page_frame()
+            with self.app.ui_timer.measure(f'page_build.{type(self).__name__}'):
+                self.build()
+            self._refreshed = False
+
+        signature = self.data_signature()
+        if not self._refreshed or signature is None or signature != self._signature:
+            self.refresh()
+            self._signature = signature
+            self._refreshed = True
+
+        self.app.raise_page(self)
+
+    def hide(self):
+        """切换到其他页面时调用"""
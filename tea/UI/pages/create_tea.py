@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+创建茶种页面
+"""
+
+import tkinter as tk
+from tkinter import ttk, messagebox
+from datetime import datetime
+
+from pages.base import BasePage
+
+
+class CreateTeaPage(BasePage):
+    """创建茶种页面"""
+
+    def build(self):
+        """创建茶种页面"""
+        # 创建滚动框架
+        canvas = self.app.style(tk.Canvas(self.frame), bg='bg_color')
+        scrollbar = ttk.Scrollbar(self.frame, orient="vertical", command=canvas.yview)
+        scrollable_frame = self.app.style(tk.Frame(canvas), bg='bg_color')
+        
+        scrollable_frame.bind(
+            "<Configure>",
+            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        )
+        
+        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+        
+        # 标题
+        title_label = self.app.style(tk.Label(
+            scrollable_frame,
+            text="🌿 创建新茶种"
+        ), font=('title_font', 20, "bold"), bg='bg_color', fg='text_color')
+        title_label.pack(pady=20)
+        
+        # 创建输入框架
+        input_frame = self.app.style(tk.Frame(scrollable_frame), bg='bg_color')
+        input_frame.pack(padx=50, pady=20, fill='both', expand=True)
+        
+        # 茶名输入
+        self.app.style(tk.Label(input_frame, text="茶叶名称:"), font=('font_family', 12, "bold"), bg='bg_color', fg='text_color').grid(row=0, column=0, sticky='w', pady=5)
+        self.tea_name_entry = self.app.style(tk.Entry(input_frame, width=30), font=('font_family', 12))
+        self.tea_name_entry.grid(row=0, column=1, pady=5, padx=10)
+        
+        # 水温输入
+        self.app.style(tk.Label(input_frame, text="冲泡水温(°C):"), font=('font_family', 12, "bold"), bg='bg_color', fg='text_color').grid(row=1, column=0, sticky='w', pady=5)
+        self.water_temp_entry = self.app.style(tk.Entry(input_frame, width=30), font=('font_family', 12))
+        self.water_temp_entry.grid(row=1, column=1, pady=5, padx=10)
+        
+        # 茶具输入
+        self.app.style(tk.Label(input_frame, text="使用茶具:"), font=('font_family', 12, "bold"), bg='bg_color', fg='text_color').grid(row=2, column=0, sticky='w', pady=5)
+        self.tea_ware_entry = self.app.style(tk.Entry(input_frame, width=30), font=('font_family', 12))
+        self.tea_ware_entry.grid(row=2, column=1, pady=5, padx=10)
+        
+        # 水量输入
+        self.app.style(tk.Label(input_frame, text="水量(ml):"), font=('font_family', 12, "bold"), bg='bg_color', fg='text_color').grid(row=3, column=0, sticky='w', pady=5)
+        self.water_amount_entry = self.app.style(tk.Entry(input_frame, width=30), font=('font_family', 12))
+        self.water_amount_entry.grid(row=3, column=1, pady=5, padx=10)
+        
+        # 茶叶重量输入
+        self.app.style(tk.Label(input_frame, text="茶叶重量(g):"), font=('font_family', 12, "bold"), bg='bg_color', fg='text_color').grid(row=4, column=0, sticky='w', pady=5)
+        self.tea_weight_entry = self.app.style(tk.Entry(input_frame, width=30), font=('font_family', 12))
+        self.tea_weight_entry.grid(row=4, column=1, pady=5, padx=10)
+        
+        # 是否加奶
+        self.app.style(tk.Label(input_frame, text="是否加奶:"), font=('font_family', 12, "bold"), bg='bg_color', fg='text_color').grid(row=5, column=0, sticky='w', pady=5)
+        self.add_milk_var = tk.BooleanVar()
+        milk_checkbox = self.app.style(tk.Checkbutton(input_frame, text="加奶", variable=self.add_milk_var), font=('font_family', 12), bg='bg_color', fg='text_color_2')
+        milk_checkbox.grid(row=5, column=1, sticky='w', pady=5, padx=10)
+        
+        # 倒茶次数和时间设置
+        self.app.style(tk.Label(input_frame, text="倒茶设置:"), font=('font_family', 12, "bold"), bg='bg_color', fg='text_color').grid(row=6, column=0, sticky='w', pady=10)
+        
+        # 倒茶次数
+        self.app.style(tk.Label(input_frame, text="倒茶次数:"), font=('font_family', 10), bg='bg_color', fg='text_color_2').grid(row=7, column=0, sticky='w', pady=5)
+        self.pour_count_var = tk.IntVar(value=3)
+        pour_count_spinbox = self.app.style(tk.Spinbox(input_frame, from_=1, to=10, textvariable=self.pour_count_var, width=10), font=('font_family', 10))
+        pour_count_spinbox.grid(row=7, column=1, sticky='w', pady=5, padx=10)
+        
+        # 动态创建时间输入框
+        self.time_entries_frame = self.app.style(tk.Frame(input_frame), bg='bg_color')
+        self.time_entries_frame.grid(row=8, column=0, columnspan=2, pady=10, sticky='w')
+        
+        self.time_entries = []
+        self.update_time_entries()
+        
+        # 绑定倒茶次数变化事件
+        self.pour_count_var.trace('w', lambda *args: self.update_time_entries())
+        
+        # 按钮框架
+        button_frame = self.app.style(tk.Frame(scrollable_frame), bg='bg_color')
+        button_frame.pack(pady=30)
+        
+        # 保存按钮
+        save_button = self.app.style(tk.Button(
+            button_frame,
+            text="💾 保存茶种",
+            fg='white',
+            width=12,
+            height=2,
+            command=self.save_tea_instance
+        ), font=('font_family', 14, "bold"), bg='button_color_3')
+        save_button.pack(side='left', padx=10)
+        
+        # 返回按钮
+        back_button = self.app.style(tk.Button(
+            button_frame,
+            text="🔙 返回主页",
+            fg='white',
+            width=12,
+            height=2,
+            command=self.app.create_main_interface
+        ), font=('font_family', 14, "bold"), bg='button_color_4')
+        back_button.pack(side='left', padx=10)
+        
+        # 配置滚动
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        self.canvas = canvas
+
+    def show(self):
+        """显示创建茶种页面"""
+        super().show()
+        
+        # 绑定鼠标滚轮（页面隐藏时解除，避免滚动其他页面时带动本页）
+        def _on_mousewheel(event):
+            self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        self.canvas.bind_all("<MouseWheel>", _on_mousewheel)
+
+    def hide(self):
+        """离开页面时解除鼠标滚轮绑定"""
+        try:
+            self.root.unbind_all("<MouseWheel>")
+        except tk.TclError:
+            pass
+
+    def reset_form(self):
+        """清空表单，恢复默认的倒茶设置"""
+        for entry in (self.tea_name_entry, self.water_temp_entry, self.tea_ware_entry,
+                      self.water_amount_entry, self.tea_weight_entry):
+            entry.delete(0, tk.END)
+        self.add_milk_var.set(False)
+        self.pour_count_var.set(3)
+        self.update_time_entries()
+
+    def update_time_entries(self):
+        """更新时间输入框"""
+        # 清空现有的时间输入框
+        for widget in self.time_entries_frame.winfo_children():
+            widget.destroy()
+        
+        self.time_entries = []
+        count = self.pour_count_var.get()
+        
+        self.app.style(tk.Label(self.time_entries_frame, text="各次倒茶时间间隔:"), font=('font_family', 10, "bold"), bg='bg_color', fg='text_color').grid(row=0, column=0, columnspan=4, sticky='w', pady=5)
+        
+        for i in range(count):
+            self.app.style(tk.Label(self.time_entries_frame, text=f"第{i+1}次:"), font=('font_family', 10), bg='bg_color', fg='text_color_2').grid(row=i+1, column=0, sticky='w', pady=2)
+            
+            # 分钟输入
+            minutes_var = tk.IntVar(value=0 if i == 0 else 1)
+            minutes_spinbox = self.app.style(tk.Spinbox(self.time_entries_frame, from_=0, to=60, textvariable=minutes_var, width=5), font=('font_family', 10))
+            minutes_spinbox.grid(row=i+1, column=1, pady=2, padx=2)
+            self.app.style(tk.Label(self.time_entries_frame, text="分"), font=('font_family', 10), bg='bg_color', fg='text_color_2').grid(row=i+1, column=2, sticky='w', pady=2)
+            
+            # 秒数输入
+            seconds_var = tk.IntVar(value=30 if i == 0 else 0)
+            seconds_spinbox = self.app.style(tk.Spinbox(self.time_entries_frame, from_=0, to=59, textvariable=seconds_var, width=5), font=('font_family', 10))
+            seconds_spinbox.grid(row=i+1, column=3, pady=2, padx=2)
+            self.app.style(tk.Label(self.time_entries_frame, text="秒"), font=('font_family', 10), bg='bg_color', fg='text_color_2').grid(row=i+1, column=4, sticky='w', pady=2)
+            
+            self.time_entries.append({'minutes': minutes_var, 'seconds': seconds_var})
+
+    def save_tea_instance(self):
+        """保存茶种实例"""
+        try:
+            # 获取输入数据
+            tea_name = self.tea_name_entry.get().strip()
+            if not tea_name:
+                messagebox.showerror("错误", "请输入茶叶名称！")
+                return
+            
+            water_temp = self.water_temp_entry.get().strip()
+            if not water_temp:
+                messagebox.showerror("错误", "请输入冲泡水温！")
+                return
+            
+            tea_ware = self.tea_ware_entry.get().strip()
+            if not tea_ware:
+                messagebox.showerror("错误", "请输入使用的茶具！")
+                return
+            
+            water_amount = self.water_amount_entry.get().strip()
+            if not water_amount:
+                messagebox.showerror("错误", "请输入水量！")
+                return
+            
+            tea_weight = self.tea_weight_entry.get().strip()
+            if not tea_weight:
+                messagebox.showerror("错误", "请输入茶叶重量！")
+                return
+            
+            # 获取倒茶时间
+            pour_times = []
+            for i, time_entry in enumerate(self.time_entries):
+                minutes = time_entry['minutes'].get()
+                seconds = time_entry['seconds'].get()
+                total_seconds = minutes * 60 + seconds
+                if total_seconds <= 0:
+                    messagebox.showerror("错误", f"第{i+1}次倒茶时间必须大于0！")
+                    return
+                pour_times.append(total_seconds)
+            
+            # 创建茶种数据
+            tea_data = {
+                "name": tea_name,
+                "water_temp": water_temp,
+                "tea_ware": tea_ware,
+                "water_amount": water_amount,
+                "tea_weight": tea_weight,
+                "add_milk": self.add_milk_var.get(),
+                "pour_count": self.pour_count_var.get(),
+                "pour_times": pour_times,
+                "created_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            }
+            
+            # 保存到文件
+            self.app.store.save_tea(tea_data)
+            
+            messagebox.showinfo("成功", f"茶种 '{tea_name}' 已成功保存到茶柜！")
+            self.reset_form()
+            self.app.create_main_interface()
+            
+        except Exception as e:
+            messagebox.showerror("错误", f"保存失败：{str(e)}")
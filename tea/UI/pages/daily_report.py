@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+茶记日报告
+"""
+
+from tkinter import messagebox, filedialog
+from datetime import datetime
+from PIL import Image
+
+from pages.base import BasePage
+
+
+class DailyReport(BasePage):
+    """按日期生成茶记日报告图片"""
+
+    def show(self):
+        """生成日报告"""
+        # 选择日期
+        from tkinter import simpledialog
+        
+        date_str = simpledialog.askstring(
+            "选择日期",
+            "请输入要生成报告的日期 (格式: YYYY-MM-DD):",
+            initialvalue=datetime.now().strftime("%Y-%m-%d")
+        )
+        
+        if not date_str:
+            return
+        
+        try:
+            # 验证日期格式
+            datetime.strptime(date_str, "%Y-%m-%d")
+        except ValueError:
+            messagebox.showerror("错误", "日期格式不正确，请使用 YYYY-MM-DD 格式")
+            return
+        
+        # 筛选指定日期的记录
+        records = self.app.load_tea_records()
+        daily_records = [r for r in records if r['brewing_time'].startswith(date_str)]
+        
+        if not daily_records:
+            messagebox.showinfo("提示", f"没有找到 {date_str} 的茶记录")
+            return
+        
+        # 选择保存位置
+        file_path = filedialog.asksaveasfilename(
+            title="保存日报告",
+            defaultextension=".jpg",
+            filetypes=[("JPEG图片", "*.jpg"), ("PNG图片", "*.png"), ("所有文件", "*.*")],
+            initialname=f"茶记日报告_{date_str}.jpg"
+        )
+        
+        if not file_path:
+            return
+        
+        try:
+            self.create_daily_report_image(daily_records, date_str, file_path)
+            messagebox.showinfo("成功", f"日报告已生成：\n{file_path}")
+            
+        except Exception as e:
+            messagebox.showerror("错误", f"生成报告失败：{str(e)}")
+    
+    def create_daily_report_image(self, records, date_str, output_path):
+        """创建日报告图片"""
+        from PIL import ImageDraw, ImageFont
+        
+        # 图片尺寸
+        img_width = 800
+        img_height = 600 + len(records) * 200  # 根据记录数量调整高度
+        
+        # 创建白色背景图片
+        img = Image.new('RGB', (img_width, img_height), color='#F5F5DC')
+        draw = ImageDraw.Draw(img)
+        
+        # 尝试加载字体
+        try:
+            title_font = ImageFont.truetype("arial.ttf", 32)
+            header_font = ImageFont.truetype("arial.ttf", 20)
+            text_font = ImageFont.truetype("arial.ttf", 16)
+        except:
+            # 如果无法加载字体，使用默认字体
+            title_font = ImageFont.load_default()
+            header_font = ImageFont.load_default()
+            text_font = ImageFont.load_default()
+        
+        # 绘制标题
+        title = f"茶记日报告 - {date_str}"
+        title_bbox = draw.textbbox((0, 0), title, font=title_font)
+        title_width = title_bbox[2] - title_bbox[0]
+        draw.text(((img_width - title_width) // 2, 30), title, fill='#8B4513', font=title_font)
+        
+        # 绘制统计信息
+        stats_y = 100
+        total_records = len(records)
+        avg_rating = sum(r['rating'] for r in records) / total_records if total_records > 0 else 0
+        
+        stats_text = f"总记录数: {total_records}    平均评分: {avg_rating:.1f}/10"
+        draw.text((50, stats_y), stats_text, fill='#2F4F2F', font=header_font)
+        
+        # 绘制分隔线
+        draw.line([(50, stats_y + 40), (img_width - 50, stats_y + 40)], fill='#DEB887', width=2)
+        
+        # 绘制每条记录
+        y_offset = stats_y + 80
+        
+        for i, record in enumerate(records):
+            # 记录背景
+            record_bg_y1 = y_offset - 10
+            record_bg_y2 = y_offset + 160
+            draw.rectangle([(30, record_bg_y1), (img_width - 30, record_bg_y2)], 
+                         fill='#FFFAF0', outline='#DEB887', width=2)
+            
+            # 茶名和时间
+            tea_info = f"{record['tea_name']} - {record['brewing_time'][11:16]}"
+            draw.text((50, y_offset), tea_info, fill='#8B4513', font=header_font)
+            
+            # 评分
+            stars = "⭐" * record['rating']
+            rating_text = f"评分: {stars} ({record['rating']}/10)"
+            draw.text((50, y_offset + 30), rating_text, fill='#FF8C00', font=text_font)
+            
+            # 冲泡信息
+            brew_info = f"冲泡次数: {record['pour_count']}次    加奶: {'是' if record['add_milk'] else '否'}"
+            draw.text((50, y_offset + 55), brew_info, fill='#2F4F2F', font=text_font)
+            
+            # 笔记（截取前100个字符）
+            notes = record['notes'][:100] + "..." if len(record['notes']) > 100 else record['notes']
+            notes_lines = notes.split('\n')[:3]  # 最多显示3行
+            
+            for j, line in enumerate(notes_lines):
+                draw.text((50, y_offset + 80 + j * 20), line, fill='#2F4F2F', font=text_font)
+            
+            # 如果有图片，显示标识
+            if record.get('image_filename'):
+                draw.text((img_width - 150, y_offset), "📷 有图片", fill='#4169E1', font=text_font)
+            
+            y_offset += 180
+        
+        # 绘制页脚
+        footer_text = f"生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        footer_bbox = draw.textbbox((0, 0), footer_text, font=text_font)
+        footer_width = footer_bbox[2] - footer_bbox[0]
+        draw.text(((img_width - footer_width) // 2, img_height - 40), footer_text, fill='#666666', font=text_font)
+        
+        # 保存图片
+        img.save(output_path, 'JPEG', quality=95)
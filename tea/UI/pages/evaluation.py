@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+茶记评价弹窗
+"""
+
+import tkinter as tk
+from tkinter import messagebox, filedialog
+import os
+from PIL import ImageTk
+
+from pages.base import BasePage
+from record_images import make_thumbnail
+
+
+class TeaEvaluationDialog(BasePage):
+    """冲泡完成后的茶记评价弹窗"""
+
+    def show(self, tea_data):
+        """显示茶叶评价界面"""
+        # 创建评价窗口
+        eval_window = tk.Toplevel(self.root)
+        eval_window.title("茶记评价")
+        # 注册弹窗以支持 ESC 关闭（Toplevel window register）
+        self.app.register_toplevel(eval_window)
+        
+        # 获取屏幕尺寸
+        screen_width = eval_window.winfo_screenwidth()
+        screen_height = eval_window.winfo_screenheight()
+        
+        # 设置评价窗口最佳尺寸
+        window_width = 600
+        window_height = 750
+        
+        # 计算窗口居中位置
+        x = (screen_width - window_width) // 2
+        y = (screen_height - window_height) // 2
+        
+        # 设置窗口大小和位置
+        eval_window.geometry(f"{window_width}x{window_height}+{x}+{y}")
+        
+        # 设置窗口大小限制
+        eval_window.minsize(550, 700)
+        eval_window.maxsize(700, 850)
+        
+        self.app.style(eval_window, bg='text_color_2')
+        
+        # 设置背景
+        self.app.setup_background(eval_window)
+        
+        # 置顶显示
+        eval_window.attributes('-topmost', True)
+        eval_window.transient(self.root)
+        eval_window.grab_set()
+        
+        # 主框架
+        main_frame = self.app.style(tk.Frame(eval_window, relief='raised', bd=3), bg='panel_bg')
+        main_frame.pack(fill='both', expand=True, padx=20, pady=20)
+        
+        # 标题
+        title_label = self.app.style(tk.Label(
+            main_frame,
+            text="🍵 茶记评价"
+        ), font=('title_font', 20, "bold"), bg='panel_bg', fg='heading_text')
+        title_label.pack(pady=20)
+        
+        # 茶种信息
+        tea_info_label = self.app.style(tk.Label(
+            main_frame,
+            text=f"茶种：{tea_data['name']}"
+        ), font=('font_family', 14, "bold"), bg='panel_bg', fg='body_text')
+        tea_info_label.pack(pady=10)
+        
+        # 美味值评分
+        rating_frame = self.app.style(tk.Frame(main_frame), bg='panel_bg')
+        rating_frame.pack(pady=20)
+        
+        self.app.style(tk.Label(
+            rating_frame,
+            text="美味值评分 (1-10星):"
+        ), font=('font_family', 14, "bold"), bg='panel_bg', fg='heading_text').pack()
+        
+        # 星级评分
+        star_frame = self.app.style(tk.Frame(rating_frame), bg='panel_bg')
+        star_frame.pack(pady=10)
+        
+        self.rating_var = tk.IntVar(value=5)
+        self.star_buttons = []
+        
+        for i in range(1, 11):
+            star_btn = self.app.style(tk.Button(
+                star_frame,
+                text="⭐",
+                font=("Arial", 16),
+                relief='flat',
+                bd=0,
+                command=lambda x=i: self.update_rating(x)
+            ), bg='panel_bg', fg='rating_on' if i <= 5 else 'rating_off')
+            star_btn.pack(side='left', padx=2)
+            self.star_buttons.append(star_btn)
+        
+        # 评分显示
+        self.rating_display = self.app.style(tk.Label(
+            rating_frame,
+            text="当前评分: 5/10"
+        ), font=('font_family', 12), bg='panel_bg', fg='heading_text')
+        self.rating_display.pack(pady=5)
+        
+        # 图片上传区域
+        image_frame = self.app.style(tk.Frame(main_frame), bg='panel_bg')
+        image_frame.pack(pady=10, fill='x')
+        
+        self.app.style(tk.Label(
+            image_frame,
+            text="茶记图片:"
+        ), font=('font_family', 14, "bold"), bg='panel_bg', fg='heading_text').pack(anchor='w')
+        
+        # 图片选择按钮
+        image_button_frame = self.app.style(tk.Frame(image_frame), bg='panel_bg')
+        image_button_frame.pack(fill='x', pady=5)
+        
+        self.selected_image_path = None
+        self.image_preview_label = None
+        
+        select_image_btn = self.app.style(tk.Button(
+            image_button_frame,
+            text="📷 添加图片",
+            fg='white',
+            relief='raised',
+            bd=2,
+            padx=15,
+            pady=5,
+            command=self.select_image
+        ), font=('font_family', 12, "bold"), bg='action_info', activebackground='action_info_active')
+        select_image_btn.pack(side='left', padx=5)
+        
+        # 清除图片按钮
+        self.clear_image_btn = self.app.style(tk.Button(
+            image_button_frame,
+            text="🗑️ 清除图片",
+            fg='white',
+            relief='raised',
+            bd=2,
+            padx=15,
+            pady=5,
+            command=self.clear_selected_image,
+            state='disabled'
+        ), font=('font_family', 12), bg='action_danger', activebackground='action_danger_active')
+        self.clear_image_btn.pack(side='left', padx=5)
+        
+        # 图片预览区域
+        self.image_preview_frame = self.app.style(tk.Frame(image_frame, relief='sunken', bd=2), bg='panel_bg')
+        self.image_preview_frame.pack(fill='x', pady=5)
+        
+        # 笔记输入
+        notes_frame = self.app.style(tk.Frame(main_frame), bg='panel_bg')
+        notes_frame.pack(pady=10, fill='both', expand=True)
+        
+        self.app.style(tk.Label(
+            notes_frame,
+            text="品茶笔记:"
+        ), font=('font_family', 14, "bold"), bg='panel_bg', fg='heading_text').pack(anchor='w')
+        
+        self.notes_text = self.app.style(tk.Text(
+            notes_frame,
+            height=6,
+            width=50,
+            relief='sunken',
+            bd=2,
+            wrap='word'
+        ), font=('font_family', 11), bg='card_bg', fg='body_text')
+        self.notes_text.pack(pady=10, fill='both', expand=True)
+        
+        # 按钮框架
+        button_frame = self.app.style(tk.Frame(main_frame), bg='panel_bg')
+        button_frame.pack(pady=20)
+        
+        # 保存按钮
+        save_btn = self.app.style(tk.Button(
+            button_frame,
+            text="💾 保存茶记",
+            fg='white',
+            relief='raised',
+            bd=3,
+            padx=20,
+            pady=10,
+            command=lambda: self.save_tea_record(tea_data, eval_window)
+        ), font=('font_family', 14, "bold"), bg='action_success', activebackground='action_success_active')
+        save_btn.pack(side='left', padx=10)
+        
+        # 取消按钮
+        cancel_btn = self.app.style(tk.Button(
+            button_frame,
+            text="❌ 取消",
+            fg='white',
+            relief='raised',
+            bd=3,
+            padx=20,
+            pady=10,
+            command=eval_window.destroy
+        ), font=('font_family', 14, "bold"), bg='action_danger', activebackground='action_danger_active')
+        cancel_btn.pack(side='left', padx=10)
+    
+    def update_rating(self, rating):
+        """更新星级评分"""
+        self.rating_var.set(rating)
+        
+        # 更新星星显示
+        for i, btn in enumerate(self.star_buttons):
+            if i < rating:
+                self.app.style(btn, fg='rating_on')  # 金色
+            else:
+                self.app.style(btn, fg='rating_off')  # 灰色
+        
+        # 更新评分显示
+        self.rating_display.config(text=f"当前评分: {rating}/10")
+    
+    def select_image(self):
+        """选择图片文件"""
+        file_types = [
+            ("图片文件", "*.jpg *.jpeg *.png *.gif *.bmp"),
+            ("JPEG文件", "*.jpg *.jpeg"),
+            ("PNG文件", "*.png"),
+            ("GIF文件", "*.gif"),
+            ("所有文件", "*.*")
+        ]
+        
+        file_path = filedialog.askopenfilename(
+            title="选择茶记图片",
+            filetypes=file_types
+        )
+        
+        if file_path:
+            self.selected_image_path = file_path
+            self.show_image_preview()
+            self.clear_image_btn.config(state='normal')
+    
+    def clear_selected_image(self):
+        """清除选中的图片"""
+        self.selected_image_path = None
+        self.clear_image_preview()
+        self.clear_image_btn.config(state='disabled')
+    
+    def show_image_preview(self):
+        """显示图片预览"""
+        if not self.selected_image_path:
+            return
+        
+        try:
+            # 清除之前的预览
+            self.clear_image_preview()
+            
+            # 加载并调整图片大小（保持宽高比，JPEG 按缩小的尺寸解码）
+            image = make_thumbnail(self.selected_image_path, (300, 200))
+            
+            # 转换为PhotoImage
+            photo = ImageTk.PhotoImage(image)
+            
+            # 创建预览标签
+            self.image_preview_label = self.app.style(tk.Label(
+                self.image_preview_frame,
+                image=photo
+            ), bg='panel_bg')
+            self.image_preview_label.image = photo  # 保持引用
+            self.image_preview_label.pack(pady=10)
+            
+            # 显示文件名
+            filename = os.path.basename(self.selected_image_path)
+            filename_label = self.app.style(tk.Label(
+                self.image_preview_frame,
+                text=f"已选择: {filename}",
+                font=('Arial', 10)
+            ), bg='panel_bg', fg='muted_text')
+            filename_label.pack()
+            
+        except Exception as e:
+            messagebox.showerror("错误", f"无法加载图片: {str(e)}")
+            self.selected_image_path = None
+            self.clear_image_btn.config(state='disabled')
+    
+    def clear_image_preview(self):
+        """清除图片预览"""
+        for widget in self.image_preview_frame.winfo_children():
+            widget.destroy()
+    
+    def save_tea_record(self, tea_data, eval_window):
+        """保存茶记录"""
+        rating = self.rating_var.get()
+        notes = self.notes_text.get("1.0", tk.END).strip()
+        
+        if not notes:
+            messagebox.showwarning("提示", "请输入品茶笔记！")
+            return
+        
+        # 创建记录（Record create）
+        # 中文说明：使用 dict.get 安全读取可能不存在的字段（如 intervals），避免 KeyError 导致无法保存。
+        try:
+            record = self.app.store.build_record(tea_data, rating, notes)
+        except Exception as e:
+            messagebox.showerror("错误", f"创建茶记录失败：{str(e)}")
+            return
+        
+        # 追加并保存记录
+        try:
+            self.app.store.add_tea_record(record)
+        except Exception as e:
+            messagebox.showerror("错误", f"保存失败：{str(e)}")
+            return
+        
+        # 处理图片保存（Image save）
+        # 中文说明：使用 getattr 安全获取 selected_image_path，避免未选择图片时出现 AttributeError。
+        # 图片的哈希、旋转、缩小和重新编码都在后台线程中进行，完成后再登记到这条茶记。
+        selected_image_path = getattr(self, 'selected_image_path', None)
+        if selected_image_path:
+            try:
+                self.app.import_record_image(selected_image_path, record['id'])
+            except Exception as e:
+                messagebox.showerror("错误", f"茶记已保存，但图片保存失败：{str(e)}")
+        
+        # 先关闭评价窗口，图片在后台继续处理
+        eval_window.destroy()
+        messagebox.showinfo("成功", "茶记保存成功！")
+        # 保存成功后，重置选中的图片路径，避免下次误用（cleanup）╰(°▽°)╯
+        self.selected_image_path = None
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+主页
+"""
+
+import tkinter as tk
+
+from pages.base import BasePage
+
+
+class HomePage(BasePage):
+    """主页：功能按钮和右侧冲泡状态边栏"""
+
+    def build(self):
+        """创建主界面"""
+        # 设置背景图片
+        self.app.setup_background(self.frame)
+        
+        # 创建主容器框架（半透明）
+        main_container = tk.Frame(self.frame, bg='')
+        main_container.pack(fill='both', expand=True)
+        
+        # 创建左侧主内容区域（半透明背景）
+        main_content = self.app.style(tk.Frame(main_container, relief='raised', bd=2), bg='panel_bg')
+        main_content.pack(side='left', fill='both', expand=True, padx=20, pady=20)
+        
+        # 创建右侧边栏（豪华风格）
+        sidebar = self.app.style(tk.Frame(main_container, width=250, relief='raised', bd=4), bg=('sidebar_bg', 'text_color_3'))
+        sidebar.pack(side='right', fill='y', padx=(10, 20), pady=20)
+        sidebar.pack_propagate(False)  # 防止边栏收缩
+        
+        # 标题（增强视觉效果，添加背景）
+        title_frame = self.app.style(tk.Frame(main_content, relief='ridge', bd=3), bg='header_bg')
+        title_frame.pack(pady=20, padx=20, fill='x')
+        
+        title_label = self.app.style(tk.Label(
+            title_frame, 
+            text="🍵 红茶冲泡定时提醒程序 🍵", 
+            padx=20,
+            pady=10
+        ), font=('title_font', 24, "bold"), bg='header_bg', fg='header_text')
+        title_label.pack()
+        
+        # 副标题（优雅风格，添加背景）
+        subtitle_frame = self.app.style(tk.Frame(main_content, relief='groove', bd=2), bg='subheader_bg')
+        subtitle_frame.pack(pady=5, padx=40, fill='x')
+        
+        subtitle_label = self.app.style(tk.Label(
+            subtitle_frame,
+            text="专业红茶品尝家的冲泡助手",
+            padx=15,
+            pady=5
+        ), font=('subtitle_font', 14, "italic"), bg='subheader_bg', fg='body_text')
+        subtitle_label.pack()
+        
+        # 主按钮框架（添加背景）
+        button_frame = self.app.style(tk.Frame(main_content, relief='sunken', bd=2), bg='panel_bg')
+        button_frame.pack(pady=50, padx=30, fill='x')
+        
+        # 创建茶种按钮（豪华风格，增强对比度）
+        create_button = self.app.style(tk.Button(
+            button_frame,
+            text="🌿 创建新茶种",
+            relief='raised',
+            bd=4,
+            padx=20,
+            pady=12,
+            cursor='hand2'
+        ), font=('font_family', 16, "bold"), bg='nav_create', fg='header_text', activebackground='nav_create_active', activeforeground='nav_active_text')
+        create_button.pack(pady=12, fill='x', padx=20)
+        create_button.config(command=self.app.show_create_tea_page)
+        
+        # 茶柜按钮（增强对比度）
+        closet_button = self.app.style(tk.Button(
+            button_frame,
+            text="🏺 我的茶柜",
+            relief='raised',
+            bd=4,
+            padx=20,
+            pady=12,
+            cursor='hand2'
+        ), font=('font_family', 16, "bold"), bg='nav_closet', fg='header_text', activebackground='nav_closet_active', activeforeground='nav_active_text')
+        closet_button.pack(pady=12, fill='x', padx=20)
+        closet_button.config(command=self.app.show_tea_closet_page)
+        
+        # 设置按钮（增强对比度）
+        settings_button = self.app.style(tk.Button(
+            button_frame,
+            text="⚙️ 设置",
+            relief='raised',
+            bd=4,
+            padx=20,
+            pady=12,
+            cursor='hand2'
+        ), font=('font_family', 16, "bold"), bg='nav_settings', fg='header_text', activebackground='nav_settings_active', activeforeground='nav_active_text')
+        settings_button.pack(pady=12, fill='x', padx=20)
+        settings_button.config(command=self.app.show_settings_page)
+        
+        # 茶记按钮（新增）
+        tea_notes_button = self.app.style(tk.Button(
+            button_frame,
+            text="📝 茶记",
+            relief='raised',
+            bd=4,
+            padx=20,
+            pady=12,
+            cursor='hand2'
+        ), font=('font_family', 16, "bold"), bg='nav_notes', fg='header_text', activebackground='nav_notes_active', activeforeground='nav_active_text')
+        tea_notes_button.pack(pady=12, fill='x', padx=20)
+        tea_notes_button.config(command=self.app.show_tea_notes_page)
+        
+        # 信息标签（添加背景）
+        info_frame = self.app.style(tk.Frame(main_content, relief='groove', bd=2), bg='highlight_bg')
+        info_frame.pack(pady=30, padx=40, fill='x')
+        
+        info_label = self.app.style(tk.Label(
+            info_frame,
+            text="让每一泡茶都恰到好处 ☕",
+            padx=15,
+            pady=8
+        ), font=('font_family', 12, "italic"), bg='highlight_bg', fg='heading_text')
+        info_label.pack()
+        
+        # 创建边栏内容（边栏组件由应用管理，冲泡状态变化时原地更新）
+        self.app.sidebar = sidebar
+        self.app.create_sidebar_content()
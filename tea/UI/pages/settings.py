@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+设置页面
+"""
+
+import tkinter as tk
+from tkinter import messagebox, filedialog
+import os
+
+from pages.base import BasePage
+
+
+class SettingsPage(BasePage):
+    """设置页面：主题、自定义背景和按钮样式"""
+
+    def build(self):
+        """创建设置页面"""
+        # 标题
+        title_label = self.app.style(tk.Label(
+            self.frame,
+            text="⚙️ 程序设置"
+        ), font=('title_font', 20, "bold"), bg='bg_color', fg='text_color')
+        title_label.pack(pady=30)
+        
+        # 设置框架
+        settings_frame = self.app.style(tk.Frame(self.frame), bg='bg_color')
+        settings_frame.pack(padx=50, pady=30, fill='both', expand=True)
+        
+        # 主题设置标题
+        theme_title = self.app.style(tk.Label(
+            settings_frame,
+            text="🎨 UI主题风格"
+        ), font=('font_family', 16, "bold"), bg='bg_color', fg='text_color')
+        theme_title.pack(pady=(0, 20))
+        
+        # 主题选择框架
+        theme_frame = self.app.style(tk.Frame(settings_frame), bg='bg_color')
+        theme_frame.pack(pady=20)
+        
+        # 主题选择变量
+        self.theme_var = tk.StringVar(value=self.app.current_theme)
+        
+        # 创建主题选择按钮
+        for theme_key, theme_info in self.app.themes.items():
+            theme_button = self.app.style(tk.Radiobutton(
+                theme_frame,
+                text=f"{theme_info['name']} - {theme_key}",
+                variable=self.theme_var,
+                value=theme_key,
+                command=self.preview_theme
+            ), font=('font_family', 14), bg='bg_color', fg='text_color_2', selectcolor='button_color', activebackground='bg_color', activeforeground='text_color')
+            theme_button.pack(anchor='w', pady=5)
+        
+        # 主题预览说明
+        preview_label = self.app.style(tk.Label(
+            settings_frame,
+            text="💡 选择主题后会立即预览效果"
+        ), font=('font_family', 12), bg='bg_color', fg='text_color_2')
+        preview_label.pack(pady=10)
+        
+        # 分隔线
+        separator1 = self.app.style(tk.Frame(settings_frame, height=2), bg='text_color_2')
+        separator1.pack(fill='x', pady=20)
+        
+        # 自定义背景设置标题
+        custom_bg_title = self.app.style(tk.Label(
+            settings_frame,
+            text="🖼️ 自定义背景图片"
+        ), font=('font_family', 16, "bold"), bg='bg_color', fg='text_color')
+        custom_bg_title.pack(pady=(0, 20))
+        
+        # 自定义背景框架
+        custom_bg_frame = self.app.style(tk.Frame(settings_frame), bg='bg_color')
+        custom_bg_frame.pack(pady=10, fill='x')
+        
+        # 当前背景显示
+        self.current_bg_label = self.app.style(tk.Label(
+            custom_bg_frame,
+            text=f"当前背景: {'自定义图片' if self.app.custom_background_path else '默认背景'}"
+        ), font=('font_family', 12), bg='bg_color', fg='text_color_2')
+        self.current_bg_label.pack(pady=5)
+        
+        # 背景选择按钮框架
+        bg_button_frame = self.app.style(tk.Frame(custom_bg_frame), bg='bg_color')
+        bg_button_frame.pack(pady=10)
+        
+        # 选择背景图片按钮
+        select_bg_button = self.app.style(tk.Button(
+            bg_button_frame,
+            text="📁 选择背景图片",
+            fg='white',
+            relief='raised',
+            bd=3,
+            padx=15,
+            pady=8,
+            command=self.select_custom_background
+        ), font=('font_family', 12, "bold"), bg='action_success', activebackground='action_success_active')
+        select_bg_button.pack(side='left', padx=5)
+        
+        # 重置背景按钮
+        reset_bg_button = self.app.style(tk.Button(
+            bg_button_frame,
+            text="🔄 重置为默认",
+            fg='white',
+            relief='raised',
+            bd=3,
+            padx=15,
+            pady=8,
+            command=self.reset_custom_background
+        ), font=('font_family', 12, "bold"), bg='action_warning', activebackground='action_warning_active')
+        reset_bg_button.pack(side='left', padx=5)
+        
+        # 预览背景按钮
+        preview_bg_button = self.app.style(tk.Button(
+            bg_button_frame,
+            text="👁️ 预览效果",
+            fg='white',
+            relief='raised',
+            bd=3,
+            padx=15,
+            pady=8,
+            command=self.preview_custom_background
+        ), font=('font_family', 12, "bold"), bg='action_info', activebackground='action_info_active')
+        preview_bg_button.pack(side='left', padx=5)
+        
+        # 分隔线2
+        separator2 = self.app.style(tk.Frame(settings_frame, height=2), bg='text_color_2')
+        separator2.pack(fill='x', pady=20)
+        
+        # 自定义按钮背景设置标题
+        custom_btn_title = self.app.style(tk.Label(
+            settings_frame,
+            text="🎨 自定义按钮样式"
+        ), font=('font_family', 16, "bold"), bg='bg_color', fg='text_color')
+        custom_btn_title.pack(pady=(0, 20))
+        
+        # 自定义按钮框架
+        custom_btn_frame = self.app.style(tk.Frame(settings_frame), bg='bg_color')
+        custom_btn_frame.pack(pady=10, fill='x')
+        
+        # 当前按钮样式显示
+        current_btn_label = self.app.style(tk.Label(
+            custom_btn_frame,
+            text=f"当前按钮样式: {'自定义样式' if self.app.custom_button_background_path else '默认样式'}"
+        ), font=('font_family', 12), bg='bg_color', fg='text_color_2')
+        current_btn_label.pack(pady=5)
+        
+        # 按钮样式选择按钮框架
+        btn_button_frame = self.app.style(tk.Frame(custom_btn_frame), bg='bg_color')
+        btn_button_frame.pack(pady=10)
+        
+        # 选择按钮背景图片按钮
+        select_btn_bg_button = self.app.style(tk.Button(
+            btn_button_frame,
+            text="🎨 选择按钮背景",
+            fg='white',
+            relief='raised',
+            bd=3,
+            padx=15,
+            pady=8,
+            command=self.select_custom_button_background
+        ), font=('font_family', 12, "bold"), bg='action_special', activebackground='action_special_active')
+        select_btn_bg_button.pack(side='left', padx=5)
+        
+        # 重置按钮样式按钮
+        reset_btn_bg_button = self.app.style(tk.Button(
+            btn_button_frame,
+            text="🔄 重置按钮样式",
+            fg='white',
+            relief='raised',
+            bd=3,
+            padx=15,
+            pady=8,
+            command=self.reset_custom_button_background
+        ), font=('font_family', 12, "bold"), bg='action_danger', activebackground='action_danger_active')
+        reset_btn_bg_button.pack(side='left', padx=5)
+        
+        # 按钮框架
+        button_frame = self.app.style(tk.Frame(self.frame), bg='bg_color')
+        button_frame.pack(pady=30)
+        
+        # 保存设置按钮
+        save_button = self.app.style(tk.Button(
+            button_frame,
+            text="💾 保存设置",
+            fg='white',
+            width=12,
+            height=2,
+            command=self.save_theme_settings
+        ), font=('font_family', 14, "bold"), bg='button_color_3')
+        save_button.pack(side='left', padx=10)
+        
+        # 返回按钮
+        back_button = self.app.style(tk.Button(
+            button_frame,
+            text="🔙 返回主页",
+            fg='white',
+            width=12,
+            height=2,
+            command=self.app.create_main_interface
+        ), font=('font_family', 14, "bold"), bg='button_color_4')
+        back_button.pack(side='left', padx=10)
+
+    def refresh(self):
+        """同步当前主题和背景设置"""
+        self.theme_var.set(self.app.current_theme)
+        self.current_bg_label.config(
+            text=f"当前背景: {'自定义图片' if self.app.custom_background_path else '默认背景'}"
+        )
+
+    def preview_theme(self):
+        """预览主题效果"""
+        selected_theme = self.theme_var.get()
+        if selected_theme != self.app.current_theme:
+            # 临时切换主题进行预览
+            old_theme = self.app.current_theme
+            self.app.current_theme = selected_theme
+            # 所有已创建的页面原地换成新主题的颜色
+            self.app.apply_theme()
+
+    def save_theme_settings(self):
+        """保存主题设置"""
+        selected_theme = self.theme_var.get()
+        self.app.current_theme = selected_theme
+        self.app.save_settings()
+        self.app.apply_theme()
+        messagebox.showinfo("设置保存", f"主题已切换为：{self.app.themes[selected_theme]['name']}")
+        self.app.create_main_interface()
+    
+    def select_custom_background(self):
+        """选择自定义背景图片"""
+        try:
+            # 支持的图片格式
+            filetypes = [
+                ("图片文件", "*.jpg *.jpeg *.png *.gif *.bmp"),
+                ("JPEG文件", "*.jpg *.jpeg"),
+                ("PNG文件", "*.png"),
+                ("GIF文件", "*.gif"),
+                ("BMP文件", "*.bmp"),
+                ("所有文件", "*.*")
+            ]
+            
+            # 打开文件选择对话框
+            file_path = filedialog.askopenfilename(
+                title="选择背景图片",
+                filetypes=filetypes,
+                initialdir=os.path.expanduser("~")  # 从用户主目录开始
+            )
+            
+            if file_path:
+                # 验证图片文件
+                try:
+                    # 缩小到窗口最大尺寸后另存一份副本，设置中引用副本（无效图片会抛出异常）
+                    self.root.config(cursor='watch')
+                    self.root.update_idletasks()
+                    try:
+                        self.app.custom_background_path = self.app.import_custom_background(file_path)
+                    finally:
+                        self.root.config(cursor='')
+                    
+                    # 立即预览效果
+                    self.preview_custom_background()
+                    
+                    messagebox.showinfo("成功", f"背景图片已选择：\n{os.path.basename(file_path)}")
+                    
+                except Exception as e:
+                    messagebox.showerror("错误", f"无效的图片文件：\n{str(e)}")
+                    
+        except Exception as e:
+            messagebox.showerror("错误", f"选择图片失败：\n{str(e)}")
+    
+    def reset_custom_background(self):
+        """重置为默认背景"""
+        try:
+            self.app.custom_background_path = None
+            self.app.refresh_background(force=True)
+            self.show()  # 刷新设置页面
+            messagebox.showinfo("成功", "已重置为默认背景")
+        except Exception as e:
+            messagebox.showerror("错误", f"重置背景失败：\n{str(e)}")
+    
+    def preview_custom_background(self):
+        """预览自定义背景效果"""
+        try:
+            # 重新加载背景图片，已创建的页面原地更换背景
+            self.app.refresh_background(force=True)
+            # 刷新设置页面的当前背景说明
+            self.show()
+        except Exception as e:
+            messagebox.showerror("错误", f"预览背景失败：\n{str(e)}")
+    
+    def select_custom_button_background(self):
+        """选择自定义按钮背景图片"""
+        from tkinter import filedialog
+        
+        file_path = filedialog.askopenfilename(
+            title="选择按钮背景图片",
+            filetypes=[
+                ("图片文件", "*.jpg *.jpeg *.png *.gif *.bmp"),
+                ("JPEG文件", "*.jpg *.jpeg"),
+                ("PNG文件", "*.png"),
+                ("GIF文件", "*.gif"),
+                ("BMP文件", "*.bmp"),
+                ("所有文件", "*.*")
+            ]
+        )
+        
+        if file_path:
+            try:
+                # 验证图片文件
+                from PIL import Image
+                with Image.open(file_path) as img:
+                    # 检查图片尺寸
+                    width, height = img.size
+                    if width < 50 or height < 50:
+                        messagebox.showwarning("警告", "图片尺寸太小，建议选择至少50x50像素的图片！")
+                        return
+                    
+                    # 保存路径
+                    self.app.custom_button_background_path = file_path
+                    messagebox.showinfo("成功", f"按钮背景图片已选择：\n{file_path}")
+                    
+                    # 立即应用效果
+                    self.apply_custom_button_styles()
+                    
+            except Exception as e:
+                messagebox.showerror("错误", f"无法加载图片文件：\n{str(e)}")
+    
+    def reset_custom_button_background(self):
+        """重置按钮背景为默认样式"""
+        self.app.custom_button_background_path = None
+        self.app.custom_button_images = {}
+        messagebox.showinfo("重置", "按钮样式已重置为默认！")
+        
+        # 重新应用主题样式
+        self.app.apply_theme()
+    
+    def apply_custom_button_styles(self):
+        """应用自定义按钮样式"""
+        if not self.app.custom_button_background_path:
+            return
+            
+        try:
+            # 生成（或读取已有的）按钮图集，各种尺寸的按钮背景从图集中取出
+            self.app.load_button_sprites(raise_errors=True)
+            messagebox.showinfo("成功", "自定义按钮样式已应用！")
+            
+        except Exception as e:
+            messagebox.showerror("错误", f"应用按钮样式时出错：\n{str(e)}")
+            self.app.custom_button_background_path = None
+            self.app.custom_button_images = {}
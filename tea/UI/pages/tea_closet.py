@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+茶柜页面
+"""
+
+import tkinter as tk
+from tkinter import messagebox
+import os
+
+from pages.base import BasePage
+
+
+class TeaClosetPage(BasePage):
+    """茶柜页面：浏览、查看、冲泡和删除茶种"""
+
+    def build(self):
+        """创建茶柜页面"""
+        # 标题
+        title_label = self.app.style(tk.Label(
+            self.frame,
+            text="🗄️ 我的茶柜"
+        ), font=('title_font', 20, "bold"), bg='bg_color', fg='text_color')
+        title_label.pack(pady=20)
+        
+        # 茶种列表框架
+        list_frame = self.app.style(tk.Frame(self.frame), bg='bg_color')
+        list_frame.pack(padx=50, pady=20, fill='both', expand=True)
+        
+        # 创建列表框和滚动条
+        listbox_frame = self.app.style(tk.Frame(list_frame), bg='bg_color')
+        listbox_frame.pack(fill='both', expand=True)
+        
+        scrollbar = tk.Scrollbar(listbox_frame)
+        scrollbar.pack(side='right', fill='y')
+        
+        self.tea_listbox = self.app.style(tk.Listbox(
+            listbox_frame,
+            yscrollcommand=scrollbar.set,
+            selectmode='single',
+            height=15
+        ), font=('font_family', 12), bg='text_color_3', fg='bg_color')
+        self.tea_listbox.pack(side='left', fill='both', expand=True)
+        scrollbar.config(command=self.tea_listbox.yview)
+        
+        # 按钮框架
+        button_frame = self.app.style(tk.Frame(self.frame), bg='bg_color')
+        button_frame.pack(pady=20)
+        
+        # 查看详情按钮
+        view_button = self.app.style(tk.Button(
+            button_frame,
+            text="👁️ 查看详情",
+            fg='white',
+            width=12,
+            command=self.view_tea_details
+        ), font=('font_family', 12, "bold"), bg='button_color_5')
+        view_button.pack(side='left', padx=10)
+        
+        # 开始冲泡按钮
+        brew_button = self.app.style(tk.Button(
+            button_frame,
+            text="☕ 开始冲泡",
+            fg='white',
+            width=12,
+            command=self.start_brewing
+        ), font=('font_family', 12, "bold"), bg='button_color')
+        brew_button.pack(side='left', padx=10)
+        
+        # 删除茶种按钮
+        delete_button = self.app.style(tk.Button(
+            button_frame,
+            text="🗑️ 删除茶种",
+            fg='white',
+            width=12,
+            command=self.delete_tea
+        ), font=('font_family', 12, "bold"), bg='button_color_4')
+        delete_button.pack(side='left', padx=10)
+        
+        # 返回按钮
+        back_button = self.app.style(tk.Button(
+            button_frame,
+            text="🔙 返回主页",
+            fg='white',
+            width=12,
+            command=self.app.create_main_interface
+        ), font=('font_family', 12, "bold"), bg='button_color_6')
+        back_button.pack(side='left', padx=10)
+
+    def data_signature(self):
+        """茶柜文件有增删改时才重新加载列表"""
+        return self.app.store.closet_signature()
+
+    def refresh(self):
+        self.load_tea_list()
+
+    def load_tea_list(self):
+        """加载茶种列表"""
+        self.tea_listbox.delete(0, tk.END)
+        self.tea_files = []
+        
+        try:
+            for filepath, tea_data in self.app.store.list_teas():
+                try:
+                    display_text = f"🍵 {tea_data['name']} - {tea_data['water_temp']}°C - {tea_data['pour_count']}次倒茶"
+                    self.tea_listbox.insert(tk.END, display_text)
+                    self.tea_files.append(filepath)
+                except Exception as e:
+                    print(f"加载茶种文件 {os.path.basename(filepath)} 失败: {e}")
+            
+            if not self.tea_files:
+                self.tea_listbox.insert(tk.END, "暂无茶种，请先创建茶种实例")
+                
+        except Exception as e:
+            messagebox.showerror("错误", f"加载茶柜失败：{str(e)}")
+
+    def view_tea_details(self):
+        """查看茶种详情"""
+        selection = self.tea_listbox.curselection()
+        if not selection:
+            messagebox.showwarning("提示", "请先选择一个茶种！")
+            return
+        
+        try:
+            filepath = self.tea_files[selection[0]]
+            tea_data = self.app.store.load_tea(filepath)
+            
+            # 创建详情窗口
+            detail_window = tk.Toplevel(self.root)
+            detail_window.title(f"茶种详情 - {tea_data['name']}")
+            detail_window.geometry("500x600")
+            self.app.style(detail_window, bg='bg_color')
+            # 注册弹窗以支持 ESC 关闭（Toplevel window register）
+            self.app.register_toplevel(detail_window)
+            
+            # 详情内容
+            detail_text = f"""
+🍵 茶叶名称: {tea_data['name']}
+🌡️ 冲泡水温: {tea_data['water_temp']}°C
+🫖 使用茶具: {tea_data['tea_ware']}
+💧 水量: {tea_data['water_amount']}ml
+⚖️ 茶叶重量: {tea_data.get('tea_weight', '未设置')}g
+🥛 是否加奶: {'是' if tea_data['add_milk'] else '否'}
+🔢 倒茶次数: {tea_data['pour_count']}次
+
+⏰ 倒茶时间安排:
+"""
+            
+            for i, pour_time in enumerate(tea_data['pour_times']):
+                minutes = pour_time // 60
+                seconds = pour_time % 60
+                if minutes > 0:
+                    time_str = f"{minutes}分{seconds}秒" if seconds > 0 else f"{minutes}分"
+                else:
+                    time_str = f"{seconds}秒"
+                detail_text += f"   第{i+1}次: {time_str}后\n"
+            
+            detail_text += f"\n📅 创建时间: {tea_data['created_time']}"
+            
+            text_widget = self.app.style(tk.Text(
+                detail_window,
+                wrap='word',
+                padx=20,
+                pady=20
+            ), font=('font_family', 12), bg='text_color_3', fg='bg_color')
+            text_widget.pack(fill='both', expand=True, padx=20, pady=20)
+            text_widget.insert('1.0', detail_text)
+            text_widget.config(state='disabled')
+            
+        except Exception as e:
+            messagebox.showerror("错误", f"查看详情失败：{str(e)}")
+
+    def start_brewing(self):
+        """开始冲泡"""
+        selection = self.tea_listbox.curselection()
+        if not selection:
+            messagebox.showwarning("提示", "请先选择一个茶种！")
+            return
+        
+        try:
+            filepath = self.tea_files[selection[0]]
+            tea_data = self.app.store.load_tea(filepath)
+            
+            # 确认开始冲泡
+            result = messagebox.askyesno(
+                "开始冲泡",
+                f"确定要开始冲泡 '{tea_data['name']}' 吗？\n\n"
+                f"水温: {tea_data['water_temp']}°C\n"
+                f"茶具: {tea_data['tea_ware']}\n"
+                f"水量: {tea_data['water_amount']}ml\n"
+                f"倒茶次数: {tea_data['pour_count']}次\n"
+                f"是否加奶: {'是' if tea_data['add_milk'] else '否'}"
+            )
+            
+            if result:
+                # 开始新的冲泡定时器
+                self.app.start_brewing_timers(tea_data)
+                messagebox.showinfo("开始冲泡", f"'{tea_data['name']}' 冲泡计时已开始！\n请准备好茶具和热水。")
+                
+        except Exception as e:
+            messagebox.showerror("错误", f"开始冲泡失败：{str(e)}")
+
+    def delete_tea(self):
+        """删除茶种"""
+        selection = self.tea_listbox.curselection()
+        if not selection:
+            messagebox.showwarning("提示", "请先选择要删除的茶种！")
+            return
+        
+        try:
+            filepath = self.tea_files[selection[0]]
+            tea_data = self.app.store.load_tea(filepath)
+            
+            result = messagebox.askyesno(
+                "确认删除",
+                f"确定要删除茶种 '{tea_data['name']}' 吗？\n此操作不可恢复！"
+            )
+            
+            if result:
+                os.remove(filepath)
+                messagebox.showinfo("删除成功", f"茶种 '{tea_data['name']}' 已删除！")
+                self.load_tea_list()  # 重新加载列表
+                
+        except Exception as e:
+            messagebox.showerror("错误", f"删除失败：{str(e)}")
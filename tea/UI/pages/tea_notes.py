@@ -0,0 +1,579 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+茶记页面
+"""
+
+import tkinter as tk
+from tkinter import messagebox, filedialog
+import json
+import os
+import time
+from collections import OrderedDict
+from PIL import Image, ImageTk
+
+from pages.base import BasePage
+from record_images import load_thumbnail
+
+
+class RecordViewCache:
+    """茶记详情的内存 LRU：(记录 id, 图片修改时间) -> (详情文字, 缩略图 PhotoImage)
+
+    按缩略图的像素字节数（宽×高×4）加上文字的字节数限制总大小，而不是按条数。
+    有图片的记录在缩略图读取完成前只缓存了文字，这时 get() 计为未命中。
+    只在主线程中使用；timer 为 OperationTimer（可选），记录命中次数。
+    """
+
+    def __init__(self, max_bytes=8 * 1024 * 1024, timer=None):
+        self.max_bytes = max_bytes
+        self.timer = timer
+        self.total_bytes = 0
+        self._entries = OrderedDict()
+        self.stats = {'hit': 0, 'miss': 0}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _count(self, name):
+        self.stats[name] += 1
+        if self.timer is not None:
+            self.timer.count(f'notes_cache.{name}')
+
+    @staticmethod
+    def entry_bytes(text, photo):
+        size = len(text.encode('utf-8'))
+        if photo is not None:
+            size += photo.width() * photo.height() * 4
+        return size
+
+    def get(self, key):
+        """返回 (详情文字, 缩略图)，没有缓存时返回 None；缩略图还没有缓存时为 None"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._count('miss')
+            return None
+        self._entries.move_to_end(key)
+        text, photo, _ = entry
+        # key[1] 为 None 表示这条记录没有图片
+        self._count('hit' if photo is not None or key[1] is None else 'miss')
+        return text, photo
+
+    def put(self, key, text, photo=None):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.total_bytes -= old[2]
+        size = self.entry_bytes(text, photo)
+        self._entries[key] = (text, photo, size)
+        self.total_bytes += size
+        # 至少保留刚放入的一条
+        while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+            _, (_, _, evicted) = self._entries.popitem(last=False)
+            self.total_bytes -= evicted
+
+    def add_photo(self, key, photo):
+        """为已缓存文字的记录补上读取完成的缩略图（不计入命中次数）"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.put(key, entry[0], photo)
+
+    def clear(self):
+        self._entries.clear()
+        self.total_bytes = 0
+
+
+class TeaNotesPage(BasePage):
+    """茶记页面：浏览、导出和删除品茶记录"""
+
+    def build(self):
+        """创建茶记页面"""
+        # 正在后台读取的茶记图片；序号递增使已在读取的旧结果作废
+        self.image_generation = 0
+        self.image_future = None
+        # 最近查看过的记录的详情文字和缩略图，来回切换时不再读取和格式化
+        self.view_cache = RecordViewCache(timer=self.app.ui_timer)
+        
+        # 设置背景
+        self.app.setup_background(self.frame)
+        
+        # 主容器
+        main_container = self.app.style(tk.Frame(self.frame, relief='raised', bd=3), bg='panel_bg')
+        main_container.pack(fill='both', expand=True, padx=20, pady=20)
+        
+        # 标题框架
+        title_frame = self.app.style(tk.Frame(main_container, relief='groove', bd=2), bg='highlight_bg')
+        title_frame.pack(fill='x', pady=(0, 20))
+        
+        title_label = self.app.style(tk.Label(
+            title_frame,
+            text="📝 茶记管理",
+            pady=15
+        ), font=('title_font', 24, "bold"), bg='highlight_bg', fg='heading_text')
+        title_label.pack()
+        
+        # 内容框架
+        content_frame = self.app.style(tk.Frame(main_container), bg='panel_bg')
+        content_frame.pack(fill='both', expand=True)
+        
+        # 左侧：记录列表
+        left_frame = self.app.style(tk.Frame(content_frame, relief='sunken', bd=2), bg='panel_bg')
+        left_frame.pack(side='left', fill='both', expand=True, padx=(0, 10))
+        
+        # 列表标题
+        list_title = self.app.style(tk.Label(
+            left_frame,
+            text="历史茶记"
+        ), font=('font_family', 16, "bold"), bg='panel_bg', fg='heading_text')
+        list_title.pack(pady=10)
+        
+        # 记录列表框架
+        list_frame = self.app.style(tk.Frame(left_frame), bg='panel_bg')
+        list_frame.pack(fill='both', expand=True, padx=10, pady=10)
+        
+        # 滚动条
+        scrollbar = tk.Scrollbar(list_frame)
+        scrollbar.pack(side='right', fill='y')
+        
+        # 列表框
+        self.records_listbox = self.app.style(tk.Listbox(
+            list_frame,
+            yscrollcommand=scrollbar.set,
+            height=15
+        ), font=('font_family', 11), bg='card_bg', fg='body_text', selectbackground='highlight_bg')
+        self.records_listbox.pack(side='left', fill='both', expand=True)
+        scrollbar.config(command=self.records_listbox.yview)
+        
+        # 右侧：详情和操作
+        right_frame = self.app.style(tk.Frame(content_frame, relief='sunken', bd=2), bg='panel_bg')
+        right_frame.pack(side='right', fill='both', expand=True, padx=(10, 0))
+        
+        # 详情标题
+        detail_title = self.app.style(tk.Label(
+            right_frame,
+            text="茶记详情"
+        ), font=('font_family', 16, "bold"), bg='panel_bg', fg='heading_text')
+        detail_title.pack(pady=10)
+        
+        # 详情显示区域容器
+        detail_container = self.app.style(tk.Frame(right_frame), bg='panel_bg')
+        detail_container.pack(pady=10, padx=10, fill='both', expand=True)
+        
+        # 图片显示区域
+        self.image_display_frame = self.app.style(tk.Frame(detail_container, relief='sunken', bd=2), bg='card_bg')
+        self.image_display_frame.pack(fill='x', pady=(0, 10))
+        
+        # 文字详情显示区域
+        self.detail_text = self.app.style(tk.Text(
+            detail_container,
+            height=10,
+            width=40,
+            relief='sunken',
+            bd=2,
+            wrap='word',
+            state='disabled'
+        ), font=('font_family', 11), bg='card_bg', fg='body_text')
+        self.detail_text.pack(fill='both', expand=True)
+        
+        # 操作按钮框架
+        button_frame = self.app.style(tk.Frame(right_frame), bg='panel_bg')
+        button_frame.pack(pady=20)
+        
+        # 查看趋势按钮
+        trend_btn = self.app.style(tk.Button(
+            button_frame,
+            text="📊 查看趋势",
+            fg='white',
+            relief='raised',
+            bd=3,
+            padx=15,
+            pady=8,
+            command=self.app.show_trend_analysis
+        ), font=('font_family', 12, "bold"), bg='action_info', activebackground='action_info_active')
+        trend_btn.pack(pady=5, fill='x')
+        
+        # 另存为按钮
+        save_as_btn = self.app.style(tk.Button(
+            button_frame,
+            text="💾 另存为",
+            fg='white',
+            relief='raised',
+            bd=3,
+            padx=15,
+            pady=8,
+            command=self.save_record_as
+        ), font=('font_family', 12, "bold"), bg='action_warning', activebackground='action_warning_active')
+        save_as_btn.pack(pady=5, fill='x')
+        
+        # 删除记录按钮
+        delete_btn = self.app.style(tk.Button(
+            button_frame,
+            text="🗑️ 删除记录",
+            fg='white',
+            relief='raised',
+            bd=3,
+            padx=15,
+            pady=8,
+            command=self.delete_tea_record
+        ), font=('font_family', 12, "bold"), bg='action_danger', activebackground='action_danger_active')
+        delete_btn.pack(pady=5, fill='x')
+        
+        # 生成日报告按钮
+        daily_report_btn = self.app.style(tk.Button(
+            button_frame,
+            text="📊 生成日报告",
+            fg='white',
+            relief='raised',
+            bd=3,
+            padx=15,
+            pady=8,
+            command=self.app.generate_daily_report
+        ), font=('font_family', 12, "bold"), bg='action_special', activebackground='action_special_active')
+        daily_report_btn.pack(pady=5, fill='x')
+        
+        # 返回按钮
+        back_btn = self.app.style(tk.Button(
+            button_frame,
+            text="🏠 返回首页",
+            fg='white',
+            relief='raised',
+            bd=3,
+            padx=15,
+            pady=8,
+            command=self.app.create_main_interface
+        ), font=('font_family', 12, "bold"), bg='action_success', activebackground='action_success_active')
+        back_btn.pack(pady=5, fill='x')
+        
+        # 绑定列表选择事件
+        self.records_listbox.bind('<<ListboxSelect>>', self.on_record_select)
+    
+    def data_signature(self):
+        """茶记文件变化（新增、删除记录）时才重新加载"""
+        return self.app.store.records_signature()
+    
+    def refresh(self):
+        """重新加载茶记录并清空详情显示"""
+        self.load_records_list()
+        self.clear_record_detail()
+    
+    def clear_record_detail(self):
+        """清空详情和图片显示"""
+        self.cancel_record_image()
+        self.detail_text.config(state='normal')
+        self.detail_text.delete('1.0', tk.END)
+        self.detail_text.config(state='disabled')
+        for widget in self.image_display_frame.winfo_children():
+            widget.destroy()
+    
+    def load_records_list(self):
+        """加载茶记录列表"""
+        self.records_listbox.delete(0, tk.END)
+        records = self.app.load_tea_records()
+        
+        # 按时间倒序排列
+        records.sort(key=lambda x: x['brewing_time'], reverse=True)
+        
+        for record in records:
+            # 格式化显示
+            stars = "⭐" * record['rating']
+            display_text = f"{record['brewing_time'][:10]} | {record['tea_name']} | {stars} ({record['rating']}/10)"
+            self.records_listbox.insert(tk.END, display_text)
+        
+        # 存储记录数据供后续使用
+        self.current_records = records
+    
+    def on_record_select(self, event):
+        """处理记录选择事件"""
+        selection = self.records_listbox.curselection()
+        if not selection:
+            return
+        
+        index = selection[0]
+        if index >= len(self.current_records):
+            return
+        
+        record = self.current_records[index]
+        self.selected_record = record  # 保存选中的记录
+        
+        # 清除之前的图片显示
+        for widget in self.image_display_frame.winfo_children():
+            widget.destroy()
+        
+        key = self.record_view_key(record)
+        cached = self.view_cache.get(key)
+        if cached is None:
+            detail_info, photo = self.format_record_detail(record), None
+            self.view_cache.put(key, detail_info)
+        else:
+            detail_info, photo = cached
+        
+        # 显示图片（如果有）；没有缓存时在后台读取，快速切换选择时只显示最后选中的那条
+        if photo is not None:
+            self.cancel_record_image()
+            self.place_record_image(record['image_filename'], photo)
+        elif key[1] is not None:
+            self.display_record_image(record['image_filename'], key)
+        else:
+            self.cancel_record_image()
+        
+        # 显示详情
+        self.detail_text.config(state='normal')
+        self.detail_text.delete('1.0', tk.END)
+        self.detail_text.insert('1.0', detail_info)
+        self.detail_text.config(state='disabled')
+    
+    def record_view_key(self, record):
+        """详情缓存的键：(记录 id, 图片修改时间)；没有图片或图片还没保存好时修改时间为 None"""
+        mtime = None
+        if record.get('image_filename'):
+            try:
+                mtime = os.stat(os.path.join(self.app.images_path, record['image_filename'])).st_mtime_ns
+            except OSError:
+                pass
+        return record['id'], mtime
+    
+    def format_record_detail(self, record):
+        """记录详情的显示文字"""
+        return f"""茶种名称: {record['tea_name']}
+冲泡时间: {record['brewing_time']}
+美味评分: {"⭐" * record['rating']} ({record['rating']}/10)
+冲泡次数: {record['pour_count']}次
+是否加奶: {'是' if record['add_milk'] else '否'}
+
+品茶笔记:
+{record['notes']}
+
+冲泡参数:
+倒茶时间: {', '.join(map(str, record['brewing_params']['pour_times']))}秒
+间隔时间: {', '.join(map(str, record['brewing_params']['intervals']))}秒
+"""
+    
+    def cancel_record_image(self):
+        """取消尚未开始的图片读取，已在后台进行的结果到达时会被丢弃"""
+        self.image_generation += 1
+        if self.image_future is not None:
+            self.image_future.cancel()
+            self.image_future = None
+    
+    def display_record_image(self, image_filename, key):
+        """在后台线程中读取茶记录的图片，读取完成后回到主线程显示并放入详情缓存"""
+        self.cancel_record_image()
+        generation = self.image_generation
+        images_path = self.app.images_path
+        
+        def work():
+            # 用户已经选择了其他记录时直接放弃
+            if generation != self.image_generation:
+                return
+            try:
+                start = time.perf_counter()
+                # 只读取保存茶记时生成的缩略图（缺少时生成一次），点击后才加载原图
+                image = load_thumbnail(images_path, image_filename)
+                elapsed = time.perf_counter() - start
+            except Exception as e:
+                print(f"读取图片失败: {str(e)}")
+                return
+            try:
+                self.root.after(0, self.show_record_image, generation, key, image_filename, image, elapsed)
+            except (RuntimeError, tk.TclError):
+                # 主窗口已关闭
+                pass
+        
+        self.image_future = self.app.thumbnail_worker.submit(work)
+    
+    def show_record_image(self, generation, key, image_filename, image, elapsed):
+        """主线程：显示后台读取的图片（过期的结果直接丢弃）"""
+        if generation != self.image_generation or not self.is_built:
+            return
+        self.image_future = None
+        self.app.ui_timer.record('notes.thumbnail', elapsed)
+        if image is None:
+            return
+        # 转换为PhotoImage
+        photo = ImageTk.PhotoImage(image)
+        self.view_cache.add_photo(key, photo)
+        self.place_record_image(image_filename, photo)
+    
+    def place_record_image(self, image_filename, photo):
+        """在详情区显示缩略图，点击查看大图"""
+        try:
+            image_path = os.path.join(self.app.images_path, image_filename)
+            
+            # 创建图片标签
+            image_label = self.app.style(tk.Label(
+                self.image_display_frame,
+                image=photo,
+                cursor='hand2'
+            ), bg='card_bg')
+            image_label.image = photo  # 保持引用
+            image_label.pack(pady=10)
+            
+            # 绑定点击事件查看大图
+            image_label.bind('<Button-1>', lambda e: self.show_full_image(image_path))
+            
+            # 添加提示文字
+            tip_label = self.app.style(tk.Label(
+                self.image_display_frame,
+                text="点击图片查看大图",
+                font=('Arial', 9)
+            ), bg='card_bg', fg='muted_text')
+            tip_label.pack()
+            
+        except Exception as e:
+            print(f"显示图片失败: {str(e)}")
+    
+    def show_full_image(self, image_path):
+        """显示完整大小的图片"""
+        try:
+            # 创建新窗口
+            image_window = tk.Toplevel(self.root)
+            image_window.title("茶记图片")
+            self.app.style(image_window, bg='panel_bg')
+            # 注册弹窗以支持 ESC 关闭（Toplevel window register）
+            self.app.register_toplevel(image_window)
+            
+            # 加载原始图片
+            image = Image.open(image_path)
+            
+            # 获取屏幕尺寸
+            screen_width = image_window.winfo_screenwidth()
+            screen_height = image_window.winfo_screenheight()
+            
+            # 设置图片查看窗口的最大尺寸（屏幕的80%）
+            max_width = int(screen_width * 0.8)
+            max_height = int(screen_height * 0.8)
+            
+            # 计算最佳显示尺寸
+            display_width = min(image.width, max_width)
+            display_height = min(image.height, max_height)
+            
+            # 如果图片太大，按比例缩放
+            if image.width > max_width or image.height > max_height:
+                # 计算缩放比例
+                width_ratio = max_width / image.width
+                height_ratio = max_height / image.height
+                scale_ratio = min(width_ratio, height_ratio)
+                
+                # 计算新尺寸
+                new_width = int(image.width * scale_ratio)
+                new_height = int(image.height * scale_ratio)
+                
+                # 调整图片大小
+                image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+                display_width = new_width
+                display_height = new_height
+            
+            # 转换为PhotoImage
+            photo = ImageTk.PhotoImage(image)
+            
+            # 创建图片标签
+            image_label = self.app.style(tk.Label(image_window, image=photo), bg='panel_bg')
+            image_label.image = photo  # 保持引用
+            image_label.pack(padx=20, pady=20)
+            
+            # 设置窗口大小和位置
+            window_width = display_width + 40
+            window_height = display_height + 40
+            
+            # 确保窗口不会超出屏幕
+            window_width = min(window_width, screen_width - 100)
+            window_height = min(window_height, screen_height - 100)
+            
+            # 计算居中位置
+            x = (screen_width - window_width) // 2
+            y = (screen_height - window_height) // 2
+            
+            # 设置窗口大小、位置和限制
+            image_window.geometry(f"{window_width}x{window_height}+{x}+{y}")
+            image_window.minsize(300, 200)  # 最小尺寸
+            image_window.maxsize(screen_width - 50, screen_height - 50)  # 最大尺寸
+            
+        except Exception as e:
+            messagebox.showerror("错误", f"无法显示图片: {str(e)}")
+    
+    def delete_tea_record(self):
+        """删除茶记录"""
+        selection = self.records_listbox.curselection()
+        if not selection:
+            messagebox.showwarning("提示", "请先选择要删除的记录！")
+            return
+        
+        if messagebox.askyesno("确认删除", "确定要删除这条茶记录吗？\n删除后将无法恢复！"):
+            index = selection[0]
+            record_to_delete = self.current_records[index]
+            
+            # 从记录中删除并保存（没有其他茶记引用时图片一并删除）
+            try:
+                self.app.store.delete_tea_record(record_to_delete['id'])
+                
+                messagebox.showinfo("成功", "记录删除成功！")
+                self.load_records_list()  # 重新加载列表
+                
+                # 清空详情和图片显示
+                self.clear_record_detail()
+                
+            except Exception as e:
+                messagebox.showerror("错误", f"删除失败：{str(e)}")
+    
+    def save_record_as(self):
+        """另存为茶记录"""
+        if not hasattr(self, 'selected_record') or not self.selected_record:
+            messagebox.showwarning("提示", "请先选择要导出的记录！")
+            return
+        
+        # 选择保存格式
+        format_choice = messagebox.askyesnocancel(
+            "选择格式",
+            "选择导出格式：\n是 - 文本格式(.txt)\n否 - JSON格式(.json)\n取消 - 取消操作"
+        )
+        
+        if format_choice is None:  # 用户取消
+            return
+        
+        record = self.selected_record
+        
+        if format_choice:  # 文本格式
+            file_types = [("文本文件", "*.txt"), ("所有文件", "*.*")]
+            default_name = f"茶记_{record['tea_name']}_{record['brewing_time'][:10]}.txt"
+        else:  # JSON格式
+            file_types = [("JSON文件", "*.json"), ("所有文件", "*.*")]
+            default_name = f"茶记_{record['tea_name']}_{record['brewing_time'][:10]}.json"
+        
+        file_path = filedialog.asksaveasfilename(
+            title="保存茶记录",
+            defaultextension=".txt" if format_choice else ".json",
+            filetypes=file_types,
+            initialname=default_name
+        )
+        
+        if not file_path:
+            return
+        
+        try:
+            if format_choice:  # 文本格式
+                content = f"""茶记录导出
+================
+
+茶种名称: {record['tea_name']}
+冲泡时间: {record['brewing_time']}
+美味评分: {"⭐" * record['rating']} ({record['rating']}/10)
+冲泡次数: {record['pour_count']}次
+是否加奶: {'是' if record['add_milk'] else '否'}
+
+品茶笔记:
+{record['notes']}
+
+冲泡参数:
+倒茶时间: {', '.join(map(str, record['brewing_params']['pour_times']))}秒
+间隔时间: {', '.join(map(str, record['brewing_params']['intervals']))}秒
+
+图片信息: {'有图片' if record.get('image_filename') else '无图片'}
+"""
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    f.write(content)
+            else:  # JSON格式
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    json.dump(record, f, ensure_ascii=False, indent=2)
+            
+            messagebox.showinfo("成功", f"茶记录已保存到：\n{file_path}")
+            
+        except Exception as e:
+            messagebox.showerror("错误", f"保存失败：{str(e)}")
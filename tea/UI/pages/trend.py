@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+美味值趋势分析
+
+matplotlib / numpy 只在本模块中使用，打开趋势分析时才会导入。
+"""
+
+import tkinter as tk
+from tkinter import messagebox
+from datetime import datetime
+import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+import numpy as np
+
+from pages.base import BasePage
+
+
+class TrendAnalysisWindow(BasePage):
+    """美味值趋势分析窗口"""
+
+    def show(self):
+        """显示趋势分析"""
+        records = self.app.load_tea_records()
+        if not records:
+            messagebox.showinfo("提示", "暂无茶记录数据！")
+            return
+        
+        # 创建趋势分析窗口
+        trend_window = tk.Toplevel(self.root)
+        trend_window.title("美味值趋势分析")
+        trend_window.geometry("900x700")
+        self.app.style(trend_window, bg='panel_bg')
+        # 注册弹窗以支持 ESC 关闭（Toplevel window register）
+        self.app.register_toplevel(trend_window)
+        
+        # 设置背景
+        self.app.setup_background(trend_window)
+        
+        # 主框架
+        main_frame = self.app.style(tk.Frame(trend_window, relief='raised', bd=3), bg='panel_bg')
+        main_frame.pack(fill='both', expand=True, padx=20, pady=20)
+        
+        # 标题
+        title_label = self.app.style(tk.Label(
+            main_frame,
+            text="📊 美味值趋势分析",
+            font=("Arial", 18, "bold")
+        ), bg='panel_bg', fg='heading_text')
+        title_label.pack(pady=10)
+        
+        # 创建图表
+        self.create_trend_charts(main_frame, records)
+        
+        # 关闭按钮
+        close_btn = self.app.style(tk.Button(
+            main_frame,
+            text="关闭",
+            font=("Arial", 12, "bold"),
+            fg='white',
+            command=trend_window.destroy
+        ), bg='action_danger')
+        close_btn.pack(pady=10)
+
+    def create_trend_charts(self, parent, records):
+        """创建趋势图表"""
+        # 准备数据
+        dates = []
+        ratings = []
+        tea_names = []
+        
+        for record in records:
+            try:
+                date = datetime.strptime(record['brewing_time'], "%Y-%m-%d %H:%M:%S")
+                dates.append(date)
+                ratings.append(record['rating'])
+                tea_names.append(record['tea_name'])
+            except:
+                continue
+        
+        if not dates:
+            self.app.style(tk.Label(parent, text="暂无有效数据", font=("Arial", 14)), bg='panel_bg').pack(pady=20)
+            return
+        
+        # 图表颜色取自当前主题
+        heading_color = self.app.theme_color('heading_text')
+        card_color = self.app.theme_color('card_bg')
+        
+        # 创建matplotlib图表
+        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8))
+        fig.patch.set_facecolor(self.app.theme_color('panel_bg'))
+        
+        # 时间趋势图
+        ax1.plot(dates, ratings, marker='o', linewidth=2, markersize=6, color=heading_color)
+        ax1.set_title('美味值时间趋势', fontsize=14, fontweight='bold', color=heading_color)
+        ax1.set_ylabel('美味值', fontsize=12, color=heading_color)
+        ax1.grid(True, alpha=0.3)
+        ax1.set_facecolor(card_color)
+        
+        # 格式化日期显示
+        ax1.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d'))
+        ax1.xaxis.set_major_locator(mdates.DayLocator(interval=max(1, len(dates)//10)))
+        plt.setp(ax1.xaxis.get_majorticklabels(), rotation=45)
+        
+        # 按茶种统计
+        tea_stats = {}
+        for tea_name, rating in zip(tea_names, ratings):
+            if tea_name not in tea_stats:
+                tea_stats[tea_name] = []
+            tea_stats[tea_name].append(rating)
+        
+        # 计算平均值
+        tea_avg = {name: np.mean(ratings) for name, ratings in tea_stats.items()}
+        
+        # 茶种平均美味值柱状图
+        names = list(tea_avg.keys())
+        avg_ratings = list(tea_avg.values())
+        
+        bars = ax2.bar(names, avg_ratings, color=[self.app.theme_color(role) for role in ('nav_create', 'nav_closet', 'nav_settings', 'nav_notes')][:len(names)])
+        ax2.set_title('各茶种平均美味值', fontsize=14, fontweight='bold', color=heading_color)
+        ax2.set_ylabel('平均美味值', fontsize=12, color=heading_color)
+        ax2.set_ylim(0, 10)
+        ax2.set_facecolor(card_color)
+        
+        # 在柱状图上显示数值
+        for bar, avg in zip(bars, avg_ratings):
+            height = bar.get_height()
+            ax2.text(bar.get_x() + bar.get_width()/2., height + 0.1,
+                    f'{avg:.1f}', ha='center', va='bottom', fontweight='bold')
+        
+        plt.setp(ax2.xaxis.get_majorticklabels(), rotation=45)
+        plt.tight_layout()
+        
+        # 将图表嵌入到tkinter窗口
+        canvas = FigureCanvasTkAgg(fig, parent)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill='both', expand=True, padx=10, pady=10)
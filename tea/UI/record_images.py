@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+茶记图片与缩略图
+Tea record images and thumbnails
+
+保存茶记时不直接复制用户选择的原图，而是按 EXIF 方向旋转、把最长边缩小到设定值以内，
+重新编码为 WebP（Pillow 不支持时为优化的 JPEG）后保存在 record/images/，
+再在 record/images/thumbs/ 中为每种用途生成一张缩略图，茶记页面只读取缩略图。
+旧版本保存的图片没有缩略图，可以用 `main.py --headless thumbnails` 补齐，
+茶记页面遇到缺少的缩略图也会当场生成并保存。
+
+本模块只依赖 Pillow，界面和无界面命令行共用。
+"""
+
+import os
+import threading
+
+from PIL import Image, ImageOps, features
+
+# 茶记图片默认的最长边（像素），可在 settings.json 的 record_image_max_edge 中修改
+DEFAULT_MAX_EDGE = 1600
+
+# 各用途的缩略图尺寸（保持宽高比缩放到框内）
+THUMBNAIL_SIZES = {
+    'notes': (250, 150),  # 茶记页面的记录详情
+}
+
+
+def record_image_extension():
+    """新茶记图片的扩展名，决定保存格式"""
+    return '.webp' if features.check('webp') else '.jpg'
+
+
+def ingest_record_image(source_path, images_path, image_filename, max_edge=DEFAULT_MAX_EDGE):
+    """把用户选择的图片整理后保存为 images_path/image_filename，并生成缩略图
+
+    按 EXIF 方向旋转，最长边缩小到 max_edge 以内（JPEG 解码时就按缩小的尺寸解码），
+    按文件扩展名保存为 WebP 或优化的 JPEG。不访问 Tk，可以在后台线程中调用。
+    """
+    webp = image_filename.lower().endswith('.webp')
+    with Image.open(source_path) as image:
+        image.draft('RGB', (max_edge, max_edge))
+        image = ImageOps.exif_transpose(image)
+        has_alpha = image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info)
+        if has_alpha and webp:
+            image = image.convert('RGBA')
+        elif has_alpha:
+            # JPEG 没有透明通道，铺在白色底上
+            rgba = image.convert('RGBA')
+            image = Image.new('RGB', rgba.size, (255, 255, 255))
+            image.paste(rgba, mask=rgba.getchannel('A'))
+        else:
+            image = image.convert('RGB')
+    image.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+
+    destination = os.path.join(images_path, image_filename)
+    temp_path = destination + '.tmp'
+    if webp:
+        image.save(temp_path, 'WEBP', quality=85, method=4)
+    else:
+        image.save(temp_path, 'JPEG', quality=85, optimize=True, progressive=True)
+    os.replace(temp_path, destination)
+    write_thumbnails(images_path, image_filename)
+    return destination
+
+
+def thumbnails_dir(images_path):
+    return os.path.join(images_path, "thumbs")
+
+
+def thumbnail_path(images_path, image_filename, kind='notes'):
+    """缩略图路径：thumbs/<原文件名>.<宽>x<高>.png"""
+    width, height = THUMBNAIL_SIZES[kind]
+    return os.path.join(thumbnails_dir(images_path), f"{image_filename}.{width}x{height}.png")
+
+
+def make_thumbnail(source_path, size):
+    """生成 size 框内的缩略图（PIL 图片）；JPEG 按缩小的尺寸解码，不需要完整解码原图"""
+    with Image.open(source_path) as image:
+        image.draft('RGB', size)
+        thumbnail = image.copy()
+    thumbnail.thumbnail(size, Image.Resampling.LANCZOS)
+    if thumbnail.mode not in ('RGB', 'RGBA'):
+        thumbnail = thumbnail.convert('RGBA' if 'transparency' in thumbnail.info else 'RGB')
+    return thumbnail
+
+
+def write_thumbnails(images_path, image_filename):
+    """为 images_path 中的一张茶记图片生成所有用途的缩略图，返回 {用途: 路径}"""
+    source_path = os.path.join(images_path, image_filename)
+    os.makedirs(thumbnails_dir(images_path), exist_ok=True)
+    paths = {}
+    for kind, size in THUMBNAIL_SIZES.items():
+        path = thumbnail_path(images_path, image_filename, kind)
+        # 茶记页面可能在多个线程中同时补生成同一张缩略图，临时文件按线程区分
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        make_thumbnail(source_path, size).save(temp_path, 'PNG')
+        os.replace(temp_path, path)
+        paths[kind] = path
+    return paths
+
+
+def load_thumbnail(images_path, image_filename, kind='notes'):
+    """读取缩略图（PIL 图片）；缺少时先生成并保存，原图不存在时返回 None"""
+    path = thumbnail_path(images_path, image_filename, kind)
+    if not os.path.exists(path):
+        if not os.path.exists(os.path.join(images_path, image_filename)):
+            return None
+        path = write_thumbnails(images_path, image_filename)[kind]
+    with Image.open(path) as image:
+        image.load()
+        return image
+
+
+def backfill_thumbnails(images_path, image_filenames):
+    """为缺少缩略图的茶记图片补齐缩略图，返回 (新生成, 已存在, 原图缺失或无法读取) 的数量"""
+    created = existing = failed = 0
+    for image_filename in image_filenames:
+        if all(os.path.exists(thumbnail_path(images_path, image_filename, kind)) for kind in THUMBNAIL_SIZES):
+            existing += 1
+            continue
+        try:
+            write_thumbnails(images_path, image_filename)
+            created += 1
+        except (OSError, ValueError) as e:
+            print(f"生成缩略图失败 {image_filename}: {e}")
+            failed += 1
+    return created, existing, failed
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+启动性能分析
+Startup profiling
+
+记录 main() 各启动阶段的耗时和启动期间每个模块的导入耗时，
+在首帧绘制完成后写出 JSON 报告，便于跟踪版本间的启动回归。
+运行期间的界面操作（如边栏更新）由 OperationTimer 汇总，退出时补写进同一份报告。
+"""
+
+import contextlib
+import json
+import os
+import platform
+import sys
+import threading
+import time
+
+
+class _TimedLoader:
+    """包装模块加载器，统计 exec_module 的耗时"""
+
+    def __init__(self, loader, timer):
+        self._loader = loader
+        self._timer = timer
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._timer._enter(module.__name__)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._timer._exit()
+
+    def __getattr__(self, attr):
+        return getattr(self._loader, attr)
+
+
+class ImportTimer:
+    """sys.meta_path 查找器：为每个新导入的模块记录包含子模块在内的耗时和自身耗时"""
+
+    def __init__(self, clock=time.perf_counter):
+        self._clock = clock
+        self._local = threading.local()
+        self._thread_id = threading.get_ident()
+        self.records = {}
+
+    def install(self):
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path=None, target=None):
+        # 只统计主线程的导入，避免重入自身
+        if threading.get_ident() != self._thread_id or getattr(self._local, 'searching', False):
+            return None
+        self._local.searching = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, 'find_spec'):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._local.searching = False
+
+        if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+            spec.loader = _TimedLoader(spec.loader, self)
+        return spec
+
+    def _enter(self, name):
+        stack = self._local.__dict__.setdefault('stack', [])
+        stack.append([name, self._clock(), 0.0])
+
+    def _exit(self):
+        stack = self._local.stack
+        name, start, children = stack.pop()
+        inclusive = self._clock() - start
+        if stack:
+            stack[-1][2] += inclusive
+        self.records[name] = {
+            'inclusive_ms': round(inclusive * 1000, 3),
+            'self_ms': round((inclusive - children) * 1000, 3),
+        }
+
+
+class OperationTimer:
+    """界面操作计时：按操作名汇总次数、总耗时和最大耗时，另有简单计数器"""
+
+    def __init__(self, clock=time.perf_counter):
+        self._clock = clock
+        self._timings = {}
+        self._counters = {}
+
+    @contextlib.contextmanager
+    def measure(self, name):
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self.record(name, self._clock() - start)
+
+    def record(self, name, seconds):
+        stats = self._timings.setdefault(name, [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += seconds
+        stats[2] = max(stats[2], seconds)
+
+    def count(self, name, amount=1):
+        self._counters[name] = self._counters.get(name, 0) + amount
+
+    def snapshot(self):
+        timings = {
+            name: {
+                'count': count,
+                'mean_ms': round(total / count * 1000, 3),
+                'max_ms': round(max_seconds * 1000, 3),
+                'total_ms': round(total * 1000, 3),
+            }
+            for name, (count, total, max_seconds) in self._timings.items()
+        }
+        return {'timings': timings, 'counters': dict(self._counters)}
+
+
+class StartupProfiler:
+    """启动阶段计时器"""
+
+    def __init__(self, clock=time.perf_counter):
+        self._clock = clock
+        self._origin = clock()
+        self._stack = []
+        self.phases = []
+        self.import_timer = ImportTimer(clock)
+        self.operations = OperationTimer(clock)
+        # 冲泡提醒的延迟直方图（名称 -> LatenessHistogram），由界面登记
+        self.lateness = {}
+        # 首次写出报告时的总启动耗时，之后补写报告时保持不变
+        self.total_ms = None
+
+    def elapsed_ms(self):
+        return round((self._clock() - self._origin) * 1000, 3)
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """记录一个启动阶段，嵌套阶段会标注父阶段"""
+        entry = {
+            'name': name,
+            'parent': self._stack[-1]['name'] if self._stack else None,
+            'start_ms': self.elapsed_ms(),
+        }
+        self._stack.append(entry)
+        self.phases.append(entry)
+        start = self._clock()
+        try:
+            yield
+        finally:
+            entry['duration_ms'] = round((self._clock() - start) * 1000, 3)
+            self._stack.pop()
+
+    def report(self):
+        """生成报告字典"""
+        imports = [dict(module=name, **timing) for name, timing in self.import_timer.records.items()]
+        imports.sort(key=lambda item: item['self_ms'], reverse=True)
+
+        report = {
+            'version': 1,
+            'created': time.strftime("%Y-%m-%d %H:%M:%S"),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'total_ms': self.total_ms if self.total_ms is not None else self.elapsed_ms(),
+            'phases': self.phases,
+            'imports': imports,
+            'operations': self.operations.snapshot(),
+        }
+        if self.lateness:
+            report['brew_lateness'] = {name: histogram.snapshot() for name, histogram in self.lateness.items()}
+        lazy_imports = sys.modules.get('lazy_imports')
+        if lazy_imports is not None:
+            report['lazy_imports'] = lazy_imports.import_report()
+        return report
+
+    def write(self, path):
+        """停止导入计时并把报告写入 path（可重复调用以补充运行期间的操作统计）"""
+        self.import_timer.uninstall()
+        if self.total_ms is None:
+            self.total_ms = self.elapsed_ms()
+        report = self.report()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        return report
+
+
+def profile_phase(profiler, name):
+    """profiler 为 None 时返回空上下文，方便在正常启动路径中使用"""
+    if profiler is None:
+        return contextlib.nullcontext()
+    return profiler.phase(name)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+界面样式注册表
+Style registry
+
+控件创建时登记每个颜色/字体选项对应的主题角色（如 bg='panel_bg'、fg='text_color'），
+切换主题时 apply() 一次遍历所有已登记的控件并重新设置这些选项，不需要重建页面。
+
+角色可以是：
+- 主题键，如 'button_color_3'
+- 键的元组，按顺序取主题中第一个存在的键，如 ('sidebar_bg', 'text_color_3')
+- font 选项为 (字体键, 字号, 样式...)，如 ('font_family', 12, 'bold')
+主题中没有的键使用 ROLE_DEFAULTS 中的默认颜色。
+"""
+
+import tkinter as tk
+
+# 各主题共用的默认角色颜色（主题可以覆盖）
+ROLE_DEFAULTS = {
+    # 内容面板
+    'panel_bg': '#F5F5DC',  # 米色面板
+    'card_bg': '#FFFAF0',  # 列表、文本框底色
+    'highlight_bg': '#DEB887',  # 标题栏、选中行
+    'heading_text': '#8B4513',  # 面板标题文字
+    'body_text': '#2F4F2F',  # 面板正文文字
+    'muted_text': '#666666',  # 提示文字
+    # 主页标题栏
+    'header_bg': '#8B4513',
+    'header_text': '#F5F5DC',
+    'subheader_bg': '#CD853F',
+    # 主页导航按钮
+    'nav_create': '#8B4513',
+    'nav_create_active': '#A0522D',
+    'nav_closet': '#2F4F2F',
+    'nav_closet_active': '#228B22',
+    'nav_settings': '#B8860B',
+    'nav_settings_active': '#DAA520',
+    'nav_notes': '#8B008B',
+    'nav_notes_active': '#9932CC',
+    'nav_active_text': '#FFFAF0',
+    # 操作按钮
+    'action_info': '#4169E1',
+    'action_info_active': '#6495ED',
+    'action_success': '#228B22',
+    'action_success_active': '#32CD32',
+    'action_warning': '#FF8C00',
+    'action_warning_active': '#FFA500',
+    'action_danger': '#DC143C',
+    'action_danger_active': '#FF6347',
+    'action_special': '#9370DB',
+    'action_special_active': '#BA55D3',
+    # 评分星星
+    'rating_on': '#FFD700',
+    'rating_off': '#D3D3D3',
+}
+
+
+def resolve_role(theme, option, role):
+    """把角色解析为主题中的实际取值"""
+    if option == 'font':
+        return (resolve_role(theme, None, role[0]),) + tuple(role[1:])
+    keys = role if isinstance(role, tuple) else (role,)
+    for key in keys:
+        if key in theme:
+            return theme[key]
+    for key in keys:
+        if key in ROLE_DEFAULTS:
+            return ROLE_DEFAULTS[key]
+    raise KeyError(f"主题中没有样式角色: {role}")
+
+
+class StyleRegistry:
+    """控件 -> {选项: 角色} 的登记表"""
+
+    def __init__(self, get_theme):
+        self._get_theme = get_theme
+        self._widgets = {}
+        # 上次清理后的登记数量，翻倍时清理一次已销毁的控件
+        self._prune_at = 256
+
+    def __len__(self):
+        return len(self._widgets)
+
+    def color(self, role):
+        """当前主题下某个颜色角色的取值（用于无法登记的场合，如图表颜色）"""
+        return resolve_role(self._get_theme(), None, role)
+
+    def register(self, widget, **roles):
+        """登记控件的样式角色并立即按当前主题设置，返回控件本身"""
+        theme = self._get_theme()
+        widget.configure(**{option: resolve_role(theme, option, role) for option, role in roles.items()})
+        key = str(widget)
+        entry = self._widgets.get(key)
+        if entry is not None and entry[0] is widget:
+            entry[1].update(roles)
+        else:
+            self._widgets[key] = (widget, dict(roles))
+        if len(self._widgets) >= self._prune_at:
+            self.prune()
+            self._prune_at = max(256, len(self._widgets) * 2)
+        return widget
+
+    def prune(self):
+        """移除已经销毁的控件"""
+        for key, (widget, _) in list(self._widgets.items()):
+            try:
+                alive = widget.winfo_exists()
+            except tk.TclError:
+                alive = False
+            if not alive:
+                del self._widgets[key]
+
+    def apply(self, theme=None):
+        """按主题重新设置所有已登记控件的样式，返回更新的控件数"""
+        theme = theme or self._get_theme()
+        updated = 0
+        for key, (widget, roles) in list(self._widgets.items()):
+            try:
+                widget.configure(**{option: resolve_role(theme, option, role) for option, role in roles.items()})
+                updated += 1
+            except tk.TclError:
+                # 控件已销毁
+                del self._widgets[key]
+        return updated
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+茶柜与茶记存储
+Tea closet and record storage
+
+茶种文件（tea_closet/tea_*.json）和茶记（record/tea_records.json）的读写；
+茶记引用的图片由 ImageStore 按引用计数管理。
+只依赖标准库，界面程序和无界面命令行（main.py --headless）共用。
+"""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+from image_store import ImageStore
+
+
+class TeaStore:
+    """程序数据目录下的茶柜、茶记和设置文件"""
+
+    def __init__(self, base_dir):
+        self.tea_closet_path = os.path.join(base_dir, "tea_closet")
+        self.record_path = os.path.join(base_dir, "record")
+        self.images_path = os.path.join(self.record_path, "images")
+        self.settings_path = os.path.join(self.tea_closet_path, "settings.json")
+        # 自定义背景图片的程序副本（已缩小到窗口最大尺寸）
+        self.backgrounds_path = os.path.join(self.tea_closet_path, "backgrounds")
+        self.tea_records_path = os.path.join(self.record_path, "tea_records.json")
+        self.journal_path = os.path.join(self.record_path, "brew_journal.jsonl")
+        # 无界面命令行的冲泡日志单独存放：界面程序启动时只恢复自己的会话，
+        # 不会接手终端中仍在进行（或被强制结束）的冲泡
+        self.headless_journal_path = os.path.join(self.record_path, "headless_brew_journal.jsonl")
+        self._images = ImageStore(self.images_path)
+        # 茶记的读-改-写在主线程和图片处理线程中都会进行
+        self._records_lock = threading.RLock()
+        # 可随时删除的派生文件（缩放后的图片等）
+        self.cache_path = os.path.join(base_dir, "cache")
+
+    def ensure_dirs(self):
+        """创建数据目录（已存在时不做任何事）"""
+        for path in (self.tea_closet_path, self.record_path, self.images_path):
+            os.makedirs(path, exist_ok=True)
+
+    def tea_filename(self, tea_name):
+        return os.path.join(self.tea_closet_path, f"tea_{tea_name.replace(' ', '_')}.json")
+
+    def load_tea(self, filepath):
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def list_teas(self):
+        """返回茶柜中所有茶种 [(文件路径, 茶种数据)]，无法读取的文件会被跳过"""
+        teas = []
+        for filename in os.listdir(self.tea_closet_path):
+            if filename.endswith('.json') and filename.startswith('tea_'):
+                filepath = os.path.join(self.tea_closet_path, filename)
+                try:
+                    teas.append((filepath, self.load_tea(filepath)))
+                except Exception as e:
+                    print(f"加载茶种文件 {filename} 失败: {e}")
+        return teas
+
+    def find_tea(self, name):
+        """按茶名查找茶种：先精确匹配，再匹配唯一的前缀，找不到时返回 None"""
+        teas = [tea_data for _, tea_data in self.list_teas()]
+        for tea_data in teas:
+            if tea_data.get('name') == name:
+                return tea_data
+        matches = [tea_data for tea_data in teas if str(tea_data.get('name', '')).startswith(name)]
+        return matches[0] if len(matches) == 1 else None
+
+    def closet_signature(self):
+        """茶柜中茶种文件的 (文件名, 修改时间) 集合，用于判断列表是否需要重新加载"""
+        try:
+            return tuple(sorted(
+                (entry.name, entry.stat().st_mtime_ns)
+                for entry in os.scandir(self.tea_closet_path)
+                if entry.name.startswith('tea_') and entry.name.endswith('.json')
+            ))
+        except OSError:
+            return ()
+
+    def save_tea(self, tea_data):
+        """保存茶种，返回文件路径"""
+        filepath = self.tea_filename(tea_data['name'])
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(tea_data, f, ensure_ascii=False, indent=2)
+        return filepath
+
+    def load_tea_records(self):
+        """加载茶记录"""
+        if not os.path.exists(self.tea_records_path):
+            return []
+
+        try:
+            with open(self.tea_records_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception:
+            return []
+
+    def records_signature(self):
+        """茶记文件的 (修改时间, 大小)，文件不存在时为 None"""
+        try:
+            stat = os.stat(self.tea_records_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def save_tea_records(self, records):
+        """写入全部茶记录（先写临时文件再替换，避免写到一半时损坏原文件）"""
+        temp_path = self.tea_records_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(records, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.tea_records_path)
+
+    def build_record(self, tea_data, rating, notes, image_filename=None):
+        """根据茶种和评价生成一条茶记录"""
+        return {
+            'id': str(int(time.time() * 1000)),  # 使用时间戳作为ID
+            'tea_name': tea_data['name'],
+            'rating': int(rating) if isinstance(rating, (int, float)) else 0,
+            'notes': notes,
+            'brewing_time': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'pour_count': tea_data.get('pour_count', 0),
+            'add_milk': tea_data.get('add_milk', False),
+            'image_filename': image_filename,  # 添加图片文件名
+            'brewing_params': {
+                'pour_times': tea_data.get('pour_times', []),
+                'intervals': tea_data.get('intervals', [])
+            }
+        }
+
+    @property
+    def images(self):
+        """茶记图片仓库；还没有索引时按现有茶记建立（旧版本的图片也会登记，需要计算每张图片的哈希）"""
+        self._images.ensure_index(self.load_tea_records)
+        return self._images
+
+    def add_tea_record(self, record):
+        """追加一条茶记录，并为它的图片增加一个引用"""
+        with self._records_lock:
+            images = self.images if record.get('image_filename') else None
+            records = self.load_tea_records()
+            records.append(record)
+            self.save_tea_records(records)
+            if images is not None:
+                images.add_ref(record['image_filename'])
+        return record
+
+    def attach_record_image(self, record_id, image_filename):
+        """为已保存的茶记登记处理完成的图片，返回是否登记成功
+
+        茶记在图片处理完成前已被删除时返回 False，没有其他茶记引用的图片一并删除。
+        """
+        with self._records_lock:
+            images = self.images
+            records = self.load_tea_records()
+            record = next((r for r in records if r['id'] == record_id), None)
+            if record is None:
+                if images.refs(image_filename) == 0:
+                    images.release(image_filename)
+                return False
+            record['image_filename'] = image_filename
+            self.save_tea_records(records)
+            images.add_ref(image_filename)
+        return True
+
+    def delete_tea_record(self, record_id):
+        """删除一条茶记录，返回被删除的记录（不存在时返回 None）
+
+        图片的最后一个引用消失时才删除图片文件。
+        """
+        with self._records_lock:
+            images = self.images
+            records = self.load_tea_records()
+            removed = next((r for r in records if r['id'] == record_id), None)
+            if removed is not None:
+                self.save_tea_records([r for r in records if r['id'] != record_id])
+                if removed.get('image_filename'):
+                    images.release(removed['image_filename'])
+        return removed
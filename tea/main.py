@@ -13,27 +13,27 @@ Tea Brewing Timer Application - Main Entry Point
 
 import sys
 import os
-import tkinter as tk
-from tkinter import messagebox
+import json
+import argparse
+import importlib.util
+
+# 模块名 -> pip 包名
+REQUIRED_DEPENDENCIES = {
+    "PIL": "Pillow",
+    "matplotlib": "matplotlib",
+    "numpy": "numpy",
+}
 
 def check_dependencies():
-    """检查必要的依赖库"""
+    """检查必要的依赖库（只查找模块，不执行导入）"""
     missing_deps = []
     
-    try:
-        import PIL
-    except ImportError:
-        missing_deps.append("Pillow")
-    
-    try:
-        import matplotlib
-    except ImportError:
-        missing_deps.append("matplotlib")
-    
-    try:
-        import numpy
-    except ImportError:
-        missing_deps.append("numpy")
+    for module_name, package_name in REQUIRED_DEPENDENCIES.items():
+        try:
+            if importlib.util.find_spec(module_name) is None:
+                missing_deps.append(package_name)
+        except (ImportError, ValueError):
+            missing_deps.append(package_name)
     
     if missing_deps:
         error_msg = f"""
@@ -45,43 +45,131 @@ pip install {' '.join(missing_deps)}
 或者运行：
 pip install -r requirements.txt
         """
+        from tkinter import messagebox
         messagebox.showerror("依赖库缺失", error_msg)
         return False
     
     return True
 
+def parse_args(argv=None):
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(description="茶叶冲泡定时提醒程序")
+    parser.add_argument(
+        "--headless",
+        nargs=argparse.REMAINDER,
+        default=None,
+        metavar="COMMAND",
+        help="不启动界面，在终端中执行命令：list / brew <茶名> / records / thumbnails / verify（不导入 tkinter、PIL、matplotlib）"
+    )
+    parser.add_argument(
+        "--import-report",
+        action="store_true",
+        help="输出启动时延迟导入的模块及其节省的导入耗时（JSON），然后退出"
+    )
+    parser.add_argument(
+        "--profile-startup",
+        nargs="?",
+        const="startup_profile.json",
+        default=None,
+        metavar="PATH",
+        help="记录各启动阶段和模块导入耗时，首帧绘制后写入 JSON 报告（默认 startup_profile.json）"
+    )
+    return parser.parse_args(argv)
+
+def print_import_report():
+    """导入界面模块后输出延迟导入报告"""
+    import gal  # noqa: F401  导入界面模块以登记延迟导入的模块
+    from lazy_imports import import_report
+    from pages import PAGE_REGISTRY, STARTUP_PAGES, get_page_class
+    
+    # 启动时就会显示的页面与正常启动一样先导入，不计入节省的时间
+    for name in STARTUP_PAGES:
+        get_page_class(name)
+    preload = ('gal',) + tuple(PAGE_REGISTRY[name][0] for name in STARTUP_PAGES)
+    print(json.dumps(import_report(measure=True, preload=preload), ensure_ascii=False, indent=2))
+
 def main():
     """主函数"""
-    # 设置当前工作目录为脚本所在目录
+    args = parse_args()
+    
     script_dir = os.path.dirname(os.path.abspath(__file__))
-    os.chdir(script_dir)
+    ui_dir = os.path.join(script_dir, 'UI')
+    # UI 目录中的模块（界面、无界面命令行、启动性能分析）都从这里导入
+    sys.path.insert(0, ui_dir)
+    
+    # 无界面模式：只使用冲泡引擎和茶柜/茶记存储，不检查也不导入界面依赖
+    if args.headless is not None:
+        from headless import run
+        sys.exit(run(args.headless, script_dir))
+    
+    # 启动阶段计时（只依赖标准库）；未开启性能分析时为空操作
+    from startup_profiler import profile_phase
+    
+    # 启动性能分析：尽早开始计时并记录模块导入耗时
+    profiler = None
+    profile_path = None
+    if args.profile_startup:
+        profile_path = os.path.abspath(args.profile_startup)
+        from startup_profiler import StartupProfiler
+        profiler = StartupProfiler()
+        profiler.import_timer.install()
+    
+    # 设置当前工作目录为脚本所在目录
+    with profile_phase(profiler, 'chdir'):
+        os.chdir(script_dir)
     
     # 检查依赖
-    if not check_dependencies():
+    with profile_phase(profiler, 'check_dependencies'):
+        dependencies_ok = check_dependencies()
+    if not dependencies_ok:
         sys.exit(1)
     
+    import tkinter as tk
+    from tkinter import messagebox
+    
     try:
         # 导入UI模块
-        sys.path.insert(0, os.path.join(script_dir, 'UI'))
-        from gal import TeaBrewingApp
+        if args.import_report:
+            print_import_report()
+            return
+        
+        with profile_phase(profiler, 'import_gal'):
+            from gal import TeaBrewingApp
         
         # 创建主窗口
-        root = tk.Tk()
+        with profile_phase(profiler, 'tk_root'):
+            root = tk.Tk()
         
         # 设置窗口图标（如果存在）
-        try:
-            icon_path = os.path.join(script_dir, 'UI', 'icon.ico')
-            if os.path.exists(icon_path):
-                root.iconbitmap(icon_path)
-        except:
-            pass
+        with profile_phase(profiler, 'iconbitmap'):
+            try:
+                icon_path = os.path.join(ui_dir, 'icon.ico')
+                if os.path.exists(icon_path):
+                    root.iconbitmap(icon_path)
+            except:
+                pass
         
         # 创建应用实例
-        app = TeaBrewingApp(root)
+        with profile_phase(profiler, 'app_init'):
+            app = TeaBrewingApp(root, profiler=profiler)
+        
+        # 绘制首帧后写出性能报告
+        if profiler is not None:
+            with profile_phase(profiler, 'first_frame'):
+                root.update()
+            profiler.write(profile_path)
+            print(f"启动性能报告已写入: {profile_path}")
         
         # 启动主循环
         root.mainloop()
         
+        # 主循环结束后等待冲泡调度线程退出
+        app.brewing.shutdown()
+        
+        # 补写运行期间的界面操作统计（边栏更新耗时等）
+        if profiler is not None:
+            profiler.write(profile_path)
+        
     except ImportError as e:
         messagebox.showerror("导入错误", f"无法导入必要模块：{str(e)}")
         sys.exit(1)
@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试配置：与 main.py 相同，把 UI 目录加入模块搜索路径
+"""
+
+import os
+import sys
+
+UI_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'UI')
+if UI_DIR not in sys.path:
+    sys.path.insert(0, UI_DIR)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+冲泡引擎测试：大量会话开始、结束后不残留调度线程
+"""
+
+import threading
+import time
+
+from brew_engine import BrewingEngine
+from brew_journal import BrewJournal
+
+TEA = {
+    'name': '测试茶',
+    'water_temp': 90,
+    'pour_count': 3,
+    'pour_times': [60, 60, 60],
+    'intervals': [0, 0],
+}
+
+BREWS = 1000
+
+
+def test_concurrent_brews_share_one_thread_and_release_it():
+    baseline = threading.active_count()
+    engine = BrewingEngine()
+    for _ in range(BREWS):
+        engine.start(TEA)
+
+    assert len(engine.sessions()) == BREWS
+    # 所有会话共用一个调度线程
+    assert threading.active_count() == baseline + 1
+
+    assert engine.cancel_all() == BREWS
+    assert engine.scheduler.join(5)
+    assert threading.active_count() == baseline
+    engine.shutdown()
+
+
+def test_sequential_brews_do_not_leak_threads():
+    baseline = threading.active_count()
+    engine = BrewingEngine()
+    for _ in range(BREWS):
+        session = engine.start(TEA)
+        assert engine.cancel(session.session_id)
+
+    assert not engine.is_brewing
+    assert engine.scheduler.join(5)
+    assert threading.active_count() == baseline
+    engine.shutdown()
+
+
+def test_resume_skips_expired_sessions_and_journals_them_cancelled(tmp_path):
+    journal = BrewJournal(str(tmp_path / "brew_journal.jsonl"))
+    now = time.time()
+    entries = [
+        # 最后一次倒茶在 1 分钟后：恢复
+        {'session_id': 'recent', 'tea_data': TEA, 'index': 1, 'deadline': now - 60},
+        # 最后一次倒茶在一天前：放弃
+        {'session_id': 'stale', 'tea_data': TEA, 'index': 1, 'deadline': now - 24 * 3600},
+    ]
+    engine = BrewingEngine(journal=journal)
+    resumed = engine.resume(entries)
+
+    assert [session.session_id for session in resumed] == ['recent']
+    engine.cancel_all()
+    journal.flush()
+    assert BrewJournal(journal.path).replay() == []
+    with open(journal.path, encoding='utf-8') as f:
+        assert '"session_id": "stale", "reason": "expired"' in f.read()
+    engine.shutdown()
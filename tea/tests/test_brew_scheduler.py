@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+调度器测试：取消和提前触发的失效条目不影响堆中的有效任务
+"""
+
+import threading
+
+from brew_scheduler import BrewScheduler
+
+# 64 个取消后失效条目数达到重建阈值，fire_now 的第 65 个失效条目触发堆重建
+CANCELLED = 64
+LIVE = 36
+
+
+def test_fire_now_after_many_cancels_keeps_one_entry_per_call():
+    scheduler = BrewScheduler()
+    fired = threading.Event()
+    calls = [scheduler.call_later(600, lambda: None) for _ in range(CANCELLED)]
+    live = [scheduler.call_later(600, lambda: None) for _ in range(LIVE)]
+    target = scheduler.call_later(600, fired.set)
+
+    # 持有条件变量，使调度线程不能在中途弹出失效条目
+    with scheduler._cond:
+        for call in calls:
+            assert scheduler.cancel(call)
+        assert scheduler.fire_now(target)
+        entries = [entry for entry in scheduler._heap if entry[2] is target]
+        assert len([entry for entry in entries if scheduler._live(entry)]) == 1
+        assert scheduler.pending_count() == LIVE + 1
+
+    assert fired.wait(5)
+    with scheduler._cond:
+        assert scheduler.pending_count() == LIVE
+        assert scheduler._dead >= 0
+        assert sum(1 for entry in scheduler._heap if scheduler._live(entry)) == LIVE
+
+    scheduler.shutdown(timeout=5)
+
+
+def test_cancelled_calls_do_not_run_and_thread_exits():
+    scheduler = BrewScheduler()
+    ran = []
+    calls = [scheduler.call_later(0.05, ran.append, index) for index in range(CANCELLED)]
+    for call in calls[1:]:
+        assert scheduler.cancel(call)
+
+    assert scheduler.join(5)
+    assert ran == [0]
+    assert scheduler.pending_count() == 0
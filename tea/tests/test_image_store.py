@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+茶记图片仓库测试：按内容去重的引用计数、删除、登记和检查修复
+"""
+
+import os
+
+from image_store import ImageStore, file_digest
+from tea_store import TeaStore
+
+
+def make_store(tmp_path):
+    store = TeaStore(str(tmp_path))
+    store.ensure_dirs()
+    return store
+
+
+def store_image(store, name, content=b'image-bytes'):
+    """模拟图片整理完成：写入图片文件、缩略图并登记大小和哈希"""
+    with open(store.images.path(name), 'wb') as f:
+        f.write(content)
+    thumbs = os.path.join(store.images_path, 'thumbs')
+    os.makedirs(thumbs, exist_ok=True)
+    with open(os.path.join(thumbs, f"{name}.250x150.png"), 'wb') as f:
+        f.write(b'thumb')
+    store.images.mark_stored(name)
+
+
+def record(record_id, image_filename=None):
+    return {'id': record_id, 'tea_name': '测试茶', 'image_filename': image_filename}
+
+
+def test_content_filename_dedupes_identical_sources(tmp_path):
+    first, second, other = tmp_path / 'a.jpg', tmp_path / 'b.jpg', tmp_path / 'c.jpg'
+    first.write_bytes(b'same')
+    second.write_bytes(b'same')
+    other.write_bytes(b'different')
+
+    name = ImageStore.content_filename(str(first), '.webp')
+    assert name == ImageStore.content_filename(str(second), '.webp')
+    assert name != ImageStore.content_filename(str(other), '.webp')
+    assert name == f"img_{file_digest(str(first), 'sha256')[:32]}.webp"
+
+
+def test_shared_image_is_deleted_with_its_last_reference(tmp_path):
+    store = make_store(tmp_path)
+    name = 'img_shared.webp'
+    store_image(store, name)
+    store.add_tea_record(record('1', name))
+    store.add_tea_record(record('2', name))
+    assert store.images.refs(name) == 2
+
+    store.delete_tea_record('1')
+    assert store.images.refs(name) == 1
+    assert os.path.exists(store.images.path(name))
+
+    store.delete_tea_record('2')
+    assert store.images.refs(name) == 0
+    assert not os.path.exists(store.images.path(name))
+    assert os.listdir(os.path.join(store.images_path, 'thumbs')) == []
+
+
+def test_attach_after_record_deleted_removes_unshared_image(tmp_path):
+    store = make_store(tmp_path)
+    store.add_tea_record(record('1'))
+    store.delete_tea_record('1')
+
+    name = 'img_late.webp'
+    store_image(store, name)
+    assert not store.attach_record_image('1', name)
+    assert not os.path.exists(store.images.path(name))
+    assert store.images.verify(store.load_tea_records()) == []
+
+
+def test_attach_after_record_deleted_keeps_shared_image(tmp_path):
+    store = make_store(tmp_path)
+    name = 'img_shared.webp'
+    store_image(store, name)
+    store.add_tea_record(record('keep', name))
+    store.add_tea_record(record('gone'))
+    store.delete_tea_record('gone')
+
+    assert not store.attach_record_image('gone', name)
+    assert os.path.exists(store.images.path(name))
+    assert store.images.refs(name) == 1
+
+
+def test_attach_registers_image_on_saved_record(tmp_path):
+    store = make_store(tmp_path)
+    store.add_tea_record(record('1'))
+    name = 'img_new.webp'
+    store_image(store, name)
+
+    assert store.attach_record_image('1', name)
+    assert store.load_tea_records()[0]['image_filename'] == name
+    assert store.images.refs(name) == 1
+
+
+def test_index_is_built_from_existing_records(tmp_path):
+    store = make_store(tmp_path)
+    legacy = 'tea_image_1.jpg'
+    with open(os.path.join(store.images_path, legacy), 'wb') as f:
+        f.write(b'legacy')
+    store.save_tea_records([record('1', legacy), record('2', legacy)])
+
+    assert store.images.refs(legacy) == 2
+    assert store.images.verify(store.load_tea_records(), full=True) == []
+
+
+def test_verify_reports_problems_and_repair_fixes_them(tmp_path):
+    store = make_store(tmp_path)
+    for name in ('img_ok.webp', 'img_changed.webp', 'img_missing.webp'):
+        store_image(store, name)
+        store.add_tea_record(record(name, name))
+    store_image(store, 'img_orphan.webp')
+    store.images.release('img_orphan.webp')
+    with open(store.images.path('img_stray.webp'), 'wb') as f:
+        f.write(b'stray')
+    with open(store.images.path('img_changed.webp'), 'wb') as f:
+        f.write(b'changed')
+    os.remove(store.images.path('img_missing.webp'))
+    # 茶记文件被直接修改，引用数与索引不一致
+    records = store.load_tea_records() + [record('extra', 'img_ok.webp')]
+    store.save_tea_records(records)
+
+    problems = {(kind, name) for kind, name, _ in store.images.verify(records)}
+    assert problems == {
+        ('refs', 'img_ok.webp'),
+        ('size', 'img_changed.webp'),
+        ('missing', 'img_missing.webp'),
+        ('orphan', 'img_stray.webp'),
+    }
+
+    store.images.rebuild(records)
+    assert store.images.remove_orphans(records) == ['img_stray.webp']
+    remaining = {(kind, name) for kind, name, _ in store.images.verify(records, full=True)}
+    # 文件缺失无法修复，其余问题都已解决
+    assert remaining == {('missing', 'img_missing.webp')}
+    assert store.images.refs('img_ok.webp') == 2
+
+
+def test_full_verify_detects_same_size_corruption(tmp_path):
+    store = make_store(tmp_path)
+    name = 'img_a.webp'
+    store_image(store, name, b'aaaa')
+    store.add_tea_record(record('1', name))
+    with open(store.images.path(name), 'wb') as f:
+        f.write(b'bbbb')
+
+    assert store.images.verify(store.load_tea_records()) == []
+    assert [kind for kind, _, _ in store.images.verify(store.load_tea_records(), full=True)] == ['sha256']